@@ -1,15 +1,25 @@
 import logging
 import time
+from collections import deque
+from collections.abc import Callable
 from functools import partial
 from multiprocessing import Pool
 from multiprocessing import cpu_count
+from multiprocessing.pool import AsyncResult
 
+from term_timer.methods import METHOD_ANALYSERS
 from term_timer.methods import get_method_analyser
 from term_timer.solve import Solve
 from term_timer.stats import StatisticsTools
 
 logger = logging.getLogger(__name__)
 
+CANCEL_POLL = 0.1
+
+
+class AnalysisCancelledError(Exception):
+    pass
+
 
 def analyse_solve_worker(solve, method_name, *, full=False):
     if not solve.advanced:
@@ -19,9 +29,6 @@ def analyse_solve_worker(solve, method_name, *, full=False):
 
     solve.method_name = method_name
 
-    if full:
-        _ = solve.score
-
     analysis = solve.method_applied
 
     steps = {}
@@ -37,6 +44,10 @@ def analyse_solve_worker(solve, method_name, *, full=False):
             'etps': Solve.compute_tps(step['qtm'], step['execution']),
         }
 
+    if full:
+        _ = solve.score
+        solve.release_analysis()
+
     return {
         'steps': steps,
         'score': analysis.score,
@@ -44,11 +55,94 @@ def analyse_solve_worker(solve, method_name, *, full=False):
     }
 
 
+def warm_worker():
+    """
+    Pool initializer, importing this module loads the methods cases
+    in each worker when the pool starts instead of on the first job.
+    """
+    logger.debug('Analysis worker ready: %s', ', '.join(METHOD_ANALYSERS))
+
+
+def analyse_chunk_worker(worker_func, chunk):
+    return [worker_func(solve) for solve in chunk]
+
+
+class AnalysisPool:
+    """
+    Long-lived pool of analysis processes shared by successive jobs.
+
+    Stacks smaller than `in_process_threshold` are analysed in the calling
+    process, where the transfer of the solves would cost more than
+    the analysis itself. Jobs are sent by chunks, so a cancelled job
+    stops after the chunks already running.
+    """
+    chunk_size = 16
+
+    in_process_threshold = 32
+
+    def __init__(self, processes=None):
+        self.processes = processes or max(1, cpu_count() - 1)
+        self.pool = None
+
+    def start(self):
+        if self.pool is None:
+            self.pool = Pool(
+                processes=self.processes,
+                initializer=warm_worker,
+            )
+            logger.info('Analysis pool started: %d workers', self.processes)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
+    def map(self, worker_func: Callable, stack: list,
+            cancelled: Callable[[], bool] | None = None) -> list:
+        if self.pool is None or len(stack) < self.in_process_threshold:
+            results = []
+            for solve in stack:
+                if cancelled and cancelled():
+                    raise AnalysisCancelledError
+                results.append(worker_func(solve))
+            return results
+
+        chunks = deque(
+            stack[i:i + self.chunk_size]
+            for i in range(0, len(stack), self.chunk_size)
+        )
+        pending: deque[AsyncResult] = deque()
+        results = []
+
+        while chunks or pending:
+            while chunks and len(pending) < self.processes * 2:
+                pending.append(
+                    self.pool.apply_async(
+                        analyse_chunk_worker,
+                        (worker_func, chunks.popleft()),
+                    ),
+                )
+
+            job = pending.popleft()
+            while not job.ready():
+                job.wait(CANCEL_POLL)
+                if cancelled and cancelled():
+                    raise AnalysisCancelledError
+
+            results.extend(job.get())
+
+        return results
+
+
 class SolvesMethodAggregator:
 
-    def __init__(self, method_name, stack, *, full=True):
+    def __init__(self, method_name, stack, *, full=True,
+                 pool=None, cancelled=None):
         self.stack = stack
         self.full = full
+        self.pool = pool
+        self.cancelled = cancelled
 
         self.method_name = method_name
         self.analyser = get_method_analyser(self.method_name)
@@ -56,14 +150,21 @@ class SolvesMethodAggregator:
         self.results = self.aggregate()
 
     def collect_analyses(self):
-        num_processes = max(1, cpu_count() - 1)
-
         worker_func = partial(
             analyse_solve_worker,
             method_name=self.method_name,
             full=self.full,
         )
 
+        if self.pool is not None:
+            return self.pool.map(
+                worker_func,
+                [solve.for_method(self.method_name) for solve in self.stack],
+                self.cancelled,
+            )
+
+        num_processes = max(1, cpu_count() - 1)
+
         with Pool(processes=num_processes) as pool:
             return pool.map(worker_func, self.stack)
 
@@ -80,9 +181,10 @@ class SolvesMethodAggregator:
         score = 0
         total = 0
         resume = {}
+        cases = {}
         stack = []
 
-        for analyse in analyses:
+        for position, analyse in enumerate(analyses):
             stack.append(analyse['solve'])
 
             if 'score' not in analyse:
@@ -121,6 +223,14 @@ class SolvesMethodAggregator:
                 resume[step_name][step_case]['tpss'].append(step['tps'])
                 resume[step_name][step_case]['etpss'].append(step['etps'])
 
+                cases.setdefault(
+                    step_name.lower(), {},
+                ).setdefault(
+                    step_case.split(' ')[0].lower(), [],
+                ).append(
+                    position,
+                )
+
         for step_cases in resume.values():
             for info in step_cases.values():
                 count = len(info['times'])
@@ -139,5 +249,17 @@ class SolvesMethodAggregator:
             'total': total,
             'mean': score / total if total else 0,
             'resume': resume,
+            'cases': cases,
             'stack': stack,
         }
+
+    def case_solves(self, step_name: str, case_uid: str) -> list[Solve]:
+        """Solves of the stack where the step was solved with the case."""
+        stack = self.results['stack']
+        positions = self.results['cases'].get(
+            step_name.lower(), {},
+        ).get(
+            case_uid.lower(), [],
+        )
+
+        return [stack[position] for position in positions]
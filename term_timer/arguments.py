@@ -8,6 +8,7 @@ from term_timer.config import SERVER_CONFIG
 from term_timer.config import TIMER_CONFIG
 from term_timer.config import TRAINER_STEP
 from term_timer.constants import CUBE_SIZES
+from term_timer.constants import EXPORT_FORMATS
 
 COMMAND_ALIASES = {
     'solve': ['sw', 't'],
@@ -17,6 +18,8 @@ COMMAND_ALIASES = {
     'cfop': ['op', 'c'],
     'detail': ['dt', 'd'],
     'import': ['im', 'i'],
+    'export': ['ex', 'x'],
+    'rebuild': ['rb', 'b'],
     'serve': ['se', 'h'],
     'train': ['tr', 'w'],
     'edit': ['ed', 'e'],
@@ -468,7 +471,10 @@ def import_arguments(subparsers):
     parser = subparsers.add_parser(
         'import',
         help='Import external solves',
-        description='Import solves recorded in csTimer or Cubeast.',
+        description=(
+            'Import solves recorded in csTimer or Cubeast '
+            'into a session.'
+        ),
         aliases=COMMAND_ALIASES['import'],
     )
     parser.add_argument(
@@ -476,12 +482,79 @@ def import_arguments(subparsers):
         help='Solve file to import',
     )
 
+    session = parser.add_argument_group('Session')
+    session.add_argument(
+        '-c', '--cube',
+        type=int,
+        choices=CUBE_SIZES,
+        default=3,
+        metavar='CUBE',
+        help=(
+            'Set the size of the cube (from 2 to 7).\n'
+            'Default: 3.'
+        ),
+    )
+    session.add_argument(
+        '-u', '--session',
+        default='',
+        metavar='SESSION',
+        help=(
+            'Name of the session to import the solves into.\n'
+            'csTimer backups import each of their sessions\n'
+            'into its own session, prefixed by this name.\n'
+            'Default: the default session, cstimer for csTimer backups.'
+        ),
+    )
+
+    return parser
+
+
+def export_arguments(subparsers):
+    parser = subparsers.add_parser(
+        'export',
+        help='Export solves',
+        description=(
+            'Export recorded solves in csTimer or Cubeast formats.'
+        ),
+        aliases=COMMAND_ALIASES['export'],
+    )
+    parser.add_argument(
+        'destination',
+        help='File to write the solves to, - for the standard output',
+    )
+    parser.add_argument(
+        '-f', '--format',
+        choices=EXPORT_FORMATS,
+        default=EXPORT_FORMATS[0],
+        metavar='FORMAT',
+        help=(
+            'Format of the export '
+            f'({ ", ".join(EXPORT_FORMATS) }).\n'
+            f'Default: { EXPORT_FORMATS[0] }.'
+        ),
+    )
+
+    set_session_arguments(parser)
+
     return parser
 
 
+def rebuild_arguments(subparsers):
+    return subparsers.add_parser(
+        'rebuild',
+        help='Rebuild the sessions manifest',
+        description=(
+            'Rebuild the manifest of the sessions from the session files, '
+            'after editing them by hand.'
+        ),
+        aliases=COMMAND_ALIASES['rebuild'],
+    )
+
+
 def serve_arguments(subparsers):
     domain = SERVER_CONFIG.get('domain', 'localhost')
     port = SERVER_CONFIG.get('port', 8333)
+    threads = SERVER_CONFIG.get('threads', 8)
 
     parser = subparsers.add_parser(
         'serve',
@@ -506,6 +579,16 @@ def serve_arguments(subparsers):
             f'Default: { port }.'
         ),
     )
+    parser.add_argument(
+        '--threads',
+        type=int,
+        default=threads,
+        metavar='THREADS',
+        help=(
+            'Set the number of threads serving the requests.\n'
+            f'Default: { threads }.'
+        ),
+    )
 
     return parser
 
@@ -722,6 +805,8 @@ def get_arguments() -> Any:
     cfop_arguments(subparsers)
     serve_arguments(subparsers)
     import_arguments(subparsers)
+    export_arguments(subparsers)
+    rebuild_arguments(subparsers)
 
     args = parser.parse_args(sys.argv[1:])
 
@@ -2,6 +2,9 @@
 
 DEBOUNCE = 0.5
 
+# Number of driver events kept in memory for debugging
+EVENTS_HISTORY = 512
+
 PREFIX = [
     'GAN',
     'MG',
@@ -1,3 +1,8 @@
+from collections import deque
+
+from term_timer.bluetooth.constants import EVENTS_HISTORY
+
+
 class Driver:
     service_uid = ''
     state_characteristic_uid = ''
@@ -8,7 +13,7 @@ class Driver:
     def __init__(self, client):
         self.client = client
 
-        self.events = []
+        self.events = deque(maxlen=EVENTS_HISTORY)
         self.cypher = self.init_cypher()
 
     def init_cypher(self):
@@ -4,8 +4,6 @@ References :
 """
 import logging
 import time
-from datetime import datetime
-from datetime import timezone
 
 from cubing_algs.facelets import cubies_to_facelets
 
@@ -16,8 +14,15 @@ from term_timer.bluetooth.constants import GAN_GEN2_STATE_CHARACTERISTIC
 from term_timer.bluetooth.constants import MOYU_AI_ENCRYPTION_KEY
 from term_timer.bluetooth.drivers.base import Driver
 from term_timer.bluetooth.encrypter import GanGen2CubeEncrypter
+from term_timer.bluetooth.events import BatteryEvent
+from term_timer.bluetooth.events import DisconnectEvent
+from term_timer.bluetooth.events import FaceletsEvent
+from term_timer.bluetooth.events import GyroEvent
+from term_timer.bluetooth.events import HardwareEvent
+from term_timer.bluetooth.events import MoveEvent
 from term_timer.bluetooth.message import GanProtocolMessage
 from term_timer.bluetooth.salt import get_salt
+from term_timer.constants import SECOND
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +86,7 @@ class GanGen2Driver(Driver):
     async def event_handler(self, sender, data):  # noqa: ARG002
         """Process notifications from the cube"""
         clock = time.perf_counter_ns()
-        timestamp = datetime.now(tz=timezone.utc)  # noqa: UP017
+        timestamp = time.time_ns()
 
         events = []
 
@@ -105,22 +110,20 @@ class GanGen2Driver(Driver):
             vy = msg.get_bit_word(72, 4)
             vz = msg.get_bit_word(76, 4)
 
-            payload = {
-                'event': 'gyro',
-                'clock': clock,
-                'timestamp': timestamp,
-                'quaternion': {
+            payload = GyroEvent(
+                clock, timestamp,
+                quaternion={
                     'x': (1 - (qx >> 15) * 2) * (qx & 0x7FFF) / 0x7FFF,
                     'y': (1 - (qy >> 15) * 2) * (qy & 0x7FFF) / 0x7FFF,
                     'z': (1 - (qz >> 15) * 2) * (qz & 0x7FFF) / 0x7FFF,
                     'w': (1 - (qw >> 15) * 2) * (qw & 0x7FFF) / 0x7FFF,
                 },
-                'velocity': {
+                velocity={
                     'x': (1 - (vx >> 3) * 2) * (vx & 0x7),
                     'y': (1 - (vy >> 3) * 2) * (vy & 0x7),
                     'z': (1 - (vz >> 3) * 2) * (vz & 0x7),
                 },
-            }
+            )
 
             self.add_event(events, payload)
 
@@ -146,22 +149,18 @@ class GanGen2Driver(Driver):
                 if elapsed == 0 and self.last_move_timestamp:
                     elapsed = (
                         timestamp - self.last_move_timestamp
-                    ).total_seconds()
+                    ) / SECOND
 
                 self.cube_timestamp += elapsed
-                payload = {
-                    'event': 'move',
-                    'clock': clock,
-                    'timestamp': timestamp,
-                    'serial': (serial - i) & 0xFF,
-                    # Missed and recovered events
-                    # has no meaningful local timestamps
-                    'local_timestamp': timestamp if i == 0 else None,
-                    'cube_timestamp': self.cube_timestamp,
-                    'face': face,
-                    'direction': direction,
-                    'move': move.strip(),
-                }
+                payload = MoveEvent(
+                    clock, timestamp,
+                    serial=(serial - i) & 0xFF,
+                    local_timestamp=timestamp if i == 0 else None,
+                    cube_timestamp=self.cube_timestamp,
+                    face=face,
+                    direction=direction,
+                    move=move.strip(),
+                )
                 self.add_event(events, payload)
 
             self.last_move_timestamp = timestamp
@@ -190,19 +189,17 @@ class GanGen2Driver(Driver):
             ep.append(66 - sum(ep))
             eo.append((2 - (sum(eo) % 2)) % 2)
 
-            payload = {
-                'event': 'facelets',
-                'clock': clock,
-                'timestamp': timestamp,
-                'serial': serial,
-                'facelets': cubies_to_facelets(cp, co, ep, eo),
-                'state': {
+            payload = FaceletsEvent(
+                clock, timestamp,
+                serial=serial,
+                facelets=cubies_to_facelets(cp, co, ep, eo),
+                state={
                     'CP': cp,
                     'CO': co,
                     'EP': ep,
                     'EO': eo,
                 },
-            }
+            )
             self.add_event(events, payload)
 
         elif event == 0x05:  # Hardware
@@ -216,34 +213,26 @@ class GanGen2Driver(Driver):
             for i in range(8):
                 hardware_name += chr(msg.get_bit_word(i * 8 + 40, 8))
 
-            payload = {
-                'event': 'hardware',
-                'clock': clock,
-                'timestamp': timestamp,
-                'hardware_name': hardware_name,
-                'hardware_version': f'{ hw_major }.{ hw_minor }',
-                'software_version': f'{ sw_major }.{ sw_minor }',
-                'gyroscope_supported': bool(gyro_supported),
-            }
+            payload = HardwareEvent(
+                clock, timestamp,
+                hardware_name=hardware_name,
+                hardware_version=f'{ hw_major }.{ hw_minor }',
+                software_version=f'{ sw_major }.{ sw_minor }',
+                gyroscope_supported=bool(gyro_supported),
+            )
             self.add_event(events, payload)
 
         elif event == 0x09:  # Battery
             battery_level = msg.get_bit_word(8, 8)
 
-            payload = {
-                'event': 'battery',
-                'clock': clock,
-                'timestamp': timestamp,
-                'level': min(battery_level, 100),
-            }
+            payload = BatteryEvent(
+                clock, timestamp,
+                level=min(battery_level, 100),
+            )
             self.add_event(events, payload)
 
         elif event == 0x0D:  # Disconnect
-            payload = {
-                'event': 'disconnect',
-                'clock': clock,
-                'timestamp': timestamp,
-            }
+            payload = DisconnectEvent(clock, timestamp)
             self.add_event(events, payload)
 
             await self.client.disconnect()
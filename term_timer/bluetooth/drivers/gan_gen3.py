@@ -4,8 +4,6 @@ References :
 """
 import logging
 import time
-from datetime import datetime
-from datetime import timezone
 
 from cubing_algs.facelets import cubies_to_facelets
 
@@ -14,7 +12,13 @@ from term_timer.bluetooth.constants import GAN_GEN3_COMMAND_CHARACTERISTIC
 from term_timer.bluetooth.constants import GAN_GEN3_SERVICE
 from term_timer.bluetooth.constants import GAN_GEN3_STATE_CHARACTERISTIC
 from term_timer.bluetooth.drivers.gan_gen2 import GanGen2Driver
+from term_timer.bluetooth.events import BatteryEvent
+from term_timer.bluetooth.events import DisconnectEvent
+from term_timer.bluetooth.events import FaceletsEvent
+from term_timer.bluetooth.events import HardwareEvent
+from term_timer.bluetooth.events import MoveEvent
 from term_timer.bluetooth.message import GanProtocolMessage
+from term_timer.constants import SECOND
 
 logger = logging.getLogger(__name__)
 
@@ -95,13 +99,13 @@ class GanGen3Driver(GanGen2Driver):
         while len(self.move_buffer) > 0:
             buffer_head = self.move_buffer[0]
             diff = 1 if self.last_serial == -1 else (
-                buffer_head['serial'] - self.last_serial) & 0xFF
+                buffer_head.serial - self.last_serial) & 0xFF
             if diff > 1:
-                await self.request_move_history(buffer_head['serial'], diff)
+                await self.request_move_history(buffer_head.serial, diff)
                 break
 
             evicted_events.append(self.move_buffer.pop(0))
-            self.last_serial = buffer_head['serial']
+            self.last_serial = buffer_head.serial
 
         if len(self.move_buffer) > 16:
             self.client.disconnect()
@@ -120,23 +124,22 @@ class GanGen3Driver(GanGen2Driver):
         if len(self.move_buffer) > 0:
             buffer_head = self.move_buffer[0]
 
-            if any(e['event'] == 'move' and e['serial'] == move['serial']
-                   for e in self.move_buffer):
+            if any(e.serial == move.serial for e in self.move_buffer):
                 return
 
             if not self.is_serial_in_range(
                     self.last_serial,
-                    buffer_head['serial'],
-                    move['serial'],
+                    buffer_head.serial,
+                    move.serial,
             ):
                 return
 
-            if move['serial'] == ((buffer_head['serial'] - 1) & 0xFF):
+            if move.serial == ((buffer_head.serial - 1) & 0xFF):
                 self.move_buffer.insert(0, move)
         elif self.is_serial_in_range(
                 self.last_serial,
                 self.serial,
-                move['serial'],
+                move.serial,
                 closed_start=False,
                 closed_end=True,
         ):
@@ -147,7 +150,7 @@ class GanGen3Driver(GanGen2Driver):
 
         if diff > 0 and self.serial != 0:
             buffer_head = self.move_buffer[0] if self.move_buffer else None
-            start_serial = buffer_head['serial'] if buffer_head else (
+            start_serial = buffer_head.serial if buffer_head else (
                 self.serial + 1
             ) & 0xFF
             await self.request_move_history(start_serial, diff + 1)
@@ -155,7 +158,7 @@ class GanGen3Driver(GanGen2Driver):
     async def event_handler(self, sender, data):  # noqa: ARG002
         """Process notifications from the cube"""
         clock = time.perf_counter_ns()
-        timestamp = datetime.now(tz=timezone.utc)  # noqa: UP017
+        timestamp = time.time_ns()
 
         events = []
 
@@ -184,17 +187,15 @@ class GanGen3Driver(GanGen2Driver):
             # Put move event into FIFO buffer
             if face >= 0:
                 self.move_buffer.append(
-                    {
-                        'event': 'move',
-                        'clock': clock,
-                        'timestamp': timestamp,
-                        'serial': serial,
-                        'local_timestamp': timestamp,
-                        'cube_timestamp': cube_timestamp,
-                        'face': face,
-                        'direction': direction,
-                        'move': move.strip(),
-                    },
+                    MoveEvent(
+                        clock, timestamp,
+                        serial=serial,
+                        local_timestamp=timestamp,
+                        cube_timestamp=cube_timestamp,
+                        face=face,
+                        direction=direction,
+                        move=move.strip(),
+                    ),
                 )
             self.add_event(events, await self.evict_move_buffer())
 
@@ -210,7 +211,7 @@ class GanGen3Driver(GanGen2Driver):
                         self.last_local_timestamp is not None
                         and (
                             timestamp - self.last_local_timestamp
-                        ).total_seconds() > DEBOUNCE
+                        ) > DEBOUNCE * SECOND
                 ):
                     await self.check_if_move_missed()
             else:
@@ -234,19 +235,17 @@ class GanGen3Driver(GanGen2Driver):
             ep.append(66 - sum(ep))
             eo.append((2 - (sum(eo) % 2)) % 2)
 
-            payload = {
-                'event': 'facelets',
-                'clock': clock,
-                'timestamp': timestamp,
-                'serial': serial,
-                'facelets': cubies_to_facelets(cp, co, ep, eo),
-                'state': {
+            payload = FaceletsEvent(
+                clock, timestamp,
+                serial=serial,
+                facelets=cubies_to_facelets(cp, co, ep, eo),
+                state={
                     'CP': cp,
                     'CO': co,
                     'EP': ep,
                     'EO': eo,
                 },
-            }
+            )
             self.add_event(events, payload)
 
         elif event == 0x06:  # Move history
@@ -261,22 +260,18 @@ class GanGen3Driver(GanGen2Driver):
                     move = 'URFDLB'[face] + " '"[direction]
 
                     self.inject_missed_move_to_buffer(
-                        {
-                            'event': 'move',
-                            'clock': clock,
-                            'timestamp': timestamp,
-                            'serial': (start_serial - i) & 0xFF,
-                            # Missed and recovered events
-                            # has no meaningful local timestamps
-                            'local_timestamp': None,
+                        MoveEvent(
+                            clock, timestamp,
+                            serial=(start_serial - i) & 0xFF,
+                            local_timestamp=None,
                             # Cube hardware timestamp for missed move
                             # you should interpolate using
                             # cubeTimestampLinearFit
-                            'cube_timestamp': None,
-                            'face': face,
-                            'direction': direction,
-                            'move': move.strip(),
-                        },
+                            cube_timestamp=None,
+                            face=face,
+                            direction=direction,
+                            move=move.strip(),
+                        ),
                     )
 
             self.add_event(events, await self.evict_move_buffer())
@@ -291,34 +286,26 @@ class GanGen3Driver(GanGen2Driver):
             for i in range(5):
                 hardware_name += chr(msg.get_bit_word(i * 8 + 32, 8))
 
-            payload = {
-                'event': 'hardware',
-                'clock': clock,
-                'timestamp': timestamp,
-                'hardware_name': hardware_name,
-                'hardware_version': f'{ hw_major }.{ hw_minor }',
-                'software_version': f'{ sw_major }.{ sw_minor }',
-                'gyroscope_supported': False,
-            }
+            payload = HardwareEvent(
+                clock, timestamp,
+                hardware_name=hardware_name,
+                hardware_version=f'{ hw_major }.{ hw_minor }',
+                software_version=f'{ sw_major }.{ sw_minor }',
+                gyroscope_supported=False,
+            )
             self.add_event(events, payload)
 
         elif event == 0x10:  # Battery
             battery_level = msg.get_bit_word(24, 8)
 
-            payload = {
-                'event': 'battery',
-                'clock': clock,
-                'timestamp': timestamp,
-                'level': min(battery_level, 100),
-            }
+            payload = BatteryEvent(
+                clock, timestamp,
+                level=min(battery_level, 100),
+            )
             self.add_event(events, payload)
 
         elif event == 0x11:  # Disconnect
-            payload = {
-                'event': 'disconnect',
-                'clock': clock,
-                'timestamp': timestamp,
-            }
+            payload = DisconnectEvent(clock, timestamp)
             self.add_event(events, payload)
 
             await self.client.disconnect()
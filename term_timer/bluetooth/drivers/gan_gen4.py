@@ -4,8 +4,6 @@ References :
 """
 import logging
 import time
-from datetime import datetime
-from datetime import timezone
 
 from cubing_algs.facelets import cubies_to_facelets
 
@@ -14,7 +12,14 @@ from term_timer.bluetooth.constants import GAN_GEN4_COMMAND_CHARACTERISTIC
 from term_timer.bluetooth.constants import GAN_GEN4_SERVICE
 from term_timer.bluetooth.constants import GAN_GEN4_STATE_CHARACTERISTIC
 from term_timer.bluetooth.drivers.gan_gen3 import GanGen3Driver
+from term_timer.bluetooth.events import BatteryEvent
+from term_timer.bluetooth.events import DisconnectEvent
+from term_timer.bluetooth.events import FaceletsEvent
+from term_timer.bluetooth.events import GyroEvent
+from term_timer.bluetooth.events import HardwareEvent
+from term_timer.bluetooth.events import MoveEvent
 from term_timer.bluetooth.message import GanProtocolMessage
+from term_timer.constants import SECOND
 
 logger = logging.getLogger(__name__)
 
@@ -89,7 +94,7 @@ class GanGen4Driver(GanGen3Driver):
     async def event_handler(self, sender, data):  # noqa: ARG002
         """Process notifications from the cube"""
         clock = time.perf_counter_ns()
-        timestamp = datetime.now(tz=timezone.utc)  # noqa: UP017
+        timestamp = time.time_ns()
 
         events = []
 
@@ -114,17 +119,15 @@ class GanGen4Driver(GanGen3Driver):
             # Put move event into FIFO buffer
             if face >= 0:
                 self.move_buffer.append(
-                    {
-                        'event': 'move',
-                        'clock': clock,
-                        'timestamp': timestamp,
-                        'serial': serial,
-                        'local_timestamp': timestamp,
-                        'cube_timestamp': cube_timestamp,
-                        'face': face,
-                        'direction': direction,
-                        'move': move.strip(),
-                    },
+                    MoveEvent(
+                        clock, timestamp,
+                        serial=serial,
+                        local_timestamp=timestamp,
+                        cube_timestamp=cube_timestamp,
+                        face=face,
+                        direction=direction,
+                        move=move.strip(),
+                    ),
                 )
             self.add_event(events, await self.evict_move_buffer())
 
@@ -140,7 +143,7 @@ class GanGen4Driver(GanGen3Driver):
                         self.last_local_timestamp is not None
                         and (
                             timestamp - self.last_local_timestamp
-                        ).total_seconds() > DEBOUNCE
+                        ) > DEBOUNCE * SECOND
                 ):
                     await self.check_if_move_missed()
             else:
@@ -164,19 +167,17 @@ class GanGen4Driver(GanGen3Driver):
             ep.append(66 - sum(ep))
             eo.append((2 - (sum(eo) % 2)) % 2)
 
-            payload = {
-                'event': 'facelets',
-                'clock': clock,
-                'timestamp': timestamp,
-                'serial': serial,
-                'facelets': cubies_to_facelets(cp, co, ep, eo),
-                'state': {
+            payload = FaceletsEvent(
+                clock, timestamp,
+                serial=serial,
+                facelets=cubies_to_facelets(cp, co, ep, eo),
+                state={
                     'CP': cp,
                     'CO': co,
                     'EP': ep,
                     'EO': eo,
                 },
-            }
+            )
             self.add_event(events, payload)
 
         elif event == 0xD1:  # Move history
@@ -191,22 +192,18 @@ class GanGen4Driver(GanGen3Driver):
                     move = 'URFDLB'[face] + " '"[direction]
 
                     self.inject_missed_move_to_buffer(
-                        {
-                            'event': 'move',
-                            'clock': clock,
-                            'timestamp': timestamp,
-                            'serial': (start_serial - i) & 0xFF,
-                            # Missed and recovered events
-                            # has no meaningful local timestamps
-                            'local_timestamp': None,
+                        MoveEvent(
+                            clock, timestamp,
+                            serial=(start_serial - i) & 0xFF,
+                            local_timestamp=None,
                             # Cube hardware timestamp for missed move
                             # you should interpolate using
                             # cubeTimestampLinearFit
-                            'cube_timestamp': None,
-                            'face': face,
-                            'direction': direction,
-                            'move': move.strip(),
-                        },
+                            cube_timestamp=None,
+                            face=face,
+                            direction=direction,
+                            move=move.strip(),
+                        ),
                     )
 
             self.add_event(events, await self.evict_move_buffer())
@@ -217,44 +214,38 @@ class GanGen4Driver(GanGen3Driver):
                 month = msg.get_bit_word(40, 8)
                 day = msg.get_bit_word(48, 8)
 
-                payload = {
-                    'event': 'hardware',
-                    'clock': clock,
-                    'timestamp': timestamp,
-                    'product_date': f'{ year:04d}-{ month:02d}-{ day:02d}',
-                }
+                payload = HardwareEvent(
+                    clock, timestamp,
+                    product_date=f'{ year:04d}-{ month:02d}-{ day:02d}',
+                )
                 self.add_event(events, payload)
             elif event == 0xFC:  # Hardware name
                 hardware_name = ''
                 for i in range(data_size):
                     hardware_name += chr(msg.get_bit_word(i * 8 + 24, 8))
-                payload = {
-                    'event': 'hardware',
-                    'clock': clock,
-                    'timestamp': timestamp,
-                    'hardware_name': hardware_name,
-                    'gyroscope_supported': 'GAN12uiM' in hardware_name,
-                }
+                payload = HardwareEvent(
+                    clock, timestamp,
+                    hardware_name=hardware_name,
+                    gyroscope_supported='GAN12uiM' in hardware_name,
+                )
                 self.add_event(events, payload)
             elif event == 0xFD:  # Software version
                 sw_major = msg.get_bit_word(24, 4)
                 sw_minor = msg.get_bit_word(28, 4)
 
-                payload = {
-                    'event': 'hardware',
-                    'clock': clock,
-                    'software_version': f'{ sw_major }.{ sw_minor }',
-                }
+                payload = HardwareEvent(
+                    clock, timestamp,
+                    software_version=f'{ sw_major }.{ sw_minor }',
+                )
                 self.add_event(events, payload)
             elif event == 0xFE:  # Hardware version
                 hw_major = msg.get_bit_word(24, 4)
                 hw_minor = msg.get_bit_word(28, 4)
 
-                payload = {
-                    'event': 'hardware',
-                    'clock': clock,
-                    'hardware_version': f'{ hw_major }.{ hw_minor }',
-                }
+                payload = HardwareEvent(
+                    clock, timestamp,
+                    hardware_version=f'{ hw_major }.{ hw_minor }',
+                )
                 self.add_event(events, payload)
 
         elif event == 0xEC:  # Gyroscope
@@ -271,42 +262,34 @@ class GanGen4Driver(GanGen3Driver):
             vy = msg.get_bit_word(84, 4)
             vz = msg.get_bit_word(88, 4)
 
-            payload = {
-                'event': 'gyro',
-                'clock': clock,
-                'timestamp': timestamp,
-                'quaternion': {
+            payload = GyroEvent(
+                clock, timestamp,
+                quaternion={
                     'x': (1 - (qx >> 15) * 2) * (qx & 0x7FFF) / 0x7FFF,
                     'y': (1 - (qy >> 15) * 2) * (qy & 0x7FFF) / 0x7FFF,
                     'z': (1 - (qz >> 15) * 2) * (qz & 0x7FFF) / 0x7FFF,
                     'w': (1 - (qw >> 15) * 2) * (qw & 0x7FFF) / 0x7FFF,
                 },
-                'velocity': {
+                velocity={
                     'x': (1 - (vx >> 3) * 2) * (vx & 0x7),
                     'y': (1 - (vy >> 3) * 2) * (vy & 0x7),
                     'z': (1 - (vz >> 3) * 2) * (vz & 0x7),
                 },
-            }
+            )
 
             self.add_event(events, payload)
 
         elif event == 0xEF:  # Battery
             battery_level = msg.get_bit_word(8 + data_size * 8, 8)
 
-            payload = {
-                'event': 'battery',
-                'clock': clock,
-                'timestamp': timestamp,
-                'level': min(battery_level, 100),
-            }
+            payload = BatteryEvent(
+                clock, timestamp,
+                level=min(battery_level, 100),
+            )
             self.add_event(events, payload)
 
         elif event == 0xEA:  # Disconnect
-            payload = {
-                'event': 'disconnect',
-                'clock': clock,
-                'timestamp': timestamp,
-            }
+            payload = DisconnectEvent(clock, timestamp)
             self.add_event(events, payload)
 
             await self.client.disconnect()
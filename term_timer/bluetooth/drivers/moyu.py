@@ -4,8 +4,6 @@ References :
 """
 import logging
 import time
-from datetime import datetime
-from datetime import timezone
 
 from term_timer.bluetooth.constants import MOYU_WEILONG_COMMAND_CHARACTERISTIC
 from term_timer.bluetooth.constants import MOYU_WEILONG_ENCRYPTION_KEY
@@ -13,8 +11,15 @@ from term_timer.bluetooth.constants import MOYU_WEILONG_SERVICE
 from term_timer.bluetooth.constants import MOYU_WEILONG_STATE_CHARACTERISTIC
 from term_timer.bluetooth.drivers.base import Driver
 from term_timer.bluetooth.encrypter import GanGen2CubeEncrypter
+from term_timer.bluetooth.events import BatteryEvent
+from term_timer.bluetooth.events import FaceletsEvent
+from term_timer.bluetooth.events import GyroConfigEvent
+from term_timer.bluetooth.events import GyroEvent
+from term_timer.bluetooth.events import HardwareEvent
+from term_timer.bluetooth.events import MoveEvent
 from term_timer.bluetooth.message import GanProtocolMessage
 from term_timer.bluetooth.salt import get_salt
+from term_timer.constants import SECOND
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +78,7 @@ class MoyuWeilong10Driver(Driver):
     async def event_handler(self, sender, data):  # noqa: ARG002
         """Process notifications from the cube"""
         clock = time.perf_counter_ns()
-        timestamp = datetime.now(tz=timezone.utc)  # noqa: UP017
+        timestamp = time.time_ns()
 
         events = []
 
@@ -92,17 +97,15 @@ class MoyuWeilong10Driver(Driver):
             qy = msg.get_bit_word(72, 32, little_endian=True, signed=True)
             qz = msg.get_bit_word(104, 32, little_endian=True, signed=True)
 
-            payload = {
-                'event': 'gyro',
-                'clock': clock,
-                'timestamp': timestamp,
-                'quaternion': {
+            payload = GyroEvent(
+                clock, timestamp,
+                quaternion={
                     'x': qx / self.factor,
                     'y': qy / self.factor,
                     'z': qz / self.factor,
                     'w': qw / self.factor,
                 },
-            }
+            )
 
             self.add_event(events, payload)
 
@@ -124,25 +127,21 @@ class MoyuWeilong10Driver(Driver):
                 elapsed = msg.get_bit_word(8 + i * 16, 16)
 
                 # In case of 16-bit cube timestamp register overflow
-                if elapsed == 0:
+                if elapsed == 0 and self.last_move_timestamp:
                     elapsed = (
                         timestamp - self.last_move_timestamp
-                    ).total_seconds()
+                    ) / SECOND
 
                 self.cube_timestamp += elapsed
-                payload = {
-                    'event': 'move',
-                    'clock': clock,
-                    'timestamp': timestamp,
-                    'serial': (serial - i) & 0xFF,
-                    # Missed and recovered events
-                    # has no meaningful local timestamps
-                    'local_timestamp': timestamp if i == 0 else None,
-                    'cube_timestamp': self.cube_timestamp,
-                    'face': move_value,
-                    'direction': move_value,
-                    'move': move.strip(),
-                }
+                payload = MoveEvent(
+                    clock, timestamp,
+                    serial=(serial - i) & 0xFF,
+                    local_timestamp=timestamp if i == 0 else None,
+                    cube_timestamp=self.cube_timestamp,
+                    face=move_value,
+                    direction=move_value,
+                    move=move.strip(),
+                )
                 self.add_event(events, payload)
 
             self.last_move_timestamp = timestamp
@@ -163,13 +162,11 @@ class MoyuWeilong10Driver(Driver):
                     if j == 3:
                         state.append('FBUDLR'[faces[i]])
 
-            payload = {
-                'event': 'facelets',
-                'clock': clock,
-                'timestamp': timestamp,
-                'serial': serial,
-                'facelets': ''.join(state),
-            }
+            payload = FaceletsEvent(
+                clock, timestamp,
+                serial=serial,
+                facelets=''.join(state),
+            )
             self.add_event(events, payload)
 
         elif event == 0xA1:  # Hardware
@@ -185,49 +182,39 @@ class MoyuWeilong10Driver(Driver):
             for i in range(8):
                 hardware_name += chr(msg.get_bit_word(i * 8 + 8, 8))
 
-            payload = {
-                'event': 'hardware',
-                'clock': clock,
-                'timestamp': timestamp,
-                'hardware_name': hardware_name,
-                'hardware_version': f'{ hw_major }.{ hw_minor }',
-                'software_version': f'{ sw_major }.{ sw_minor }',
-                'gyroscope_enabled': bool(gyro_enabled),
-                'gyroscope_support': bool(gyro_supported),
-                'gyroscope_supported': (
+            payload = HardwareEvent(
+                clock, timestamp,
+                hardware_name=hardware_name,
+                hardware_version=f'{ hw_major }.{ hw_minor }',
+                software_version=f'{ sw_major }.{ sw_minor }',
+                gyroscope_enabled=bool(gyro_enabled),
+                gyroscope_support=bool(gyro_supported),
+                gyroscope_supported=(
                     bool(gyro_supported)
                     and bool(gyro_enabled)
                 ),
-                'serial': serial,
-            }
+                serial=serial,
+            )
             self.add_event(events, payload)
 
         elif event == 0xAC:  # Gyro config
             gyro_enabled = msg.get_bit_word(16, 8)
             gyro_supported = msg.get_bit_word(8, 8)
 
-            payload = {
-                'event': 'gyro-config',
-                'clock': clock,
-                'timestamp': timestamp,
-                'gyroscope_enabled': bool(gyro_enabled),
-                'gyroscope_support': bool(gyro_supported),
-                'gyroscope_supported': (
-                    bool(gyro_supported)
-                    and bool(gyro_enabled)
-                ),
-            }
+            payload = GyroConfigEvent(
+                clock, timestamp,
+                gyroscope_enabled=bool(gyro_enabled),
+                gyroscope_support=bool(gyro_supported),
+            )
             self.add_event(events, payload)
 
         elif event == 0xA4:  # Battery
             battery_level = msg.get_bit_word(8, 8)
 
-            payload = {
-                'event': 'battery',
-                'clock': clock,
-                'timestamp': timestamp,
-                'level': min(battery_level, 100),
-            }
+            payload = BatteryEvent(
+                clock, timestamp,
+                level=min(battery_level, 100),
+            )
             self.add_event(events, payload)
 
         else:
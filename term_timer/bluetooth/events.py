@@ -0,0 +1,178 @@
+class Event:
+    """
+    Base of the events emitted by the Bluetooth drivers.
+
+    `clock` is the `perf_counter_ns` value and `timestamp` the epoch
+    time in nanoseconds, both taken once per notification.
+    """
+    __slots__ = ('clock', 'timestamp')
+
+    name = ''
+    fields: tuple[str, ...] = ('clock', 'timestamp')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.fields = (*cls.fields, *cls.__slots__)
+
+    def __init__(self, clock: int, timestamp: int | None = None):
+        self.clock = clock
+        self.timestamp = timestamp
+
+    def as_dict(self) -> dict:
+        return {
+            'event': self.name,
+            **{field: getattr(self, field) for field in self.fields},
+        }
+
+    def __repr__(self) -> str:
+        values = ', '.join(
+            f'{ field }={ getattr(self, field)!r}'
+            for field in self.fields
+        )
+        return f'{ self.__class__.__name__ }({ values })'
+
+
+class MoveEvent(Event):
+    __slots__ = (
+        'cube_timestamp',
+        'direction',
+        'face',
+        'local_timestamp',
+        'move',
+        'serial',
+    )
+
+    name = 'move'
+
+    def __init__(self, clock: int, timestamp: int,
+                 *,
+                 serial: int,
+                 local_timestamp: int | None,
+                 cube_timestamp: int | float | None,
+                 face: int,
+                 direction: int,
+                 move: str):
+        super().__init__(clock, timestamp)
+
+        self.serial = serial
+        # Missed and recovered events
+        # has no meaningful local timestamps
+        self.local_timestamp = local_timestamp
+        self.cube_timestamp = cube_timestamp
+        self.face = face
+        self.direction = direction
+        self.move = move
+
+
+class FaceletsEvent(Event):
+    __slots__ = ('facelets', 'serial', 'state')
+
+    name = 'facelets'
+
+    def __init__(self, clock: int, timestamp: int,
+                 *,
+                 serial: int,
+                 facelets: str,
+                 state: dict[str, list[int]] | None = None):
+        super().__init__(clock, timestamp)
+
+        self.serial = serial
+        self.facelets = facelets
+        self.state = state
+
+
+class GyroEvent(Event):
+    __slots__ = ('quaternion', 'velocity')
+
+    name = 'gyro'
+
+    def __init__(self, clock: int, timestamp: int,
+                 *,
+                 quaternion: dict[str, float],
+                 velocity: dict[str, int] | None = None):
+        super().__init__(clock, timestamp)
+
+        self.quaternion = quaternion
+        self.velocity = velocity
+
+
+class GyroConfigEvent(Event):
+    __slots__ = (
+        'gyroscope_enabled',
+        'gyroscope_support',
+        'gyroscope_supported',
+    )
+
+    name = 'gyro-config'
+
+    def __init__(self, clock: int, timestamp: int,
+                 *,
+                 gyroscope_enabled: bool,
+                 gyroscope_support: bool):
+        super().__init__(clock, timestamp)
+
+        self.gyroscope_enabled = gyroscope_enabled
+        self.gyroscope_support = gyroscope_support
+        self.gyroscope_supported = gyroscope_support and gyroscope_enabled
+
+
+class HardwareEvent(Event):
+    __slots__ = (
+        'gyroscope_enabled',
+        'gyroscope_support',
+        'gyroscope_supported',
+        'hardware_name',
+        'hardware_version',
+        'product_date',
+        'serial',
+        'software_version',
+    )
+
+    name = 'hardware'
+
+    def __init__(self, clock: int, timestamp: int | None = None,
+                 *,
+                 hardware_name: str | None = None,
+                 hardware_version: str | None = None,
+                 software_version: str | None = None,
+                 product_date: str | None = None,
+                 gyroscope_enabled: bool | None = None,
+                 gyroscope_support: bool | None = None,
+                 gyroscope_supported: bool | None = None,
+                 serial: int | None = None):
+        super().__init__(clock, timestamp)
+
+        self.hardware_name = hardware_name
+        self.hardware_version = hardware_version
+        self.software_version = software_version
+        self.product_date = product_date
+        self.gyroscope_enabled = gyroscope_enabled
+        self.gyroscope_support = gyroscope_support
+        self.gyroscope_supported = gyroscope_supported
+        self.serial = serial
+
+    @property
+    def infos(self) -> dict:
+        """Hardware values actually reported by this notification."""
+        return {
+            field: getattr(self, field)
+            for field in self.__slots__
+            if getattr(self, field) is not None
+        }
+
+
+class BatteryEvent(Event):
+    __slots__ = ('level',)
+
+    name = 'battery'
+
+    def __init__(self, clock: int, timestamp: int, *, level: int):
+        super().__init__(clock, timestamp)
+
+        self.level = level
+
+
+class DisconnectEvent(Event):
+    __slots__ = ()
+
+    name = 'disconnect'
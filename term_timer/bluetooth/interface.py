@@ -96,7 +96,7 @@ class BluetoothInterface:
     async def notification_handler(self, sender, data) -> None:
         events = await self.driver.event_handler(sender, data)
         for event in events:
-            logger.debug('Event: %s', event['event'].upper())
+            logger.debug('Event: %s', event.name.upper())
         await self.queue.put(events)
 
     async def send_command(self, command: str) -> bool:
@@ -5,6 +5,7 @@ from typing import Any
 from cubing_algs.parsing import parse_moves
 
 from term_timer.constants import CONFIG_FILE
+from term_timer.constants import SAVE_GESTURES
 
 if find_spec('tomllib') is not None:
     import tomllib
@@ -34,8 +35,20 @@ recognition_graph = true
 [bluetooth]
 address = ""
 
+[bluetooth.gestures]
+F = ""
+R = ""
+U = ""
+B = ""
+L = ""
+M = "z"
+S = "z"
+E = "z"
+D = "q"
+
 [statistics]
 distribution = 0
+sketch = false
 metrics = ["htm", "qtm", "stm"]
 
 [server]
@@ -88,4 +101,9 @@ LL_ORIENTATION = parse_moves(
 
 TRAINER_STEP = TRAINER_CONFIG.get('step')
 
+GESTURES_BINDINGS = {
+    **SAVE_GESTURES,
+    **BLUETOOTH_CONFIG.get('gestures', {}),
+}
+
 DEBUG = bool(os.getenv('TERM_TIMER_DEBUG', None))
@@ -14,6 +14,8 @@ CONFIG_FILE = Path('~/.term_timer').expanduser()
 
 TEMPLATES_DIRECTORY = Path(__file__).parent / 'server' / 'templates'
 
+TEMPLATES_CACHE_DIRECTORY = Path.home() / '.cache' / 'term_timer' / 'templates'
+
 STATIC_DIRECTORY = Path(__file__).parent / 'server' / 'static'
 
 DNF = 'DNF'
@@ -22,10 +24,24 @@ PLUS_TWO = '+2'
 
 CUBE_SIZES = list(range(2, 8))
 
+EXPORT_FORMATS = ('cstimer-json', 'cstimer-csv', 'cubeast-csv')
+
 SECOND_BINS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
 
 REFRESH = 0.01
 
 RESLICE_THRESHOLD = 50
 
+SAVE_GESTURES = {
+    'F': '',
+    'R': '',
+    'U': '',
+    'B': '',
+    'L': '',
+    'M': 'z',
+    'S': 'z',
+    'E': 'z',
+    'D': 'q',
+}
+
 ESCAPE_CHAR = '\x1b'
@@ -0,0 +1,62 @@
+from functools import cache
+from operator import itemgetter
+
+from cubing_algs.vcube import VCube
+
+from term_timer.methods.base import FULL_CUBE
+from term_timer.methods.base import INITIAL
+from term_timer.methods.base import get_step_config
+
+LABELS = ''.join(chr(48 + i) for i in range(54))
+
+
+@cache
+def move_permutation(move: str) -> itemgetter:
+    """
+    Facelet permutation of a move, computed once by tracking
+    labelled facelets through a virtual cube.
+    """
+    cube = VCube()
+    cube._state = LABELS  # noqa: SLF001
+    labels = cube.rotate_move(move)
+
+    return itemgetter(*[ord(label) - 48 for label in labels])
+
+
+@cache
+def step_matcher(step: str) -> tuple[itemgetter, tuple[str, ...]]:
+    mask = get_step_config(step, 'mask') or FULL_CUBE
+
+    getter = itemgetter(*[i for i, value in enumerate(mask) if value == '1'])
+
+    return getter, getter(INITIAL)
+
+
+class CubeState:
+    """
+    Lightweight facelets tracker for the smart cube moves.
+
+    Each move is a precomputed permutation of the 54 facelets,
+    and step predicates are cached until the next move.
+    """
+
+    def __init__(self, facelets: str = INITIAL):
+        self.state = VCube(facelets).state
+        self.steps_solved: dict[str, bool] = {}
+
+    def rotate(self, move: str) -> str:
+        self.state = ''.join(move_permutation(move)(self.state))
+        self.steps_solved.clear()
+
+        return self.state
+
+    @property
+    def is_solved(self) -> bool:
+        return self.state == INITIAL
+
+    def is_step_solved(self, step: str) -> bool:
+        if step not in self.steps_solved:
+            getter, expected = step_matcher(step)
+            self.steps_solved[step] = getter(self.state) == expected
+
+        return self.steps_solved[step]
@@ -0,0 +1,309 @@
+import csv
+import heapq
+import json
+import operator
+import re
+import sys
+import time
+from collections.abc import Iterable
+from collections.abc import Iterator
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import TextIO
+
+from term_timer.constants import DNF
+from term_timer.constants import MS_TO_NS_FACTOR
+from term_timer.constants import PLUS_TWO
+from term_timer.constants import SECOND
+from term_timer.importers import CSTIMER_CSV_HEADER
+from term_timer.importers import CSTIMER_CUBES
+from term_timer.importers import CUBEAST_COLUMNS
+from term_timer.in_out import iter_records
+from term_timer.in_out import load_manifest
+from term_timer.in_out import select_sessions
+from term_timer.in_out import session_path
+from term_timer.interface.console import console
+
+CSTIMER_SCRAMBLE_TYPES = {
+    cube: scramble_type
+    for scramble_type, cube in CSTIMER_CUBES.items()
+    if scramble_type
+}
+
+CSTIMER_PENALTIES = {DNF: -1, PLUS_TWO: 2000}
+
+TIMED_MOVE = re.compile(r'@(\d+)')
+
+
+def local_date(date: int) -> str:
+    return datetime.fromtimestamp(date).isoformat(' ')  # noqa: DTZ006
+
+
+def utc_date(date: int) -> str:
+    return datetime.fromtimestamp(
+        date, tz=timezone.utc,  # noqa: UP017
+    ).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def cstimer_time(time: int) -> str:
+    """Display form of a csTimer time, `[M:]S.cc`."""
+    centiseconds = time // (SECOND // 100)
+    minutes, seconds = divmod(centiseconds // 100, 60)
+
+    if minutes:
+        return f'{ minutes }:{ seconds:02}.{ centiseconds % 100:02}'
+    return f'{ seconds }.{ centiseconds % 100:02}'
+
+
+def cubeast_moves(moves: str) -> str:
+    """Rewrite timed `R@123` moves as Cubeast `R[123]` moves."""
+    if moves.count('@') == moves.count(' ') + 1:
+        return moves.replace('@', '[').replace(' ', '] ') + ']'
+
+    return TIMED_MOVE.sub(r'[\1]', moves)
+
+
+def last_by_date(records: Iterable[dict]) -> Iterator[dict]:
+    """Records in date order, keeping the last record of each date."""
+    pending = None
+
+    for record in records:
+        if pending is not None and pending['date'] != record['date']:
+            yield pending
+
+        pending = record
+
+    if pending is not None:
+        yield pending
+
+
+class Exporter:
+    """
+    Write the saved solves of a cube into csTimer or Cubeast exports.
+
+    Records are read from the session files one at a time and written
+    as soon as converted, so no Solve is built. The CSV exports merge
+    the sessions by date while streaming them, the csTimer backups
+    keep their sessions apart, reading alongside each session
+    the later sessions whose dates overlap, which may save its dates
+    again.
+    """
+
+    def __init__(self, cube: int = 3,
+                 includes: list[str] | None = None,
+                 excludes: list[str] | None = None,
+                 devices: list[str] | None = None):
+        self.cube = cube
+        self.includes = includes or []
+        self.excludes = excludes or []
+        self.devices = devices or []
+
+        self.rows = 0
+
+    def sessions(self) -> list[str]:
+        return select_sessions(self.cube, self.includes, self.excludes)
+
+    def entries(self, sessions: list[str]) -> dict[str, dict]:
+        """Manifest entries of the sessions saved."""
+        manifest = load_manifest()['sessions']
+
+        return {
+            session: manifest[name]
+            for session in sessions
+            if (name := session_path(self.cube, session).name) in manifest
+        }
+
+    def session_records(self, session: str,
+                        entry: dict | None) -> Iterator[dict]:
+        """
+        Records of the session in date order, streamed when the file
+        is saved in date order, else loaded and sorted,
+        as by `load_all_solves`.
+        """
+        records: Iterable[dict] = iter_records(self.cube, session)
+
+        if entry is not None and not entry['sorted']:
+            records = sorted(records, key=operator.itemgetter('date'))
+
+        for record in records:
+            if not self.devices or record.get('device') in self.devices:
+                yield record
+
+    def records(self) -> Iterator[dict]:
+        """
+        Records of the sessions merged by date, as `load_all_solves`,
+        a date saved in several sessions keeping its last record.
+        """
+        sessions = self.sessions()
+        entries = self.entries(sessions)
+
+        for record in last_by_date(
+                heapq.merge(
+                    *(
+                        self.session_records(session, entries.get(session))
+                        for session in sessions
+                    ),
+                    key=operator.itemgetter('date'),
+                ),
+        ):
+            self.rows += 1
+            yield record
+
+    def kept_records(self, sessions: list[str], index: int,
+                     entries: dict[str, dict]) -> Iterator[dict]:
+        """
+        Records of a session kept when the sessions are merged,
+        dropping the dates saved again later in the session
+        or in a later session.
+
+        Only the later sessions whose dates overlap are read alongside,
+        one record at a time.
+        """
+        session = sessions[index]
+        entry = entries.get(session)
+        if entry is None:
+            return
+
+        cursors = [
+            self.session_records(later, entries[later])
+            for later in sessions[index + 1:]
+            if later in entries
+            and entries[later]['first'] <= entry['last']
+            and entry['first'] <= entries[later]['last']
+        ]
+        heads = [next(cursor, None) for cursor in cursors]
+
+        for record in last_by_date(self.session_records(session, entry)):
+            saved_later = False
+
+            for i, cursor in enumerate(cursors):
+                head = heads[i]
+                while head is not None and head['date'] < record['date']:
+                    head = next(cursor, None)
+
+                heads[i] = head
+                if head is not None and head['date'] == record['date']:
+                    saved_later = True
+
+            if not saved_later:
+                yield record
+
+    def cstimer_json(self, fd: TextIO) -> None:
+        sessions = self.sessions()
+        entries = self.entries(sessions)
+        session_data: dict[str, dict] = {}
+
+        fd.write('{')
+
+        for index, session in enumerate(sessions):
+            key = str(len(session_data) + 1)
+            written = False
+
+            for record in self.kept_records(sessions, index, entries):
+                self.rows += 1
+
+                if written:
+                    fd.write(',')
+                else:
+                    separator = ',' if session_data else ''
+                    fd.write(f'{ separator }"session{ key }":[')
+
+                solve = [
+                    [
+                        CSTIMER_PENALTIES.get(record['flag'], 0),
+                        record['time'] // MS_TO_NS_FACTOR,
+                    ],
+                    record['scramble'],
+                    '',
+                    record['date'],
+                    [record['moves'] or '', 333],
+                ]
+                fd.write(json.dumps(solve))
+                written = True
+
+            if written:
+                fd.write(']')
+
+                session_property: dict[str, str | dict] = {'name': session}
+                if self.cube in CSTIMER_SCRAMBLE_TYPES:
+                    session_property['opt'] = {
+                        'scrType': CSTIMER_SCRAMBLE_TYPES[self.cube],
+                    }
+                session_data[key] = session_property
+
+        separator = ',' if session_data else ''
+        fd.write(
+            f'{ separator }"properties":'
+            f'{ json.dumps({"sessionData": json.dumps(session_data)}) }}}',
+        )
+
+    def cstimer_csv(self, fd: TextIO) -> None:
+        writer = csv.writer(fd, delimiter=';')
+        writer.writerow(CSTIMER_CSV_HEADER)
+
+        for record in self.records():
+            final_time = cstimer_time(
+                record['time']
+                + (2 * SECOND if record['flag'] == PLUS_TWO else 0),
+            )
+
+            if record['flag'] == DNF:
+                final_time = f'DNF({ final_time })'
+            elif record['flag'] == PLUS_TWO:
+                final_time = f'{ final_time }+'
+
+            writer.writerow(
+                [
+                    self.rows,
+                    final_time,
+                    '',
+                    record['scramble'],
+                    local_date(record['date']),
+                    cstimer_time(record['time']),
+                ],
+            )
+
+    def cubeast_csv(self, fd: TextIO) -> None:
+        writer = csv.writer(fd)
+        writer.writerow(CUBEAST_COLUMNS)
+
+        row: list[str | int] = [''] * len(CUBEAST_COLUMNS)
+
+        for record in self.records():
+            final_time = record['time']
+            if record['flag'] == PLUS_TWO:
+                final_time += 2 * SECOND
+
+            row[0] = self.rows
+            row[1] = f'{ utc_date(record["date"]) } UTC'
+            row[2] = 'true' if record['flag'] == DNF else 'false'
+            row[3] = final_time // MS_TO_NS_FACTOR
+            row[6] = record.get('device') or ''
+            row[14] = cubeast_moves(record['moves'] or '')
+            row[19] = record['scramble']
+
+            writer.writerow(row)
+
+    def export_file(self, destination: str, export_format: str) -> int:
+        start = time.perf_counter()
+        writer = getattr(self, export_format.replace('-', '_'))
+
+        if destination == '-':
+            writer(sys.stdout)
+        else:
+            with Path(destination).open(
+                    'w', encoding='utf-8', newline='',
+            ) as fd:
+                writer(fd)
+
+            duration = time.perf_counter() - start
+
+            console.print(
+                f'[success]{ self.rows } solves exported[/success] '
+                f'from { self.cube }x{ self.cube }x{ self.cube } '
+                f'as { export_format }, '
+                f'{ self.rows / duration:.0f} rows/s.',
+            )
+
+        return 0
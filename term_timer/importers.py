@@ -1,191 +1,395 @@
+import csv
 import json
 import operator
+import re
+import time
+from collections import Counter
+from collections.abc import Iterable
+from collections.abc import Iterator
 from datetime import datetime
+from datetime import timedelta
+from multiprocessing import Pool
+from multiprocessing import cpu_count
 from pathlib import Path
+from typing import TextIO
 
 from term_timer.constants import DNF
 from term_timer.constants import MS_TO_NS_FACTOR
 from term_timer.constants import PLUS_TWO
 from term_timer.constants import SECOND
+from term_timer.in_out import load_records
+from term_timer.in_out import session_path
+from term_timer.in_out import update_manifest
+from term_timer.in_out import write_records
 from term_timer.interface.console import console
-from term_timer.solve import Solve
 
+PROGRESS_EVERY = 5_000
 
-class Importer:
+UNIX_EPOCH = datetime(1970, 1, 1)  # noqa: DTZ001
 
-    def date_to_ts(self, date: str) -> int:
-        date_format = '%Y-%m-%d %H:%M:%S'
-        dt = datetime.strptime(date, date_format)  # noqa: DTZ007
+ONE_SECOND = timedelta(seconds=1)
 
-        return dt.timestamp()
+CUBEAST_MOVES = str.maketrans({'[': '@', ']': None})
+
+CSTIMER_CUBES = {
+    '': 3,
+    '333': 3,
+    '222so': 2,
+    '444wca': 4,
+    '555wca': 5,
+    '666wca': 6,
+    '777wca': 7,
+}
 
-    def time_to_ns(self, time: str) -> int:
-        minutes_str = '0'
-        reste = time
-        if ':' in time:
-            minutes_str, reste = time.split(':')
+CSTIMER_PREFIX = 'cstimer'
+
+CSTIMER_CSV_HEADER = ('No.', 'Time', 'Comment', 'Scramble', 'Date', 'P.1')
+
+CUBEAST_COLUMNS = (
+    'id', 'date', 'dnf', 'time', '', '', 'smart_cube', '', '', '', '',
+    '', '', '', 'solution', '', '', '', '', 'scramble',
+)
+
+
+def timed_moves(moves: str) -> str:
+    """Rewrite Cubeast `R[123]` moves as timed `R@123` moves in one pass."""
+    return ' '.join(moves.translate(CUBEAST_MOVES).split())
+
+
+def solve_record(date: int, time: int, scramble: str,
+                 flag: str, timer: str, device: str,
+                 moves: str = '') -> dict:
+    """Saved form of a solve, as `Solve.as_save` without parsing it."""
+    return {
+        'date': int(date),
+        'time': int(time),
+        'scramble': ' '.join(scramble.split()),
+        'flag': flag,
+        'timer': timer,
+        'device': device,
+        'moves': moves or [],
+    }
+
+
+def session_slug(name: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', str(name).lower()).strip('-')
+
+
+def cstimer_records(solves: Iterable[list]) -> Iterator[dict]:
+    for solve in solves:
+        if len(solve) != 5:
+            continue
+
+        (penalty, time), scramble, _comment, date, (moves, *_) = solve
 
-        seconds_str, centiseconds_str = reste.split('.')
+        flag = ''
+        if penalty == -1:
+            flag = DNF
+        elif penalty == 2000:
+            flag = PLUS_TWO
 
-        minutes = int(minutes_str)
-        seconds = int(seconds_str)
-        centiseconds = int(centiseconds_str)
+        yield solve_record(
+            date,
+            time * MS_TO_NS_FACTOR,
+            scramble,
+            flag,
+            'csTimer',
+            '',
+            moves,
+        )
 
-        total_seconds = minutes * 60 + seconds + centiseconds / 100
 
-        return int(total_seconds * SECOND)
+def merge_records(cube: int, session: str,
+                  records: Iterable[dict]) -> tuple[int, int, dict | None]:
+    """
+    Merge the records into the session, skipping dates already saved,
+    and write the session once.
 
-    def cubeast_csv(self, data):
-        solves = []
+    The manifest entry of the session is returned for the caller
+    to save, None when nothing was imported.
+    """
+    existing = load_records(cube, session)
+    dates = {record['date'] for record in existing}
 
-        for _line in data[1:]:
-            line = _line.split(',')
+    imported = []
+    duplicates = 0
+
+    for record in records:
+        if record['date'] in dates:
+            duplicates += 1
+            continue
+
+        dates.add(record['date'])
+        imported.append(record)
+
+    entry = None
+    if imported:
+        entry = write_records(
+            cube, session,
+            sorted(
+                existing + imported,
+                key=operator.itemgetter('date'),
+            ),
+        )
+
+    return len(imported), duplicates, entry
+
+
+def import_session_worker(job: tuple[int, str, list]) -> tuple:
+    cube, session, solves = job
+
+    imported, duplicates, entry = merge_records(
+        cube, session, cstimer_records(solves),
+    )
+
+    return cube, session, len(solves), imported, duplicates, entry
+
+
+def save_entries(results: list[tuple]) -> None:
+    """Save the manifest entries of the imported sessions at once."""
+    entries = {
+        session_path(cube, session).name: entry
+        for cube, session, *_, entry in results
+        if entry is not None
+    }
+
+    if entries:
+        update_manifest(entries)
+
+
+class Importer:
 
-            date = line[1][:-4]
+    def __init__(self, cube: int = 3, session: str = ''):
+        self.cube = cube
+        self.session = session
+
+        self.rows = 0
+
+    def date_to_ts(self, date: str) -> int:
+        """Timestamp of a local `YYYY-MM-DD HH:MM:SS` date."""
+        return int(datetime.fromisoformat(date).timestamp())
+
+    def utc_date_to_ts(self, date: str) -> int:
+        """Timestamp of a UTC `YYYY-MM-DD HH:MM:SS` date."""
+        return (datetime.fromisoformat(date) - UNIX_EPOCH) // ONE_SECOND
+
+    def time_to_ns(self, time: str) -> int:
+        """Nanoseconds of a `[[H:]M:]S.fraction` duration."""
+        clock, _, fraction = time.partition('.')
+
+        seconds = 0
+        for part in clock.split(':'):
+            seconds = seconds * 60 + int(part)
+
+        return (
+            seconds * SECOND
+            + int(fraction or 0) * 10 ** (9 - len(fraction))
+        )
+
+    def cubeast_csv(self, rows: Iterable[list[str]]) -> Iterator[dict]:
+        for line in rows:
+            date = self.utc_date_to_ts(line[1][:-4])
             dnf = line[2]
             time = line[3]
             device = line[6]
             moves = line[14]
             scramble = line[19]
 
-            date = self.date_to_ts(date)
-
             flag = ''
             if dnf == 'true':
                 flag = DNF
 
-            fixed_moves = []
-            for move_raw in moves.split(' '):
-                if move_raw:
-                    move, time = move_raw.split('[')
-                    time = time.replace(']', '')
-                    fixed_moves.append(f'{ move }@{ time }')
-
-            solves.append(
-                Solve(
-                    date,
-                    int(time) * MS_TO_NS_FACTOR,
-                    scramble,
-                    flag,
-                    'Cubeast',
-                    device,
-                    'import_cubeast_csv',
-                    ' '.join(fixed_moves),
-                ).as_save,
+            yield solve_record(
+                date,
+                int(time) * MS_TO_NS_FACTOR,
+                scramble,
+                flag,
+                'Cubeast',
+                device,
+                timed_moves(moves),
             )
 
-        return solves
-
-    def cstimer_csv(self, data):
-        solves = []
-
-        for line in data[1:]:
+    def cstimer_csv(self, rows: Iterable[list[str]]) -> Iterator[dict]:
+        for line in rows:
             flag = ''
             (
-                _i, time_corrected, _comment, scramble, date, time,
-            ) = line.split(';')
-            date = self.date_to_ts(date)
-            time = self.time_to_ns(time)
+                _i, time_corrected, _comment, scramble, raw_date, raw_time,
+            ) = line
+            date = self.date_to_ts(raw_date)
+            time = self.time_to_ns(raw_time)
 
             if '+' in time_corrected:
                 flag = PLUS_TWO
             elif 'DNF(' in time_corrected:
                 flag = DNF
 
-            solves.append(
-                Solve(
-                    date, time,
-                    scramble,
-                    flag,
-                    'csTimer',
-                    '',
-                    'import_cstimer_csv',
-                ).as_save,
+            yield solve_record(
+                date, time,
+                scramble,
+                flag,
+                'csTimer',
+                '',
             )
 
-        return solves
-
-    def cstimer_json(self, data):
-        solves = []
-        properties = data['properties']
-        session_data = json.loads(properties['sessionData'])
-
-        for session_key in data:
-            if 'session' not in session_key:
+    def track(self, records: Iterable[dict]) -> Iterator[dict]:
+        """Report the rows read and their rate while passing them."""
+        start = time.perf_counter()
+        self.rows = 0
+
+        with console.status('Importing solves...') as status:
+            for record in records:
+                self.rows += 1
+
+                if not self.rows % PROGRESS_EVERY:
+                    rate = self.rows / (time.perf_counter() - start)
+                    status.update(
+                        f'Importing solves... { self.rows } rows, '
+                        f'{ rate:.0f} rows/s',
+                    )
+
+                yield record
+
+    def merge(self, records: Iterable[dict]) -> tuple[int, int]:
+        imported, duplicates, entry = merge_records(
+            self.cube, self.session, self.track(records),
+        )
+        save_entries([(self.cube, self.session, entry)])
+
+        return imported, duplicates
+
+    def cstimer_sessions(self, data: dict) -> list[tuple[int, str, list]]:
+        """
+        Import jobs of a csTimer backup, one per cube session,
+        named after the csTimer session under a common prefix.
+
+        The names of a cube slugged alike are told apart by their
+        csTimer session key, and the sessions still sharing a file
+        are merged in one job, each file being written by one worker.
+        """
+        session_data = json.loads(data['properties']['sessionData'])
+        prefix = self.session or CSTIMER_PREFIX
+
+        sessions = []
+        for session_key, session_solves in data.items():
+            if not session_key.startswith('session') or not session_solves:
                 continue
 
-            if not len(data[session_key]):
-                continue
-
-            property_key = session_key.replace('session', '')
-            session_property = session_data[property_key]
-
+            key = session_key.removeprefix('session')
+            session_property = session_data.get(key, {})
             scramble_type = session_property.get('opt', {}).get('scrType', '')
 
-            if scramble_type:
+            if scramble_type not in CSTIMER_CUBES:
                 continue
 
-            for solve in data[session_key]:
-                if len(solve) != 5:
-                    continue
-
-                flag, time = solve[0]
-                scramble = solve[1]
-                date = solve[3]
-                moves = solve[4][0]
-
-                if flag == -1:
-                    flag = DNF
-                elif flag == 2000:
-                    flag = PLUS_TWO
-                else:
-                    flag = ''
-
-                device = ''
-
-                solves.append(
-                    Solve(
-                        date,
-                        time * MS_TO_NS_FACTOR,
-                        scramble,
-                        flag,
-                        'csTimer',
-                        device,
-                        'import_cstimer_json',
-                        moves,
-                    ).as_save,
-                )
+            sessions.append(
+                (
+                    CSTIMER_CUBES[scramble_type],
+                    session_slug(session_property.get('name', '')) or key,
+                    key,
+                    session_solves,
+                ),
+            )
 
-        return solves
+        names = Counter((cube, name) for cube, name, *_ in sessions)
+
+        jobs: dict[tuple[int, str], list] = {}
+        for cube, name, key, session_solves in sessions:
+            suffix = ''
+            if names[cube, name] > 1 and name != key:
+                suffix = f'-{ key }'
+
+            jobs.setdefault(
+                (cube, f'{ prefix }-{ name }{ suffix }'), [],
+            ).extend(session_solves)
+
+        return [
+            (cube, session, session_solves)
+            for (cube, session), session_solves in jobs.items()
+        ]
+
+    def import_sessions(self, jobs: list[tuple[int, str, list]]) -> list:
+        """
+        Convert and write the sessions in parallel worker processes,
+        each session having its own file, then save their manifest
+        entries once from this process.
+        """
+        processes = min(len(jobs), max(1, cpu_count() - 1))
+
+        if processes < 2:
+            results = [import_session_worker(job) for job in jobs]
+        else:
+            with Pool(processes=processes) as pool:
+                results = []
+                with console.status('Importing sessions...') as status:
+                    for result in pool.imap_unordered(
+                            import_session_worker,
+                            sorted(jobs, key=lambda job: -len(job[2])),
+                    ):
+                        results.append(result)
+                        status.update(
+                            'Importing sessions... '
+                            f'{ len(results) }/{ len(jobs) }',
+                        )
+
+        save_entries(results)
+
+        self.rows = sum(result[2] for result in results)
+
+        return sorted(
+            (result[:-1] for result in results),
+            key=operator.itemgetter(0, 1),
+        )
+
+    def csv_records(self, fd: TextIO) -> Iterator[dict] | None:
+        header = fd.readline()
+
+        if 'No.;' in header:
+            return self.cstimer_csv(csv.reader(fd, delimiter=';'))
+        if 'id,' in header:
+            return self.cubeast_csv(csv.reader(fd))
+
+        return None
 
     def import_file(self, source: str) -> int:
         source_path = Path(source)
+        start = time.perf_counter()
 
-        solves = None
-
-        if source.endswith(('.json', '.txt')):
-            with source_path.open() as fd:
-                data = json.load(fd)
-
-            solves = self.cstimer_json(data)
-
-        elif source.endswith('.csv'):
-            with source_path.open() as fd:
-                data = fd.readlines()
-
-            if 'No.;' in data[0]:
-                solves = self.cstimer_csv(data)
-            elif 'id,' in data[0]:
-                solves = self.cubeast_csv(data)
-
-        if solves is None:
+        if not source.endswith(('.json', '.txt', '.csv')):
             console.print('Invalid export format', style='warning')
             return 1
 
-        solves = sorted(solves, key=operator.itemgetter('date'))
+        with source_path.open(newline='') as fd:
+            if source.endswith('.csv'):
+                records = self.csv_records(fd)
+
+                if records is None:
+                    console.print('Invalid export format', style='warning')
+                    return 1
+
+                imported, duplicates = self.merge(records)
+                results = [
+                    (self.cube, self.session or 'default',
+                     self.rows, imported, duplicates),
+                ]
+            else:
+                results = self.import_sessions(
+                    self.cstimer_sessions(json.load(fd)),
+                )
+
+        duration = time.perf_counter() - start
 
-        out = json.dumps(solves, indent=1)
+        for cube, session, _rows, imported, duplicates in results:
+            console.print(
+                f'[success]{ imported } solves imported[/success] '
+                f'into { cube }x{ cube }x{ cube } '
+                f'session { session.title() }, '
+                f'{ duplicates } already saved.',
+            )
 
-        print(out)
+        console.print(
+            f'{ self.rows } rows in { duration:.2f}s, '
+            f'{ self.rows / duration:.0f} rows/s',
+            style='comment',
+        )
 
         return 0
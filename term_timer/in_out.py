@@ -1,17 +1,301 @@
+import heapq
 import json
 import operator
+import os
+import re
+import sys
+import threading
+from collections.abc import Callable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TextIO
 
+from term_timer.constants import DNF
+from term_timer.constants import PLUS_TWO
 from term_timer.constants import SAVE_DIRECTORY
+from term_timer.constants import SECOND
 from term_timer.solve import Solve
+from term_timer.summary import TimeSummary
 
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
 
-def load_solves(cube: int, session: str) -> list[Solve]:
+RECORDS_CHUNK = 1 << 16
+
+RECORDS_SEPARATORS = re.compile(r'[\s\[,]*')
+
+MANIFEST_NAME = '.manifest.json'
+
+MANIFEST_LOCK_NAME = '.manifest.lock'
+
+MANIFEST_FORMAT = 4
+
+SESSION_FILE = re.compile(r'(\d+)x\1x\1(?:-(.+))?\.json')
+
+Signature = tuple[int, int] | None
+
+
+class ManifestLock:
+    """
+    Reentrant lock on the manifest, held against the other threads
+    and against the other processes, as the import workers,
+    with a lock on a file next to the manifest.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.depth = 0
+        self.fd: TextIO | None = None
+
+    def __enter__(self) -> 'ManifestLock':
+        self.lock.acquire()
+        self.depth += 1
+
+        if self.depth == 1:
+            self.fd = (SAVE_DIRECTORY / MANIFEST_LOCK_NAME).open('a')
+
+            if sys.platform == 'win32':
+                msvcrt.locking(self.fd.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(self.fd, fcntl.LOCK_EX)
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.depth -= 1
+
+        if not self.depth and self.fd is not None:
+            if sys.platform == 'win32':
+                msvcrt.locking(self.fd.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+            self.fd.close()
+            self.fd = None
+
+        self.lock.release()
+
+
+manifest_lock = ManifestLock()
+
+
+def file_signature(path: Path) -> Signature:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+def session_path(cube: int, session: str) -> Path:
     if session == 'default':
         session = ''
 
     suffix = (session and f'-{ session }') or ''
 
-    source = SAVE_DIRECTORY / f'{ cube }x{ cube }x{ cube }{ suffix }.json'
+    return SAVE_DIRECTORY / f'{ cube }x{ cube }x{ cube }{ suffix }.json'
+
+
+def list_sessions(cube: int) -> list[str]:
+    return ['default'] + [
+        entry['session']
+        for entry in load_manifest()['sessions'].values()
+        if entry['cube'] == cube and entry['session'] != 'default'
+    ]
+
+
+def entry_version(path: Path) -> list[int] | None:
+    """Signature of a session file, as saved in its manifest entry."""
+    signature = file_signature(path)
+
+    return list(signature) if signature else None
+
+
+def summarize_records(cube: int, session: str, records: list[dict]) -> dict:
+    """Manifest entry of a session, from its raw records."""
+    final_times = [
+        0 if record.get('flag') == DNF
+        else record['time'] + (
+            2 * SECOND if record.get('flag') == PLUS_TWO else 0
+        )
+        for record in records
+    ]
+    dates = [record['date'] for record in records]
+    summary = TimeSummary.from_times(final_times)
+
+    return {
+        'cube': cube,
+        'session': session or 'default',
+        'count': len(records),
+        'first': min(dates, default=0),
+        'last': max(dates, default=0),
+        'best': summary.best,
+        'devices': sorted(
+            {record.get('device') or '' for record in records} - {''},
+        ),
+        'sorted': all(map(operator.le, dates, dates[1:])),
+        'version': entry_version(session_path(cube, session)),
+        'summary': summary.as_dict(),
+    }
+
+
+def write_manifest(sessions: dict[str, dict]) -> dict:
+    """
+    Replace the manifest once fully written, then stamp it
+    with the modification time of the directory,
+    which changes only when files are added, removed or replaced.
+
+    Must be called with the `manifest_lock` held.
+    """
+    path = SAVE_DIRECTORY / MANIFEST_NAME
+    temporary = path.with_name(f'{ MANIFEST_NAME }.tmp')
+
+    manifest = {
+        'format': MANIFEST_FORMAT,
+        'sessions': sessions,
+    }
+
+    with temporary.open('w') as fd:
+        json.dump(manifest, fd, indent=1)
+
+    temporary.replace(path)
+
+    directory = SAVE_DIRECTORY.stat().st_mtime_ns
+    os.utime(path, ns=(directory, directory))
+
+    return manifest
+
+
+def read_manifest(*, stamped: bool = True) -> dict | None:
+    """
+    The saved manifest, unless missing, corrupt, of an older format
+    or, when `stamped`, older than the last change of the directory.
+    """
+    try:
+        with (SAVE_DIRECTORY / MANIFEST_NAME).open() as fd:
+            stamp = os.fstat(fd.fileno()).st_mtime_ns
+            manifest = json.load(fd)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if (
+            manifest.get('format') != MANIFEST_FORMAT
+            or (stamped and stamp != SAVE_DIRECTORY.stat().st_mtime_ns)
+    ):
+        return None
+
+    return manifest
+
+
+def rebuild_manifest(known: dict[str, dict] | None = None) -> dict:
+    """
+    Manifest of every session file of the directory,
+    reading the files without a known entry of their version.
+    """
+    known = known or {}
+    sessions = {}
+
+    with manifest_lock:
+        for path in sorted(SAVE_DIRECTORY.iterdir()):
+            match = SESSION_FILE.fullmatch(path.name)
+
+            if match is None or not path.is_file():
+                continue
+
+            entry = known.get(path.name)
+
+            if entry is None or entry['version'] != entry_version(path):
+                cube, session = int(match[1]), match[2] or ''
+                entry = summarize_records(
+                    cube, session, load_records(cube, session),
+                )
+
+            sessions[path.name] = entry
+
+        return write_manifest(sessions)
+
+
+def refresh_manifest(entries: dict[str, dict] | None = None) -> dict:
+    """
+    Manifest rebuilt after the directory changed, keeping the entries
+    of the previous manifest and the given ones still of the version
+    of their file, so only the files added or changed by others are read.
+
+    Must be called with the `manifest_lock` held.
+    """
+    previous = read_manifest(stamped=False)
+    known = previous['sessions'] if previous is not None else {}
+
+    return rebuild_manifest({**known, **(entries or {})})
+
+
+def load_manifest() -> dict:
+    """
+    Sessions of every cube, with their solve counts, dates,
+    whether saved in date order, devices and time summaries,
+    without listing the directory nor opening the session files.
+
+    The manifest is refreshed when missing, or when the directory changed
+    since it was written, as when sessions are copied in by hand,
+    and the entries of the session files edited in place are refreshed.
+    """
+    if not SAVE_DIRECTORY.exists():
+        return {'sessions': {}}
+
+    manifest = read_manifest()
+
+    if manifest is None:
+        with manifest_lock:
+            return read_manifest() or refresh_manifest()
+
+    stale = [
+        entry
+        for name, entry in manifest['sessions'].items()
+        if entry['version'] != entry_version(SAVE_DIRECTORY / name)
+    ]
+
+    if stale:
+        return update_manifest(
+            {
+                session_path(entry['cube'], entry['session']).name: (
+                    summarize_records(
+                        entry['cube'], entry['session'],
+                        load_records(entry['cube'], entry['session']),
+                    )
+                )
+                for entry in stale
+            },
+        )
+
+    return manifest
+
+
+def update_manifest(entries: dict[str, dict]) -> dict:
+    """Replace the manifest entries of the sessions just saved."""
+    with manifest_lock:
+        manifest = read_manifest()
+
+        if manifest is None:
+            return refresh_manifest(entries)
+
+        manifest['sessions'].update(entries)
+
+        return write_manifest(manifest['sessions'])
+
+
+def load_solves(cube: int, session: str,
+                devices: list[str] | None = None) -> list[Solve]:
+    """
+    Solves of a session, building only the solves
+    whose raw record is of one of the devices, when given.
+    """
+    if session == 'default':
+        session = ''
+
+    source = session_path(cube, session)
 
     if source.exists():
         with source.open() as fd:
@@ -25,65 +309,225 @@ def load_solves(cube: int, session: str) -> list[Solve]:
                 solve_id=i + 1,
             )
             for i, data in enumerate(datas)
+            if not devices or data.get('device', '') in devices
         ]
 
     return []
 
 
+def select_sessions(cube: int,
+                    includes: list[str],
+                    excludes: list[str]) -> list[str]:
+    sessions = list_sessions(cube)
+
+    if includes:
+        return [session for session in sessions if session in includes]
+
+    return [session for session in sessions if session not in excludes]
+
+
+def overlapping_sessions(entries: dict[str, dict]) -> list[list[str]]:
+    """
+    Groups of the sessions whose ranges of dates overlap,
+    the only ones which may save the same date.
+    """
+    groups: list[list[str]] = []
+    last = 0
+
+    for session, entry in sorted(
+            entries.items(), key=lambda item: item[1]['first'],
+    ):
+        if groups and entry['first'] <= last:
+            groups[-1].append(session)
+            last = max(last, entry['last'])
+        else:
+            groups.append([session])
+            last = entry['last']
+
+    return groups
+
+
+def load_summary(cube: int,
+                 includes: list[str],
+                 excludes: list[str]) -> TimeSummary:
+    """
+    Time summary of the selected sessions, merged from the manifest.
+
+    A date saved in several sessions is kept once by `load_all_solves`,
+    so the sessions whose dates overlap are loaded and summarized
+    together, the others being merged from their saved summaries.
+    """
+    manifest = load_manifest()['sessions']
+    entries = {
+        session: entry
+        for session in select_sessions(cube, includes, excludes)
+        if (entry := manifest.get(session_path(cube, session).name))
+        and entry['count']
+    }
+
+    summary = TimeSummary()
+
+    for group in overlapping_sessions(entries):
+        if len(group) == 1:
+            summary += TimeSummary.from_dict(entries[group[0]]['summary'])
+        else:
+            summary += TimeSummary.from_times(
+                [
+                    solve.final_time
+                    for solve in load_all_solves(cube, group, [], [])
+                ],
+            )
+
+    return summary
+
+
+def merge_sessions(streams: list[list[Solve]]) -> list[Solve]:
+    """
+    Merge the chronological solves of several sessions,
+    a date saved in several sessions keeping its last solve.
+    """
+    solves: list[Solve] = []
+
+    for solve in heapq.merge(*streams, key=operator.attrgetter('date')):
+        if solves and solves[-1].date == solve.date:
+            solves[-1] = solve
+        else:
+            solves.append(solve)
+
+    return solves
+
+
 def load_all_solves(cube: int,
                     includes: list[str],
                     excludes: list[str],
-                    devices: list[str]) -> list[Solve]:
+                    devices: list[str],
+                    loader: Callable[[int, str], list[Solve]] | None = None,
+                    ) -> list[Solve]:
+    """
+    Solves of the selected sessions in chronological order.
+
+    The devices are filtered on the raw records before the solves
+    are built, or on the solves returned by a custom loader,
+    and the sessions are merged by date instead of sorted again.
+    """
+    def load(session: str) -> list[Solve]:
+        if loader is None:
+            return load_solves(cube, session, devices)
+
+        solves = loader(cube, session)
+        if not devices:
+            return solves
+
+        return [solve for solve in solves if solve.device in devices]
+
     if len(includes) == 1:
-        return load_solves(cube, includes[0])
+        return load(includes[0])
 
-    prefix = f'{ cube }x{ cube }x{ cube }-'
+    streams = []
+    for session in select_sessions(cube, includes, excludes):
+        solves = load(session)
+        dates = [solve.date for solve in solves]
 
-    solves = []
-    sessions = ['default'] + [
-        f.name.split(prefix, 1)[1].replace('.json', '')
-        for f in SAVE_DIRECTORY.iterdir()
-        if f.is_file() and f.name.startswith(prefix)
-    ]
+        if not all(map(operator.le, dates, dates[1:])):
+            solves = sorted(solves, key=operator.attrgetter('date'))
 
-    if includes:
-        for session_name in sessions:
-            if session_name in includes:
-                solves.extend(
-                    load_solves(cube, session_name),
-                )
-    else:
-        for session_name in sessions:
-            if session_name not in excludes:
-                solves.extend(
-                    load_solves(cube, session_name),
-                )
+        streams.append(solves)
 
-    if devices:
-        solves = [solve for solve in solves if solve.device in devices]
+    return merge_sessions(streams)
 
-    uniques = {}
-    for solve in solves:
-        uniques[solve.date] = solve
 
-    return sorted(uniques.values(), key=operator.attrgetter('date'))
+def load_records(cube: int, session: str) -> list[dict]:
+    """Saved solves of a session, as raw records."""
+    source = session_path(cube, session)
 
+    if not source.exists():
+        return []
 
-def save_solves(cube: int, session: str, solves: list[Solve]) -> bool:
-    if session == 'default':
-        session = ''
+    with source.open() as fd:
+        return json.load(fd)
 
-    suffix = (session and f'-{ session }') or ''
 
-    source = SAVE_DIRECTORY / f'{ cube }x{ cube }x{ cube }{ suffix }.json'
+def iter_records(cube: int, session: str) -> Iterator[dict]:
+    """
+    Saved solves of a session, decoded one record at a time
+    from a bounded buffer instead of loading the whole file.
+    """
+    source = session_path(cube, session)
+
+    if not source.exists():
+        return
+
+    decoder = json.JSONDecoder()
+
+    with source.open() as fd:
+        buffer = ''
+        index = 0
 
-    data = []
-    for s in solves:
-        data.append(s.as_save)
+        while True:
+            if separators := RECORDS_SEPARATORS.match(buffer, index):
+                index = separators.end()
 
-    dumped = json.dumps(data, indent=1)
+            if buffer[index:index + 1] == ']':
+                return
 
-    with source.open('w+') as fd:
-        fd.write(dumped)
+            try:
+                record, index = decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                chunk = fd.read(RECORDS_CHUNK)
+
+                if not chunk:
+                    if buffer[index:].strip():
+                        raise
+                    return
+
+                buffer = buffer[index:] + chunk
+                index = 0
+                continue
+
+            yield record
+
+
+def write_records(cube: int, session: str, records: list[dict]) -> dict:
+    """
+    Write the raw records of a session in one pass,
+    replacing the session file only once fully written,
+    and return its manifest entry, left to the caller to save.
+
+    The file is replaced with the `manifest_lock` held,
+    for a save to tell its own change of the directory apart.
+    """
+    source = session_path(cube, session)
+    temporary = source.with_name(f'.{ source.name }.tmp')
+
+    with temporary.open('w') as fd:
+        json.dump(records, fd, indent=1)
+
+    with manifest_lock:
+        temporary.replace(source)
+
+    return summarize_records(cube, session, records)
+
+
+def save_records(cube: int, session: str, records: list[dict]) -> bool:
+    """
+    Write the raw records of a session and its manifest entry.
+
+    The manifest is read before the session file is replaced,
+    and stamped again after, the directory having changed only
+    by this save, without reading the other sessions.
+    """
+    with manifest_lock:
+        manifest = read_manifest()
+        entry = write_records(cube, session, records)
+
+        if manifest is None:
+            refresh_manifest({session_path(cube, session).name: entry})
+        else:
+            manifest['sessions'][session_path(cube, session).name] = entry
+            write_manifest(manifest['sessions'])
 
     return True
+
+
+def save_solves(cube: int, session: str, solves: list[Solve]) -> bool:
+    return save_records(cube, session, [solve.as_save for solve in solves])
@@ -48,13 +48,15 @@ class SolveInterface(
 
         self.moves = []
 
-        self.save_moves = Algorithm()
+        self.gesture_tracker = None
         self.save_gesture = ''
         self.save_gesture_event.clear()
 
         self.scramble = Algorithm()
         self.scrambled = Algorithm()
         self.scramble_oriented = Algorithm()
+        self.scramble_tracker = None
+        self.scramble_rendered = None
         self.facelets_scrambled = ''
         self.scramble_completed_event.clear()
 
@@ -1,12 +1,11 @@
 import asyncio
 import logging
 
-from cubing_algs.vcube import VCube
-
 from term_timer.bluetooth.interface import BluetoothInterface
 from term_timer.bluetooth.interface import CubeNotFoundError
 from term_timer.config import BLUETOOTH_CONFIG
 from term_timer.constants import MS_TO_NS_FACTOR
+from term_timer.cube_state import CubeState
 
 logger = logging.getLogger(__name__)
 
@@ -142,22 +141,20 @@ class Bluetooth:
                 break
 
             for event in events:
-                event_name = event['event']
+                event_name = event.name
 
                 if event_name == 'hardware':
-                    event.pop('event')
-                    event.pop('timestamp')
-                    self.bluetooth_hardware.update(event)
+                    self.bluetooth_hardware.update(event.infos)
                     self.hardware_received_event.set()
 
                 elif event_name == 'battery':
-                    self.bluetooth_hardware['battery_level'] = event['level']
+                    self.bluetooth_hardware['battery_level'] = event.level
 
                 elif event_name == 'facelets':
                     if self.facelets_received_event.is_set():
                         continue
 
-                    self.bluetooth_cube = VCube(event['facelets'])
+                    self.bluetooth_cube = CubeState(event.facelets)
 
                     self.facelets_received_event.set()
 
@@ -165,14 +162,14 @@ class Bluetooth:
                     if not self.bluetooth_cube:
                         continue
 
-                    self.bluetooth_cube.rotate(event['move'])
+                    self.bluetooth_cube.rotate(event.move)
 
                     self.handle_bluetooth_move(event)
 
     def handle_bluetooth_move(self, event) -> None:
         timed_move = (
-            f"{ event['move'] }@"
-            f"{ int(event['clock'] / MS_TO_NS_FACTOR) }"
+            f'{ event.move }@'
+            f'{ event.clock // MS_TO_NS_FACTOR }'
         )
 
         if self.state in {'start', 'scrambling'}:
@@ -184,8 +181,8 @@ class Bluetooth:
         elif self.state == 'scrambled':
             self.moves.append(
                 {
-                    'move': event['move'],
-                    'time': event['clock'],
+                    'move': event.move,
+                    'time': event.clock,
                 },
             )
             self.solve_started_event.set()
@@ -193,8 +190,8 @@ class Bluetooth:
         elif self.state == 'solving':
             self.moves.append(
                 {
-                    'move': event['move'],
-                    'time': event['clock'],
+                    'move': event.move,
+                    'time': event.clock,
                 },
             )
 
@@ -202,7 +199,7 @@ class Bluetooth:
                     not self.solve_completed_event.is_set()
                     and self.cube_is_solved()
             ):
-                self.end_time = event['clock']
+                self.end_time = event.clock
                 self.solve_completed_event.set()
                 logger.info('Bluetooth Stop: %s', self.end_time)
 
@@ -1,12 +1,12 @@
 import asyncio
 import logging
+import time
 
-from cubing_algs.algorithm import Algorithm
-from cubing_algs.transform.degrip import degrip_full_moves
-from cubing_algs.transform.rotation import remove_final_rotations
-from cubing_algs.transform.slice import reslice_timed_moves
+from cubing_algs.move import Move
 
-from term_timer.constants import RESLICE_THRESHOLD
+from term_timer.config import GESTURES_BINDINGS
+from term_timer.constants import MS_TO_NS_FACTOR
+from term_timer.tracker import GestureTracker
 
 logger = logging.getLogger(__name__)
 
@@ -16,49 +16,31 @@ class Gesture:
     def __init__(self):
         super().__init__()
 
-        self.save_moves = Algorithm()
+        self.gestures_bindings = GESTURES_BINDINGS
+        self.gesture_tracker = None
         self.save_gesture = ''
+        self.save_gesture_latency = 0.0
         self.save_gesture_event = asyncio.Event()
 
-    def handle_save_gestures(self, move):
-        move = self.reorient(move)
+    def handle_save_gestures(self, timed_move):
+        if self.gesture_tracker is None:
+            self.gesture_tracker = GestureTracker(self.cube_orientation)
 
-        self.save_moves += move
+        self.gesture_tracker.add(timed_move)
 
-        if len(self.save_moves) < 2:
-            return
-
-        algo = self.save_moves.transform(
-            reslice_timed_moves(RESLICE_THRESHOLD),
-            degrip_full_moves,
-            remove_final_rotations,
-        )
-
-        if len(algo) < 2:
-            return
-
-        l_move = algo[-1].untimed
-        a_move = algo[-2].untimed
+        base_move = self.gesture_tracker.gesture()
 
-        if l_move.base_move != a_move.base_move:
+        if base_move not in self.gestures_bindings:
             return
 
-        if l_move == a_move:
-            return
-
-        base_move = l_move.base_move
-
-        if base_move in {'F', 'R', 'U', 'B', 'L'}:
-            self.save_gesture = ''
-        elif base_move in {'M', 'S', 'E'}:
-            self.save_gesture = 'z'
-        elif base_move == 'D':
-            self.save_gesture = 'q'
-        else:
-            return
+        self.save_gesture = self.gestures_bindings[base_move]
+        self.save_gesture_latency = (
+            time.perf_counter_ns() / MS_TO_NS_FACTOR - Move(timed_move).timed
+        )
 
         self.save_gesture_event.set()
         logger.info(
-            'Save gesture: %s => *%s*',
+            'Save gesture: %s => *%s* in %.2fms',
             base_move, self.save_gesture,
+            self.save_gesture_latency,
         )
@@ -3,6 +3,9 @@ import time
 
 from term_timer.constants import REFRESH
 from term_timer.constants import SECOND
+from term_timer.ticker import Ticker
+
+COUNTDOWN_BEEPS = 3
 
 
 class Inspecter:
@@ -17,25 +20,21 @@ class Inspecter:
     async def inspection(self) -> None:
         self.clear_line(full=True)
 
-        state = 0
         first = True
         inspection_start_time = time.perf_counter_ns()
 
         self.set_state('inspecting', inspection_start_time)
 
-        while not self.inspection_completed_event.is_set():
-            elapsed_time = time.perf_counter_ns() - inspection_start_time
-            elapsed_seconds = elapsed_time / SECOND
+        def refresh() -> None:
+            nonlocal first
 
-            klass = 'result'
-            remaining_time = self.countdown - elapsed_seconds
-            remaining_time_rounded = int(remaining_time // 1)
+            if self.inspection_completed_event.is_set():
+                return
 
-            if remaining_time_rounded != state:
-                state = remaining_time_rounded
-                if state in {2, 1, 0}:
-                    self.beep()
+            elapsed_time = time.perf_counter_ns() - inspection_start_time
+            remaining_time = self.countdown - elapsed_time / SECOND
 
+            klass = 'result'
             if remaining_time < 1:
                 klass = 'warning'
             elif remaining_time < 3:
@@ -56,6 +55,19 @@ class Inspecter:
                     end='',
                 )
 
-            await asyncio.sleep(REFRESH)
+        beeps = min(COUNTDOWN_BEEPS, int(self.countdown))
+
+        ticker = Ticker(inspection_start_time)
+        ticker.every('display', REFRESH, refresh)
+        if beeps:
+            ticker.every(
+                'countdown', 1, self.beep,
+                offset=self.countdown - beeps,
+                count=beeps,
+            )
+
+        await self.inspection_completed_event.wait()
+
+        ticker.stop()
 
         self.set_state('inspected')
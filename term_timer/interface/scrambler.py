@@ -1,12 +1,8 @@
 import asyncio
 
 from cubing_algs.algorithm import Algorithm
-from cubing_algs.transform.degrip import degrip_full_moves
-from cubing_algs.transform.size import compress_moves
-from cubing_algs.transform.slice import reslice_timed_moves
-from cubing_algs.transform.timing import untime_moves
 
-from term_timer.constants import RESLICE_THRESHOLD
+from term_timer.tracker import ScrambleTracker
 
 
 class Scrambler:
@@ -17,6 +13,8 @@ class Scrambler:
         self.scramble = Algorithm()
         self.scrambled = Algorithm()
         self.scramble_oriented = Algorithm()
+        self.scramble_tracker = None
+        self.scramble_rendered = None
 
         self.counter = 0
 
@@ -27,47 +25,58 @@ class Scrambler:
     def handle_scrambled(self, timed_move):
         self.scrambled += timed_move
 
+        if self.scramble_tracker is None:
+            self.scramble_tracker = ScrambleTracker(
+                self.scramble_oriented,
+                self.cube_orientation,
+            )
+        changed = self.scramble_tracker.add(timed_move)
+
         if self.bluetooth_cube.state == self.facelets_scrambled:
             self.scramble_completed_event.set()
             self.beep()
-            out = (
+
+            self.clear_line(full=True)
+            self.console.print(
+                f'[scramble]Scramble #{ self.counter }:[/scramble]',
                 '[result]Cube scrambled and ready to be solved ![/result] '
-                '[consign]Start solving to launch the timer.[/consign]'
+                '[consign]Start solving to launch the timer.[/consign]',
+                end='',
             )
-            full_clear = True
-        else:
-            out = ''
-            algo = self.reorient(
-                self.scrambled.transform(
-                    reslice_timed_moves(RESLICE_THRESHOLD),
-                    degrip_full_moves,
-                    compress_moves,
-                    untime_moves,
-                ),
-            )
-            p_algo = self.scrambled[:-1].transform(
-                reslice_timed_moves(RESLICE_THRESHOLD),
-                degrip_full_moves,
-                compress_moves,
+            self.scramble_rendered = None
+            return
+
+        self.render_scrambled(changed)
+
+    def render_scrambled(self, changed):
+        """
+        Redraw only the moves from the first changed one,
+        the moves before it keep the same text and style.
+        """
+        tracker = self.scramble_tracker
+
+        if self.scramble_rendered is None:
+            self.clear_line(full=True)
+            self.console.print(
+                f'[scramble]Scramble #{ self.counter }:[/scramble] ',
+                end='',
             )
+            self.scramble_rendered = []
+            changed = 0
+
+        changed = min(changed, len(self.scramble_rendered))
+        erased = sum(self.scramble_rendered[changed:])
+        del self.scramble_rendered[changed:]
+
+        out = ''
+        for index in range(changed, len(tracker.moves)):
+            move = tracker.moves[index]
+            style = tracker.style(index)
+            out += f'[{ style }]{ move }[/{ style }] '
+            self.scramble_rendered.append(len(move) + 1)
+
+        padding = max(erased - sum(self.scramble_rendered[changed:]), 0)
 
-            on_good_way = True
-            for i, move in enumerate(algo):
-                expected = self.scramble_oriented[i]
-                style = 'move'
-                if expected != move or not on_good_way:
-                    on_good_way = False
-                    style = 'warning'
-                    if expected[0] == move[0]:
-                        style = 'caution'
-
-                out += f'[{ style }]{ move }[/{ style }] '
-            full_clear = len(algo) < len(p_algo) or len(algo) <= 1
-
-        self.clear_line(full=full_clear)
-
-        self.console.print(
-            f'[scramble]Scramble #{ self.counter }:[/scramble]',
-            out,
-            end='',
-        )
+        self.back(erased)
+        self.console.print(f'{ out }{ " " * padding }', end='')
+        self.back(padding)
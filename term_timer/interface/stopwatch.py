@@ -1,9 +1,27 @@
 import asyncio
 import time
+from bisect import bisect_left
 
 from term_timer.constants import REFRESH
 from term_timer.constants import SECOND
 from term_timer.formatter import format_time
+from term_timer.ticker import Ticker
+
+STYLES_THRESHOLDS = (5, 10, 15, 20, 25, 30, 35, 40, 45, 50)
+
+STYLES = (
+    'timer_base',
+    'timer_05',
+    'timer_10',
+    'timer_15',
+    'timer_20',
+    'timer_25',
+    'timer_30',
+    'timer_35',
+    'timer_40',
+    'timer_45',
+    'timer_50',
+)
 
 
 class StopWatch:
@@ -16,6 +34,7 @@ class StopWatch:
         self.elapsed_time = 0
 
         self.metronome = 0
+        self.ticks_jitter = {}
 
         self.solve_started_event = asyncio.Event()
         self.solve_completed_event = asyncio.Event()
@@ -23,43 +42,21 @@ class StopWatch:
     async def stopwatch(self) -> None:
         self.clear_line(full=True)
 
-        tempo_elapsed = 0
         previous_style = ''
         self.start_time = time.perf_counter_ns()
 
         self.set_state('solving', self.start_time)
 
-        while not self.solve_completed_event.is_set():
+        def refresh() -> None:
+            nonlocal previous_style
+
+            if self.solve_completed_event.is_set():
+                return
+
             elapsed_time = time.perf_counter_ns() - self.start_time
-            elapsed_seconds = elapsed_time / SECOND
-            new_tempo = int(elapsed_time / (SECOND * self.metronome or 1))
-
-            style = 'timer_base'
-            if elapsed_seconds > 50:
-                style = 'timer_50'
-            elif elapsed_seconds > 45:
-                style = 'timer_45'
-            elif elapsed_seconds > 40:
-                style = 'timer_40'
-            elif elapsed_seconds > 35:
-                style = 'timer_35'
-            elif elapsed_seconds > 30:
-                style = 'timer_30'
-            elif elapsed_seconds > 25:
-                style = 'timer_25'
-            elif elapsed_seconds > 20:
-                style = 'timer_20'
-            elif elapsed_seconds > 15:
-                style = 'timer_15'
-            elif elapsed_seconds > 10:
-                style = 'timer_10'
-            elif elapsed_seconds > 5:
-                style = 'timer_05'
-
-            if tempo_elapsed != new_tempo:
-                tempo_elapsed = new_tempo
-                if self.metronome:
-                    self.beep()
+            style = STYLES[
+                bisect_left(STYLES_THRESHOLDS, elapsed_time / SECOND)
+            ]
 
             if style != previous_style:
                 previous_style = style
@@ -76,6 +73,16 @@ class StopWatch:
                     end='',
                 )
 
-            await asyncio.sleep(REFRESH)
+        ticker = Ticker(self.start_time)
+        ticker.every('display', REFRESH, refresh)
+        if self.metronome:
+            ticker.every(
+                'metronome', self.metronome, self.beep,
+                offset=self.metronome,
+            )
+
+        await self.solve_completed_event.wait()
+
+        self.ticks_jitter = ticker.stop()
 
         self.set_state('stop')
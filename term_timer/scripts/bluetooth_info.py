@@ -91,22 +91,22 @@ async def consumer_cb(queue, cube_ready, gl_thread, show_cube, event_collector):
 
         for event in events:
             event_collector.append(event)
-            event_name = event['event']
+            event_name = event.name
             if event_name == 'hardware':
                 logger.info(
                     'CONSUMER: Hardware %s version %s, Software %s, %s',
-                    event['hardware_name'],
-                    event['hardware_version'],
-                    event['software_version'],
+                    event.hardware_name,
+                    event.hardware_version,
+                    event.software_version,
                     (
-                        (event['gyroscope_supported'] and 'with Gyroscope')
+                        (event.gyroscope_supported and 'with Gyroscope')
                         or 'w/o Gyroscope'
                     ),
                 )
                 hardware = (
-                    f'{ event["hardware_name"] } '
-                    f'{ event["hardware_version"] } '
-                    f'{ event["software_version"] }'
+                    f'{ event.hardware_name } '
+                    f'{ event.hardware_version } '
+                    f'{ event.software_version }'
                 )
                 if gl_thread and gl_thread.is_alive():
                     gl_thread.set_title(f'{ hardware } { battery }')
@@ -114,9 +114,9 @@ async def consumer_cb(queue, cube_ready, gl_thread, show_cube, event_collector):
             elif event_name == 'battery':
                 logger.info(
                     'CONSUMER: Battery: %s%%',
-                    event['level'],
+                    event.level,
                 )
-                battery = f'{ event["level"]}%'
+                battery = f'{ event.level}%'
                 if gl_thread and gl_thread.is_alive():
                     gl_thread.set_title(f'{ hardware } { battery }')
 
@@ -126,7 +126,7 @@ async def consumer_cb(queue, cube_ready, gl_thread, show_cube, event_collector):
                 )
                 if gl_thread and gl_thread.is_alive():
                     gl_thread.add_quaternion(
-                        event['quaternion'],
+                        event.quaternion,
                     )
             elif event_name == 'facelets':
                 logger.info(
@@ -137,29 +137,29 @@ async def consumer_cb(queue, cube_ready, gl_thread, show_cube, event_collector):
                     cube_ready.set()
 
                 if virtual_cube:
-                    if virtual_cube.state != event['facelets']:
+                    if virtual_cube.state != event.facelets:
                         logger.warning('FACELETS DESYNCHRONISED')
                 else:
-                    virtual_cube = VCube(event['facelets'])
+                    virtual_cube = VCube(event.facelets)
 
                 print_cube(virtual_cube)
 
             elif event_name == 'move':
                 logger.info(
                     'CONSUMER: Face: %s, Direction: %s, Move: %s',
-                    event['face'],
-                    event['direction'],
-                    event['move'],
+                    event.face,
+                    event.direction,
+                    event.move,
                 )
-                moves.append(event['move'])
+                moves.append(event.move)
 
                 if virtual_cube:
-                    virtual_cube.rotate(event['move'])
+                    virtual_cube.rotate(event.move)
                     print_cube(virtual_cube)
 
                 if gl_thread and gl_thread.is_alive():
-                    direction = 3 if "'" in event['move'] else 1
-                    face = event['move'][0]
+                    direction = 3 if "'" in event.move else 1
+                    face = event.move[0]
                     gl_thread.add_move(face, direction)
 
                 algo = parse_moves(moves)
@@ -178,7 +178,7 @@ async def consumer_cb(queue, cube_ready, gl_thread, show_cube, event_collector):
             else:
                 logger.info(
                     'CONSUMER: UNKNOWN\n%s',
-                    pformat(event),
+                    pformat(event.as_dict()),
                 )
 
 
@@ -205,7 +205,7 @@ async def client_cb(queue, time, use_opengl):
 
 def resume(events):
     for event in events:
-        print(pformat(event))
+        print(pformat(event.as_dict()))
 
 
 async def run(options):
@@ -8,9 +8,13 @@ from term_timer.aggregator import SolvesMethodAggregator
 from term_timer.arguments import COMMAND_RESOLUTIONS
 from term_timer.arguments import get_arguments
 from term_timer.config import DEBUG
+from term_timer.config import STATS_CONFIG
+from term_timer.exporters import Exporter
 from term_timer.importers import Importer
 from term_timer.in_out import load_all_solves
 from term_timer.in_out import load_solves
+from term_timer.in_out import load_summary
+from term_timer.in_out import rebuild_manifest
 from term_timer.interface.console import console
 from term_timer.interface.terminal import Terminal
 from term_timer.logger import configure_logging
@@ -126,9 +130,18 @@ def tools(command, options):
         options.devices,
     )
 
+    summary = None
+    if STATS_CONFIG.get('sketch') and not options.devices:
+        summary = load_summary(
+            cube,
+            options.include_sessions,
+            options.exclude_sessions,
+        )
+
     session_stats = StatisticsReporter(
         cube,
         stack,
+        summary,
     )
 
     if not session_stats.stack:
@@ -192,6 +205,23 @@ def manage(command, options):
     return 0
 
 
+def rebuild():
+    sessions = rebuild_manifest()['sessions'].values()
+
+    for entry in sessions:
+        cube = entry['cube']
+        console.print(
+            f'{ cube }x{ cube }x{ cube } session '
+            f'{ entry["session"].title() }: { entry["count"] } solves',
+        )
+
+    console.print(
+        f'[success]Manifest rebuilt[/success] with { len(sessions) } sessions.',
+    )
+
+    return 0
+
+
 def main() -> int:
     configure_logging()
 
@@ -204,10 +234,24 @@ def main() -> int:
         if command == 'train':
             return asyncio.run(trainer(options), debug=DEBUG)
         if command == 'import':
-            return Importer().import_file(options.source)
+            return Importer(
+                options.cube, options.session,
+            ).import_file(options.source)
+        if command == 'export':
+            return Exporter(
+                options.cube,
+                options.include_sessions,
+                options.exclude_sessions,
+                options.devices,
+            ).export_file(options.destination, options.format)
         if command == 'serve':
-            Server().run_server(options.host, options.port, DEBUG)
+            Server().run_server(
+                options.host, options.port, DEBUG,
+                threads=options.threads,
+            )
             return 0
+        if command == 'rebuild':
+            return rebuild()
         if command in {'edit', 'delete'}:
             return manage(command, options)
         return tools(command, options)
@@ -0,0 +1,273 @@
+import json
+from collections.abc import Callable
+
+from bottle import abort
+from bottle import request
+from bottle import response
+
+from term_timer.aggregator import AnalysisPool
+from term_timer.constants import MS_TO_NS_FACTOR
+from term_timer.formatter import format_grade
+from term_timer.server.cache import session_cache
+from term_timer.server.downsample import MIN_POINTS
+from term_timer.server.downsample import TREND_POINTS
+from term_timer.server.downsample import trend_series
+from term_timer.solve import Solve
+from term_timer.stats import Statistics
+
+API_VERSION = 1
+
+API_PREFIX = f'/api/v{ API_VERSION }'
+
+DEFAULT_LIMIT = 100
+
+MAX_LIMIT = 1000
+
+DEFAULT_WINDOWS = (5, 12)
+
+MAX_WINDOW = 1000
+
+MAX_WIDTH = 10_000
+
+SOLVE_ORDERS = ('asc', 'desc')
+
+
+def solve_score(solve: Solve) -> float | None:
+    """Score of an aggregated solve, computed by the analysis workers."""
+    if not solve.advanced or not solve.score:
+        return None
+
+    return solve.score
+
+
+def solve_grade(solve: Solve) -> str | None:
+    score = solve_score(solve)
+    if score is None:
+        return None
+
+    return format_grade(score)
+
+
+# Times are sent in milliseconds, the solves fields get their index
+SOLVE_FIELDS: dict[str, Callable[[int, Solve], object]] = {
+    'id': lambda index, _solve: index + 1,
+    'date': lambda _index, solve: solve.date,
+    'time': lambda _index, solve: solve.time // MS_TO_NS_FACTOR,
+    'final_time': lambda _index, solve: solve.final_time // MS_TO_NS_FACTOR,
+    'flag': lambda _index, solve: solve.flag,
+    'session': lambda _index, solve: solve.session,
+    'device': lambda _index, solve: solve.device,
+    'timer': lambda _index, solve: solve.timer,
+    'scramble': lambda _index, solve: str(solve.raw_scramble),
+    'moves': lambda _index, solve: solve.raw_moves or '',
+    'solve_id': lambda _index, solve: solve.solve_id,
+    'score': lambda _index, solve: round_value(solve_score(solve)),
+    'grade': lambda _index, solve: solve_grade(solve),
+}
+
+# Fields read from the method aggregation of the session
+AGGREGATED_FIELDS = ('score', 'grade')
+
+DEFAULT_FIELDS = ('id', 'date', 'time', 'flag')
+
+STATS_FIELDS = (
+    'best', 'worst', 'mean', 'median', 'stdev',
+    'bpa', 'wpa', 'mo3', 'ao5', 'ao12', 'ao100', 'ao1000',
+    'best_mo3', 'best_ao5', 'best_ao12', 'best_ao100', 'best_ao1000',
+    'total_time',
+)
+
+CASE_FIELDS = (
+    'count', 'frequency', 'probability',
+    'time', 'recognition', 'execution',
+    'ao5', 'ao12', 'qtm', 'tps', 'etps',
+)
+
+
+def render_json(data: dict, status: int = 200) -> str:
+    """
+    Compact JSON body, set on the current response
+    to keep the validators already set on it.
+    """
+    response.status = status
+    response.content_type = 'application/json'
+
+    return json.dumps(data, separators=(',', ':'))
+
+
+def query_int(name: str, default: int,
+              minimum: int = 0, maximum: int | None = None) -> int:
+    value = request.query.get(name, '').strip()
+    if not value:
+        return default
+
+    if not value.isdigit():
+        abort(400, f'Invalid { name }: { value }')
+
+    number = int(value)
+    if number < minimum or (maximum is not None and number > maximum):
+        abort(400, f'Invalid { name }: { value }')
+
+    return number
+
+
+def query_list(name: str, default: tuple[str, ...]) -> list[str]:
+    value = request.query.get(name, '')
+    values = [item.strip() for item in value.split(',') if item.strip()]
+
+    return values or list(default)
+
+
+def load_session(cube: int, session: str) -> list[Solve]:
+    solves = session_cache.load_all_solves(cube, session)
+    if not solves:
+        abort(404, 'No solve to display')
+
+    return solves
+
+
+def to_ms(value: int) -> int | None:
+    return value // MS_TO_NS_FACTOR if value > 0 else None
+
+
+def round_value(value):
+    if isinstance(value, float):
+        return round(value, 3)
+    return value
+
+
+def api_solves(cube: int, session: str, method_name: str,
+               pool: AnalysisPool | None = None,
+               cancelled: Callable[[], bool] | None = None) -> dict:
+    """
+    A page of the solves, the newest first with `order=desc`.
+
+    Scores and grades, and the solves of a case given by `step`
+    and `case_uid`, come from the cached method aggregation
+    of the session, as on the session page.
+    """
+    fields = query_list('fields', DEFAULT_FIELDS)
+    unknowns = [field for field in fields if field not in SOLVE_FIELDS]
+    if unknowns:
+        abort(400, f'Invalid fields: { ",".join(unknowns) }')
+
+    offset = query_int('offset', 0)
+    limit = query_int('limit', DEFAULT_LIMIT, 1, MAX_LIMIT)
+
+    order = request.query.get('order', 'asc').strip().lower()
+    if order not in SOLVE_ORDERS:
+        abort(400, f'Invalid order: { order }')
+
+    step = request.query.get('step', '').strip().lower()
+    case_uid = request.query.get('case_uid', '').strip().lower()
+
+    solves = load_session(cube, session)
+
+    if (step and case_uid) or set(AGGREGATED_FIELDS) & set(fields):
+        aggregation = session_cache.aggregate(
+            cube, session, method_name, solves,
+            pool=pool, cancelled=cancelled,
+        )
+        solves = aggregation.results['stack']
+
+        if step and case_uid:
+            solves = aggregation.case_solves(step, case_uid)
+
+    total = len(solves)
+    getters = [SOLVE_FIELDS[field] for field in fields]
+
+    if order == 'desc':
+        indices = range(total - 1 - offset, total - 1 - offset - limit, -1)
+    else:
+        indices = range(offset, offset + limit)
+
+    return {
+        'total': total,
+        'offset': offset,
+        'limit': limit,
+        'order': order,
+        'fields': fields,
+        'solves': [
+            [getter(index, solves[index]) for getter in getters]
+            for index in indices
+            if 0 <= index < total
+        ],
+    }
+
+
+def api_stats(cube: int, session: str) -> dict:
+    stats = Statistics(
+        load_session(cube, session),
+        session_cache.load_summary(cube, session),
+    )
+
+    return {
+        'total': stats.total,
+        **{
+            field: to_ms(getattr(stats, field))
+            for field in STATS_FIELDS
+        },
+    }
+
+
+def api_trend(cube: int, session: str) -> dict:
+    windows = []
+    for window in query_list('window', tuple(map(str, DEFAULT_WINDOWS))):
+        if not window.isdigit() or not 0 < int(window) <= MAX_WINDOW:
+            abort(400, f'Invalid window: { window }')
+        windows.append(int(window))
+
+    stats = Statistics(load_session(cube, session))
+
+    start = query_int('start', 0, 0, stats.total - 1)
+    end = query_int('end', stats.total, start + 1, stats.total)
+    width = query_int('width', TREND_POINTS, MIN_POINTS, MAX_WIDTH)
+
+    indices, times, averages = trend_series(
+        stats.table.final_time, windows, start, end, width,
+    )
+
+    return {
+        'total': stats.total,
+        'start': start,
+        'end': end,
+        'indices': [index + 1 for index in indices],
+        'times': [to_ms(solve_time) for solve_time in times],
+        'averages': {
+            f'ao{ window }': [to_ms(ao) for ao in aos]
+            for window, aos in averages.items()
+        },
+    }
+
+
+def api_cases(cube: int, session: str, method_name: str,
+              pool: AnalysisPool | None = None,
+              cancelled: Callable[[], bool] | None = None) -> dict:
+    step = request.query.get('step', '').strip()
+
+    aggregation = session_cache.aggregate(
+        cube, session, method_name,
+        load_session(cube, session),
+        pool=pool, cancelled=cancelled,
+    )
+    resume = aggregation.results['resume']
+
+    if step:
+        steps = [name for name in resume if name.lower() == step.lower()]
+        if not steps:
+            abort(404, f'Invalid step: { step }')
+    else:
+        steps = list(resume)
+
+    return {
+        'method': method_name,
+        'total': aggregation.results['total'],
+        'steps': {
+            name: {
+                case: [round_value(info[field]) for field in CASE_FIELDS]
+                for case, info in resume[name].items()
+            }
+            for name in steps
+        },
+        'fields': CASE_FIELDS,
+    }
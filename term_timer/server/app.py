@@ -1,31 +1,42 @@
-import gc
+import logging
 import os
 import re
+import select
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import timezone
+from functools import cached_property
 from http import HTTPStatus
 from wsgiref.simple_server import WSGIRequestHandler
+from wsgiref.simple_server import WSGIServer
 
-from bottle import TEMPLATE_PATH
 from bottle import Bottle
+from bottle import HTTPError
+from bottle import HTTPResponse
 from bottle import abort
-from bottle import jinja2_template
 from bottle import redirect
 from bottle import request
-from bottle import static_file
+from bottle import response
 from cubing_algs.transform.optimize import optimize_double_moves
 from cubing_algs.transform.pause import pause_moves
 from cubing_algs.transform.size import compress_moves
 from cubing_algs.transform.timing import untime_moves
+from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
+from jinja2 import FileSystemLoader
 
-from term_timer.aggregator import SolvesMethodAggregator
+from term_timer.aggregator import AnalysisCancelledError
+from term_timer.aggregator import AnalysisPool
 from term_timer.config import CUBE_METHOD
 from term_timer.config import CUBE_ORIENTATION
+from term_timer.config import SERVER_CONFIG
 from term_timer.constants import CUBE_SIZES
 from term_timer.constants import MS_TO_NS_FACTOR
 from term_timer.constants import PAUSE_FACTOR
 from term_timer.constants import SECOND
-from term_timer.constants import STATIC_DIRECTORY
+from term_timer.constants import TEMPLATES_CACHE_DIRECTORY
 from term_timer.constants import TEMPLATES_DIRECTORY
 from term_timer.formatter import format_alg_aufs
 from term_timer.formatter import format_alg_diff
@@ -35,16 +46,32 @@ from term_timer.formatter import format_alg_triggers
 from term_timer.formatter import format_duration
 from term_timer.formatter import format_grade
 from term_timer.formatter import format_time
-from term_timer.in_out import load_all_solves
-from term_timer.in_out import save_solves
+from term_timer.in_out import load_manifest
 from term_timer.interface.console import console
 from term_timer.methods.base import get_step_config
+from term_timer.server.api import API_PREFIX
+from term_timer.server.api import API_VERSION
+from term_timer.server.api import api_cases
+from term_timer.server.api import api_solves
+from term_timer.server.api import api_stats
+from term_timer.server.api import api_trend
+from term_timer.server.api import render_json
+from term_timer.server.cache import analysis_lru
+from term_timer.server.cache import session_cache
+from term_timer.server.cache import single_flight
+from term_timer.server.conditional import not_modified
+from term_timer.server.conditional import serve_static
+from term_timer.server.conditional import static_url
+from term_timer.server.downsample import TREND_POINTS
+from term_timer.server.downsample import trend_series
 from term_timer.solve import Solve
-from term_timer.stats import Statistics
 from term_timer.stats import StatisticsReporter
+from term_timer.summary import TimeSummary
 from term_timer.transform import humanize_moves
 from term_timer.transform import prettify_moves
 
+logger = logging.getLogger(__name__)
+
 SPAN_REGEX = re.compile(r'(<span[^>]*>.*?</span>)')
 BLOCK_REGEX = re.compile(r'\[([\w-]+)\](.*?)\[/([\w-]+)\]')
 
@@ -53,6 +80,11 @@ CLASS_CONVERTION = {
     'green': 'addition',
 }
 
+TREND_WINDOWS = (5, 12, 100, 1000)
+
+# Solves rendered in the page, the others are fetched from the API
+SOLVES_PAGE = 100
+
 LEGENDS = {
     'pair-ie': 'Pair insertion/extraction',
     'sexy-move': 'Sexy Move',
@@ -245,8 +277,34 @@ def optimized_step(step):
     return format_line(algorithm_string), algorithm
 
 
+def client_disconnected(environ) -> bool:
+    """
+    Check if the client closed its connection,
+    by peeking the socket of the request without blocking.
+    """
+    stream = getattr(environ.get('wsgi.input'), 'raw', None)
+    sock = getattr(stream, '_sock', None)
+
+    if sock is None:
+        return False
+
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+        if not readable:
+            return False
+
+        return not sock.recv(1, socket.MSG_PEEK)
+    except (OSError, ValueError):
+        return True
+
+
 class RichHandler(WSGIRequestHandler):
 
+    def handle(self):
+        self.start_time = time.perf_counter()
+
+        super().handle()
+
     def log_request(self, code, size):
         if isinstance(code, HTTPStatus):
             code = code.value
@@ -255,59 +313,168 @@ class RichHandler(WSGIRequestHandler):
         if int(code) > 400:
             klass = 'red'
 
+        duration = (time.perf_counter() - self.start_time) * 1000
+
         message = (
             f'[server][{ self.log_date_time_string() }][/server] '
             f'[{ klass }]{ code!s }[/{ klass }] '
             f'[result]{ self.requestline }[/result] '
-            f'[comment]{ size!s }[/comment]'
+            f'[comment]{ size!s } { duration:.1f}ms[/comment]'
         )
 
         console.print(message)
 
 
+class PooledWSGIServer(WSGIServer):
+    """
+    WSGI server handing the requests to a bounded pool of threads,
+    so a slow page does not block the static files or other tabs.
+    """
+    pool_size = 8
+
+    request_queue_size = 64
+
+    def server_activate(self):
+        super().server_activate()
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.pool_size,
+            thread_name_prefix='term-timer-server',
+        )
+
+    def process_request(self, request, client_address):
+        self.executor.submit(
+            self.process_request_thread,
+            request, client_address,
+        )
+
+    def process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # noqa: BLE001
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+
+        executor = getattr(self, 'executor', None)
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def pooled_server_class(threads):
+    if threads <= 1:
+        return WSGIServer
+
+    return type(
+        'PooledWSGIServer',
+        (PooledWSGIServer,),
+        {'pool_size': threads},
+    )
+
+
+FILTERS = {
+    'format_delta': format_delta,
+    'format_duration': format_duration,
+    'format_grade': format_grade,
+    'format_time': format_time,
+    'format_score': format_score,
+    'format_line': format_line,
+    'parse_case_name': parse_case_name,
+    'normalize_value': normalize_value,
+    'normalize_percent': normalize_percent,
+    'reconstruction_step': reconstruction_step,
+    'reconstruction_overheads': reconstruction_overheads,
+    'reconstruction_pauses': reconstruction_pauses,
+    'optimized_step': optimized_step,
+    'prettify': prettify_moves,
+}
+
+GLOBALS = {
+    'static': static_url,
+}
+
+PRECOMPILED_TEMPLATES = ('index.html', 'session.html', 'solve.html')
+
+
+def create_environment(*, debug=False, precompile=False) -> Environment:
+    """
+    Jinja2 environment shared by all the views,
+    with the compiled templates persisted between the restarts.
+    """
+    TEMPLATES_CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+
+    # Filters output HTML markup, as with the Bottle adapter
+    environment = Environment(  # noqa: S701
+        loader=FileSystemLoader(TEMPLATES_DIRECTORY),
+        bytecode_cache=FileSystemBytecodeCache(
+            str(TEMPLATES_CACHE_DIRECTORY),
+        ),
+        auto_reload=debug,
+    )
+    environment.filters.update(FILTERS)
+    environment.globals.update(GLOBALS)
+
+    if precompile:
+        start = time.perf_counter()
+        for template_name in PRECOMPILED_TEMPLATES:
+            environment.get_template(template_name)
+        logger.info(
+            'Templates precompiled in %.1fms',
+            (time.perf_counter() - start) * 1000,
+        )
+
+    return environment
+
+
 class View:
     template_name = ''
 
+    environment: Environment | None = None
+
+    def __new__(cls, *args, **kwargs):  # noqa: ARG004
+        view = super().__new__(cls)
+        view.start_time = time.perf_counter()
+
+        return view
+
     def get_context(self):
         raise NotImplementedError
 
     def as_view(self, debug):
         context = self.get_context()
+        data_time = time.perf_counter()
 
         content = self.template(
             self.template_name,
             DEBUG=debug,
             **context,
         )
-        gc.collect()
+        render_time = time.perf_counter()
+
+        data_duration = (data_time - self.start_time) * 1000
+        render_duration = (render_time - data_time) * 1000
+
+        response.set_header(
+            'Server-Timing',
+            f'data;dur={ data_duration:.1f}, '
+            f'render;dur={ render_duration:.1f}',
+        )
+        logger.info(
+            '%s: data %.1fms, render %.1fms',
+            self.template_name, data_duration, render_duration,
+        )
 
         return content
 
     def template(self, template_name, **context):
         context['now'] = datetime.now(tz=timezone.utc)  # noqa UP017
 
-        return jinja2_template(
+        return self.environment.get_template(
             template_name,
-            template_settings={
-                'filters': {
-                    'format_delta': format_delta,
-                    'format_duration': format_duration,
-                    'format_grade': format_grade,
-                    'format_time': format_time,
-                    'format_score': format_score,
-                    'format_line': format_line,
-                    'parse_case_name': parse_case_name,
-                    'normalize_value': normalize_value,
-                    'normalize_percent': normalize_percent,
-                    'reconstruction_step': reconstruction_step,
-                    'reconstruction_overheads': reconstruction_overheads,
-                    'reconstruction_pauses': reconstruction_pauses,
-                    'optimized_step': optimized_step,
-                    'prettify': prettify_moves,
-                },
-            },
-            **context,
-        )
+        ).render(**context)
 
 
 class Error404View(View):
@@ -342,37 +509,23 @@ class SessionListView(View):
     template_name = 'index.html'
 
     def get_context(self):
-        sessions = {}
-        for cube in CUBE_SIZES:
-            solves = load_all_solves(cube, [], [], '')
-            sessions[cube] = {}
-            for solve in solves:
-                sessions[cube].setdefault(
-                    solve.session, {},
-                ).setdefault(
-                    'solves', [],
-                ).append(
-                    solve,
+        sessions = {cube: {} for cube in CUBE_SIZES}
+        for entry in load_manifest()['sessions'].values():
+            if entry['count'] and entry['cube'] in sessions:
+                sessions[entry['cube']][entry['session']] = (
+                    TimeSummary.from_dict(entry['summary'])
                 )
 
         for cube in CUBE_SIZES:
-            values = sessions[cube].values()
-            for info in values:
-                info['stats'] = Statistics(info['solves'])
-
-            if len(values) > 1:
-                all_solves = []
-                for info in values:
-                    all_solves.extend(info['solves'])
-                sessions[cube]['all'] = {
-                    'solves': all_solves,
-                    'stats': Statistics(all_solves),
-                }
+            summaries = list(sessions[cube].values())
+
+            if len(summaries) > 1:
+                sessions[cube]['all'] = session_cache.summary(cube, 'all')
 
             sessions[cube] = dict(
                 sorted(
                     sessions[cube].items(),
-                    key=lambda item: len(item[1]['solves']),
+                    key=lambda item: item[1].count,
                     reverse=True,
                 ),
             )
@@ -385,15 +538,12 @@ class SessionListView(View):
 class SessionDetailView(View):
     template_name = 'session.html'
 
-    def __init__(self, cube, session, method_name, step, case_uid):
+    def __init__(self, cube, session, method_name, step, case_uid,
+                 pool=None, cancelled=None):
         self.cube = cube
         self.session = session
 
-        solves = load_all_solves(
-            cube,
-            [] if session == 'all' else [session],
-            [], '',
-        )
+        solves = session_cache.load_all_solves(cube, session)
         if not method_name:
             method_name = CUBE_METHOD
 
@@ -401,37 +551,34 @@ class SessionDetailView(View):
         self.case_uid = case_uid.strip().lower()
         self.method_name = method_name.strip().lower()
 
-        self.method_aggregation = SolvesMethodAggregator(
-            self.method_name, solves, full=True,
+        self.method_aggregation = session_cache.aggregate(
+            cube, session, self.method_name, solves,
+            pool=pool, cancelled=cancelled,
         )
 
         solves = self.method_aggregation.results['stack']
 
         if self.step and self.case_uid:
-            filtered_solves = []
-
-            for solve in solves:
-                if not solve.advanced:
-                    continue
-
-                for s_step in reversed(solve.method_applied.summary):
-                    if s_step['name'].lower() == self.step:
-                        if s_step['cases']:
-                            step_case = s_step['cases'][0].split(' ')[0].lower()
-                            if step_case == self.case_uid:
-                                filtered_solves.append(solve)
-                        break
-
-            solves = filtered_solves
+            solves = self.method_aggregation.case_solves(
+                self.step, self.case_uid,
+            )
 
         if not solves:
             abort(404, 'No solve to display')
 
+        summary = None
+        if not self.step or not self.case_uid:
+            summary = session_cache.load_summary(cube, session)
+
         self.stats = StatisticsReporter(
-            cube, solves,
+            cube, solves, summary,
         )
 
     def get_context(self):
+        return self.context
+
+    @cached_property
+    def context(self):
         return {
             'cube': self.cube,
             'session': self.session,
@@ -443,48 +590,32 @@ class SessionDetailView(View):
             'step': self.step,
             'case_uid': self.case_uid,
             'method_aggregation': self.method_aggregation,
+            'method_name': self.method_name,
+            'solves_page': SOLVES_PAGE,
+            'api_url': f'{ API_PREFIX }/{ self.cube }/{ self.session }',
         }
 
     def compute_sessions(self):
-        sessions = {}
-        for solve in self.stats.stack:
-            sessions.setdefault(solve.session, 0)
-            sessions[solve.session] += 1
-
-        return sessions
+        return self.stats.table.session_counts()
 
     def compute_trend(self):
-        ao5s = []
-        ao12s = []
-        ao100s = []
-        ao1000s = []
-        times = []
-        indices = []
-
-        stack_time = list(self.stats.stack_time)
-        for i, time in enumerate(stack_time):
-            seconds = time / SECOND
-            times.append(seconds)
-            indices.append(str(i + 1))
-
-            ao5 = self.stats.ao(5, stack_time[:i + 1])
-            ao12 = self.stats.ao(12, stack_time[:i + 1])
-            ao100 = self.stats.ao(100, stack_time[:i + 1])
-            ao1000 = self.stats.ao(1000, stack_time[:i + 1])
-
-            ao5s.append(ao5 / SECOND if ao5 > 0 else None)
-            ao12s.append(ao12 / SECOND if ao12 > 0 else None)
-            ao100s.append(ao100 / SECOND if ao100 > 0 else None)
-            ao1000s.append(ao1000 / SECOND if ao1000 > 0 else None)
+        indices, times, averages = trend_series(
+            self.stats.table.final_time, TREND_WINDOWS,
+            points=TREND_POINTS,
+        )
 
-        return {
-            'indices': indices,
-            'times': times,
-            'ao5s': ao5s,
-            'ao12s': ao12s,
-            'ao100s': ao100s,
-            'ao1000s': ao1000s,
+        trend = {
+            'indices': [index + 1 for index in indices],
+            'times': [solve_time / SECOND for solve_time in times],
+            'downsampled': len(indices) < self.stats.total,
         }
+        for limit, aos in averages.items():
+            trend[f'ao{ limit }s'] = [
+                ao / SECOND if ao > 0 else None
+                for ao in aos
+            ]
+
+        return trend
 
     def compute_distribution(self):
         dist_labels = []
@@ -500,13 +631,8 @@ class SessionDetailView(View):
 
     def compute_punchcard(self):
         punchcard = {}
-        for solve in self.stats.stack:
-            dt = solve.datetime.astimezone()
-            year = dt.strftime('%Y')
-            date = dt.strftime('%Y-%m-%d')
-
-            punchcard.setdefault(year, {}).setdefault(date, 0)
-            punchcard[year][date] += 1
+        for date, count in self.stats.table.day_counts().items():
+            punchcard.setdefault(date[:4], {})[date] = count
 
         return punchcard
 
@@ -518,22 +644,20 @@ class SolveDetailView(View):
         self.cube = cube
         self.session = session
 
-        self.solves = load_all_solves(
-            cube,
-            [] if session == 'all' else [session],
-            [], '',
-        )
+        solves, self.time_index = session_cache.indexed_solves(cube, session)
 
         self.solve_id = solve
         self.solve_index = solve - 1
         try:
-            self.solve = self.solves[self.solve_index]
+            self.solve = solves[self.solve_index]
         except IndexError:
             abort(404, 'Invalid solve ID')
 
+        analysis_lru.touch(self.solve)
+
         method_name = method_name.strip().lower()
         if method_name:
-            self.solve.method_name = method_name
+            self.solve = self.solve.for_method(method_name)
 
     def get_context(self):
         tps = []
@@ -541,9 +665,6 @@ class SolveDetailView(View):
         scatter = []
         recognitions = []
 
-        ranks = sorted([s.final_time for s in self.solves])
-        rank = ranks.index(self.solve.final_time) + 1
-
         if self.solve.advanced:
             scatter = [
                 {
@@ -606,7 +727,7 @@ class SolveDetailView(View):
             'session': self.session,
             'solve': self.solve,
             'solve_id': self.solve_id,
-            'solves': self.solves,
+            'total': len(self.time_index),
             'scatter': scatter,
             'steps': steps,
             'tps': tps,
@@ -615,7 +736,10 @@ class SolveDetailView(View):
             'reconstruction_text': reconstruction_text,
             'reconstruction_timing': self.solve.reconstruction_steps_timing,
             'reconstruction_index': step_index,
-            'rank': rank,
+            'rank': self.time_index.rank(self.solve),
+            'percentile': self.time_index.percentile(self.solve),
+            'faster_id': self.time_index.faster(self.solve),
+            'slower_id': self.time_index.slower(self.solve),
         }
 
 
@@ -627,11 +751,7 @@ class SolveUpdateView:
         self.solve_id = solve_id
         self.flag = flag
 
-        self.solves = load_all_solves(
-            cube,
-            [] if session == 'all' else [session],
-            [], '',
-        )
+        self.solves = session_cache.load_all_solves(cube, session)
 
         self.solve_index = solve_id - 1
         try:
@@ -639,8 +759,12 @@ class SolveUpdateView:
         except IndexError:
             abort(404, 'Invalid solve ID')
 
-        self.solves[self.solve_index].flag = flag
-        save_solves(cube, session, self.solves)
+        previous_time = self.solve.final_time
+        self.solve.flag = flag
+        session_cache.save(
+            cube, session, self.solves,
+            edited=(self.solve, previous_time),
+        )
 
         redirect(f'/{ cube }/{ session }/{ solve_id }/')
 
@@ -652,11 +776,7 @@ class SolveDeleteView:
         self.session = session
         self.solve_id = solve_id
 
-        self.solves = load_all_solves(
-            cube,
-            [] if session == 'all' else [session],
-            [], '',
-        )
+        self.solves = session_cache.load_all_solves(cube, session)
 
         self.solve_index = solve_id - 1
         try:
@@ -665,18 +785,26 @@ class SolveDeleteView:
             abort(404, 'Invalid solve ID')
 
         self.solves.pop(self.solve_index)
-        save_solves(cube, session, self.solves)
+        session_cache.save(
+            cube, session, self.solves,
+            deleted=self.solve,
+        )
 
         redirect(f'/{ cube }/{ session }/')
 
 
 class Server:
 
-    def run_server(self, host, port, debug):
-        TEMPLATE_PATH.insert(0, TEMPLATES_DIRECTORY)
+    def __init__(self):
+        self.analysis_pool = AnalysisPool(SERVER_CONFIG.get('workers'))
 
+    def run_server(self, host, port, debug, threads=1):
         app = self.create_app(debug)
 
+        # With the reloader the parent process only watches the files
+        if not debug or os.getenv('BOTTLE_CHILD'):
+            self.analysis_pool.start()
+
         if not os.getenv('BOTTLE_CHILD'):
             console.print(
                 '[server]Term Timer server is listening on [/server]'
@@ -685,25 +813,35 @@ class Server:
             )
             console.print('Hit Ctrl-C to quit.', style='comment')
 
-        app.run(
-            host=host,
-            port=port,
-            quiet=True,
-            reloader=debug,
-            debug=debug,
-            server='wsgiref',
-            handler_class=RichHandler,
-        )
+        try:
+            app.run(
+                host=host,
+                port=port,
+                quiet=True,
+                reloader=debug,
+                debug=debug,
+                server='wsgiref',
+                handler_class=RichHandler,
+                server_class=pooled_server_class(threads),
+            )
+        finally:
+            self.analysis_pool.close()
 
     def create_app(self, debug):
         app = Bottle()
 
+        View.environment = create_environment(
+            debug=debug,
+            precompile=SERVER_CONFIG.get('precompile', True),
+        )
+
         @app.hook('before_request')
         def add_trailing_slash():
             path = request.environ.get('PATH_INFO', '')
 
             if (
                     path != '/'
+                    and not path.startswith(API_PREFIX)
                     and not path.endswith('/')
                     and '.' not in path.split('/')[-1]
             ):
@@ -712,6 +850,15 @@ class Server:
 
         @app.route('/')
         def session_list():
+            version = tuple(
+                signature
+                for cube in CUBE_SIZES
+                for signature in session_cache.version(cube, 'all')
+            )
+            cached = not_modified(version, 'index')
+            if cached:
+                return cached
+
             return SessionListView().as_view(debug)
 
         @app.route('/<cube:int>/<session:path>/<solve:int>/update/',
@@ -731,6 +878,13 @@ class Server:
 
         @app.route('/<cube:int>/<session:path>/<solve:int>/')
         def solve_detail(cube, session, solve):
+            cached = not_modified(
+                session_cache.version(cube, session),
+                'solve', cube, session, solve,
+            )
+            if cached:
+                return cached
+
             return SolveDetailView(
                 cube, session, solve,
                 request.GET.m or '',
@@ -738,16 +892,107 @@ class Server:
 
         @app.route('/<cube:int>/<session:path>/')
         def session_detail(cube, session):
-            return SessionDetailView(
+            cached = not_modified(
+                session_cache.version(cube, session),
+                'session', cube, session,
+            )
+            if cached:
+                return cached
+
+            environ = request.environ
+            method_name = request.GET.m or ''
+            step = request.GET.step or ''
+            case_uid = request.GET.case_uid or ''
+
+            def build_view():
+                view = SessionDetailView(
+                    cube, session,
+                    method_name, step, case_uid,
+                    pool=self.analysis_pool,
+                    cancelled=lambda: client_disconnected(environ),
+                )
+                view.get_context()
+                return view
+
+            key = (
                 cube, session,
-                request.GET.m or '',
-                request.GET.step or '',
-                request.GET.case_uid or '',
-            ).as_view(debug)
+                (method_name or CUBE_METHOD).strip().lower(),
+                step.strip().lower(),
+                case_uid.strip().lower(),
+                session_cache.version(cube, session),
+            )
+
+            try:
+                view = single_flight.do('session', key, build_view)
+            except AnalysisCancelledError:
+                logger.info('Analysis cancelled: %s', request.path)
+                return HTTPResponse(status=499)
+
+            return view.as_view(debug)
+
+        def api_view(name, cube, session, builder):
+            cached = not_modified(
+                session_cache.version(cube, session),
+                'api', name, cube, session,
+            )
+            if cached:
+                return cached
+
+            try:
+                data = builder()
+            except HTTPError as error:
+                return render_json({'error': error.body}, error.status_code)
+            except AnalysisCancelledError:
+                logger.info('Analysis cancelled: %s', request.path)
+                return HTTPResponse(status=499)
+
+            return render_json({'version': API_VERSION, **data})
+
+        @app.route(f'{ API_PREFIX }/<cube:int>/<session:path>/solves')
+        def api_session_solves(cube, session):
+            environ = request.environ
+            method_name = (request.GET.m or CUBE_METHOD).strip().lower()
+
+            return api_view(
+                'solves', cube, session,
+                lambda: api_solves(
+                    cube, session, method_name,
+                    pool=self.analysis_pool,
+                    cancelled=lambda: client_disconnected(environ),
+                ),
+            )
+
+        @app.route(f'{ API_PREFIX }/<cube:int>/<session:path>/stats')
+        def api_session_stats(cube, session):
+            return api_view(
+                'stats', cube, session,
+                lambda: api_stats(cube, session),
+            )
+
+        @app.route(f'{ API_PREFIX }/<cube:int>/<session:path>/trend')
+        def api_session_trend(cube, session):
+            return api_view(
+                'trend', cube, session,
+                lambda: api_trend(cube, session),
+            )
+
+        @app.route(f'{ API_PREFIX }/<cube:int>/<session:path>/cases')
+        def api_session_cases(cube, session):
+            environ = request.environ
+            method_name = (request.GET.m or CUBE_METHOD).strip().lower()
+
+            return api_view(
+                'cases', cube, session,
+                lambda: api_cases(
+                    cube, session, method_name,
+                    pool=self.analysis_pool,
+                    cancelled=lambda: client_disconnected(environ),
+                ),
+            )
 
         @app.route('/static/<filepath:path>')
         def static_serve(filepath):
-            return static_file(filepath, root=STATIC_DIRECTORY)
+            return serve_static(filepath)
 
         @app.error(404)
         def error_404(error):
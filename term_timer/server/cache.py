@@ -0,0 +1,304 @@
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+from term_timer.aggregator import AnalysisCancelledError
+from term_timer.aggregator import AnalysisPool
+from term_timer.aggregator import SolvesMethodAggregator
+from term_timer.config import SERVER_CONFIG
+from term_timer.config import STATS_CONFIG
+from term_timer.in_out import Signature
+from term_timer.in_out import file_signature
+from term_timer.in_out import list_sessions
+from term_timer.in_out import load_all_solves
+from term_timer.in_out import load_solves
+from term_timer.in_out import load_summary
+from term_timer.in_out import save_solves
+from term_timer.in_out import session_path
+from term_timer.solve import Solve
+from term_timer.summary import TimeSummary
+from term_timer.time_index import TimeIndex
+
+logger = logging.getLogger(__name__)
+
+
+class Flight:
+    __slots__ = ('done', 'error', 'result')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+        self.result: Any = None
+
+
+class SingleFlight:
+    """
+    Run at most one computation per key at a time,
+    concurrent callers for the same key wait for it and share its result.
+
+    A computation cancelled because its own client went away
+    is run again by the next waiting caller.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights: dict[Hashable, Flight] = {}
+        self.counters: dict[str, dict[str, int]] = {}
+
+    def count(self, name: str, counter: str) -> None:
+        counters = self.counters.setdefault(
+            name, {'executed': 0, 'coalesced': 0},
+        )
+        counters[counter] += 1
+
+    def do(self, name: str, key: Hashable, func: Callable[[], Any]) -> Any:
+        key = (name, key)
+
+        while True:
+            with self.lock:
+                flight = self.flights.get(key)
+                if flight is None:
+                    leading = Flight()
+                    self.flights[key] = leading
+                else:
+                    self.count(name, 'coalesced')
+
+            if flight is None:
+                return self.lead(name, key, leading, func)
+
+            flight.done.wait()
+
+            if isinstance(flight.error, AnalysisCancelledError):
+                continue
+
+            logger.info(
+                'Single-flight %s: %d executed, %d coalesced',
+                name,
+                self.counters[name]['executed'],
+                self.counters[name]['coalesced'],
+            )
+            if flight.error is not None:
+                raise flight.error
+
+            return flight.result
+
+    def lead(self, name: str, key: Hashable, flight: Flight,
+             func: Callable[[], Any]) -> Any:
+        try:
+            flight.result = func()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+                self.count(name, 'executed')
+            flight.done.set()
+
+        return flight.result
+
+
+single_flight = SingleFlight()
+
+
+class AnalysisLRU:
+    """
+    Bound the number of solves keeping their analysis cached,
+    releasing the analysis of the least recently viewed ones.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.lock = threading.Lock()
+        self.solves: OrderedDict[int, Solve] = OrderedDict()
+
+    def touch(self, solve: Solve) -> None:
+        key = id(solve)
+
+        with self.lock:
+            self.solves[key] = solve
+            self.solves.move_to_end(key)
+
+            while len(self.solves) > self.size:
+                _, oldest = self.solves.popitem(last=False)
+                oldest.release_analysis()
+
+
+analysis_lru = AnalysisLRU(SERVER_CONFIG.get('analysed_solves', 64))
+
+
+class SessionCache:
+    """
+    In-process cache of the parsed solves and their method aggregations.
+
+    Entries are validated against the (mtime, size) of the session files,
+    so files edited outside the server are reloaded on the next request.
+    """
+
+    def __init__(self):
+        self.files: dict[Path, tuple[Signature, list[Solve]]] = {}
+        self.aggregations: dict[
+            tuple[int, str, str],
+            tuple[tuple, SolvesMethodAggregator],
+        ] = {}
+        self.indexes: dict[
+            tuple[int, str],
+            tuple[tuple, list[Solve], TimeIndex],
+        ] = {}
+        self.summaries: dict[tuple[int, str], tuple[tuple, TimeSummary]] = {}
+
+    def load_solves(self, cube: int, session: str) -> list[Solve]:
+        path = session_path(cube, session)
+        signature = file_signature(path)
+
+        if signature is None:
+            self.files.pop(path, None)
+            return []
+
+        cached = self.files.get(path)
+        if cached is None or cached[0] != signature:
+            logger.info('Loading %s', path.name)
+            cached = (signature, load_solves(cube, session))
+            self.files[path] = cached
+
+        return list(cached[1])
+
+    def load_all_solves(self, cube: int, session: str) -> list[Solve]:
+        return load_all_solves(
+            cube,
+            [] if session == 'all' else [session],
+            [], [],
+            loader=self.load_solves,
+        )
+
+    def summary(self, cube: int, session: str) -> TimeSummary:
+        """
+        Summary of the session from the manifest, kept while its files
+        are unchanged, as the overlapping sessions are loaded to merge.
+        """
+        key = (cube, session)
+        version = self.version(cube, session)
+
+        cached = self.summaries.get(key)
+        if cached is None or cached[0] != version:
+            cached = (
+                version,
+                load_summary(cube, [] if session == 'all' else [session], []),
+            )
+            self.summaries[key] = cached
+
+        return cached[1]
+
+    def load_summary(self, cube: int, session: str) -> TimeSummary | None:
+        """Summary of the session when the statistics use the sketches."""
+        if not STATS_CONFIG.get('sketch'):
+            return None
+
+        return self.summary(cube, session)
+
+    def version(self, cube: int, session: str) -> tuple:
+        sessions = list_sessions(cube) if session == 'all' else [session]
+
+        return tuple(
+            (name, file_signature(session_path(cube, name)))
+            for name in sessions
+        )
+
+    def aggregate(self, cube: int, session: str, method_name: str,
+                  solves: list[Solve],
+                  pool: AnalysisPool | None = None,
+                  cancelled: Callable[[], bool] | None = None,
+                  ) -> SolvesMethodAggregator:
+        key = (cube, session, method_name)
+        version = self.version(cube, session)
+
+        cached = self.aggregations.get(key)
+        if cached is None or cached[0] != version:
+            aggregation = single_flight.do(
+                'aggregate', (*key, version),
+                lambda: SolvesMethodAggregator(
+                    method_name, solves, full=True,
+                    pool=pool, cancelled=cancelled,
+                ),
+            )
+            cached = (version, aggregation)
+            self.aggregations[key] = cached
+
+        return cached[1]
+
+    def indexed_solves(self, cube: int,
+                       session: str) -> tuple[list[Solve], TimeIndex]:
+        """Solves of the session with their time index, both shared."""
+        key = (cube, session)
+        version = self.version(cube, session)
+
+        cached = self.indexes.get(key)
+        if cached is None or cached[0] != version:
+            solves = self.load_all_solves(cube, session)
+            cached = (version, solves, TimeIndex(solves))
+            self.indexes[key] = cached
+
+        return cached[1], cached[2]
+
+    def save(self, cube: int, session: str, solves: list[Solve],
+             *, edited: tuple[Solve, int] | None = None,
+             deleted: Solve | None = None) -> None:
+        """
+        Save the solves of a session edited by the server.
+
+        The saved solves and the time index follow the edition,
+        given as the edited solve with its previous final time
+        or the deleted solve, instead of being reloaded and rebuilt.
+        The solves are numbered again, as they are found by position.
+        """
+        key = (cube, session)
+        version = self.version(cube, session)
+        cached = self.indexes.get(key)
+
+        save_solves(cube, session, solves)
+        self.invalidate(cube, session)
+
+        version_saved = self.version(cube, session)
+
+        if session != 'all':
+            for i, solve in enumerate(solves):
+                solve.solve_id = i + 1
+
+            path = session_path(cube, session)
+            self.files[path] = (file_signature(path), list(solves))
+
+        if cached is not None and cached[0] == version:
+            index = cached[2]
+            if edited is not None:
+                index.update(*edited)
+            if deleted is not None:
+                index.remove(deleted)
+
+            self.indexes[key] = (
+                version_saved, list(solves), index,
+            )
+
+    def invalidate(self, cube: int, session: str) -> None:
+        self.files.pop(session_path(cube, session), None)
+
+        for aggregation_key in list(self.aggregations):
+            if (
+                    aggregation_key[0] == cube
+                    and aggregation_key[1] in {session, 'all'}
+            ):
+                del self.aggregations[aggregation_key]
+
+        for index_key in list(self.indexes):
+            if index_key[0] == cube and index_key[1] in {session, 'all'}:
+                del self.indexes[index_key]
+
+        for summary_key in list(self.summaries):
+            if summary_key[0] == cube and summary_key[1] in {session, 'all'}:
+                del self.summaries[summary_key]
+
+
+session_cache = SessionCache()
@@ -0,0 +1,123 @@
+import hashlib
+import time
+from datetime import date
+from email.utils import formatdate
+from functools import cache
+from pathlib import Path
+
+from bottle import HTTPResponse
+from bottle import request
+from bottle import response
+from bottle import static_file
+
+from term_timer import __version__
+from term_timer.config import CUBE_METHOD
+from term_timer.config import CUBE_ORIENTATION
+from term_timer.constants import STATIC_DIRECTORY
+
+BOOT_TOKEN = str(time.time_ns())
+
+STATIC_MAX_AGE = 365 * 24 * 3600
+
+STATIC_HASH_LENGTH = 12
+
+
+def view_etag(version: tuple, *parts) -> str:
+    """
+    Version token of a page, from the signatures of its session files,
+    the request parameters and what else changes the rendering.
+    """
+    token = repr(
+        (
+            version, parts,
+            sorted(request.query.allitems()),
+            CUBE_METHOD, str(CUBE_ORIENTATION),
+            __version__, BOOT_TOKEN, date.today().isoformat(),  # noqa: DTZ011
+        ),
+    )
+
+    return hashlib.sha1(token.encode(), usedforsecurity=False).hexdigest()
+
+
+def last_modified(version: tuple) -> float | None:
+    mtimes = [
+        signature[0]
+        for _, signature in version
+        if signature is not None
+    ]
+    if not mtimes:
+        return None
+
+    return max(mtimes) / 1_000_000_000
+
+
+def not_modified(version: tuple, *parts) -> HTTPResponse | None:
+    """
+    Set the validators of the response and return a 304 response
+    if the client already has this version of the page.
+    """
+    etag = f'"{ view_etag(version, *parts) }"'
+    headers = {
+        'ETag': etag,
+        'Cache-Control': 'no-cache',
+    }
+
+    modified = last_modified(version)
+    if modified is not None:
+        headers['Last-Modified'] = formatdate(modified, usegmt=True)
+
+    for name, value in headers.items():
+        response.set_header(name, value)
+
+    if_none_match = request.get_header('If-None-Match', '')
+    if if_none_match and (
+            if_none_match.strip() == '*'
+            or etag in [tag.strip() for tag in if_none_match.split(',')]
+    ):
+        return HTTPResponse(status=304, headers=headers)
+
+    return None
+
+
+@cache
+def file_hash(path: Path, mtime_ns: int, size: int) -> str:  # noqa: ARG001
+    return hashlib.sha256(
+        path.read_bytes(),
+    ).hexdigest()[:STATIC_HASH_LENGTH]
+
+
+def static_hash(filepath: str) -> str:
+    path = STATIC_DIRECTORY / filepath
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return ''
+
+    return file_hash(path, stat.st_mtime_ns, stat.st_size)
+
+
+def static_url(filepath: str) -> str:
+    """URL of a static file, busted by the hash of its content."""
+    content_hash = static_hash(filepath)
+
+    if not content_hash:
+        return f'/static/{ filepath }'
+
+    return f'/static/{ filepath }?v={ content_hash }'
+
+
+def serve_static(filepath: str):
+    served = static_file(filepath, root=STATIC_DIRECTORY)
+
+    if served.status_code == 200:
+        version = request.query.v
+        if version and version == static_hash(filepath):
+            served.set_header(
+                'Cache-Control',
+                f'public, max-age={ STATIC_MAX_AGE }, immutable',
+            )
+        else:
+            served.set_header('Cache-Control', 'no-cache')
+
+    return served
@@ -0,0 +1,95 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from term_timer.solve_table import Times
+from term_timer.stats import StatisticsTools
+
+TREND_POINTS = 1000
+
+MIN_POINTS = 3
+
+
+def lttb(values: Times, threshold: int) -> list[int]:
+    """
+    Indices of the points kept by the Largest-Triangle-Three-Buckets
+    downsampling of `values`, plotted against their index.
+
+    The first and last points are always kept, each bucket in between
+    keeps the point forming the largest triangle with the point kept
+    in the previous bucket and the average of the next bucket,
+    so peaks and drops survive the downsampling.
+    Null values, the DNFs, are never preferred over a time.
+    """
+    length = len(values)
+    if threshold >= length or threshold < MIN_POINTS:
+        return list(range(length))
+
+    y = np.array(values, dtype=float)
+    x = np.arange(length, dtype=float)
+    valid = y > 0
+
+    # DNFs take the previous time so they do not distort the triangles
+    previous = np.maximum.accumulate(np.where(valid, np.arange(length), 0))
+    y = y[previous]
+
+    bucket_size = (length - 2) / (threshold - 2)
+    edges = [int(i * bucket_size) + 1 for i in range(threshold - 1)]
+    edges[-1] = length - 1
+
+    indices = [0]
+    selected = 0
+
+    for bucket, start in enumerate(edges[:-1]):
+        end = edges[bucket + 1]
+
+        if bucket + 2 < len(edges):
+            next_x = x[end:edges[bucket + 2]].mean()
+            next_y = y[end:edges[bucket + 2]].mean()
+        else:
+            next_x = x[-1]
+            next_y = y[-1]
+
+        areas = np.abs(
+            (x[selected] - next_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (next_y - y[selected]),
+        )
+        areas[~valid[start:end]] = -1
+
+        selected = start + int(np.argmax(areas))
+        indices.append(selected)
+
+    indices.append(length - 1)
+
+    return indices
+
+
+def trend_series(stack_time: Times, windows: Sequence[int],
+                 start: int = 0, end: int | None = None,
+                 points: int | None = None,
+                 ) -> tuple[list[int], list[int], dict[int, list[int]]]:
+    """
+    Solve indices, times and averages of a window of the solves,
+    downsampled to about `points` points.
+
+    Averages are only computed at the kept indices,
+    from the solves preceding them, even outside the window.
+    """
+    if end is None:
+        end = len(stack_time)
+
+    window_time = stack_time[start:end]
+
+    indices = [
+        start + index
+        for index in lttb(window_time, points or len(window_time))
+    ]
+
+    return (
+        indices,
+        np.asarray(stack_time)[indices].tolist(),
+        {
+            window: StatisticsTools.rolling_ao(window, stack_time, indices)
+            for window in windows
+        },
+    )
@@ -1,6 +1,8 @@
+from collections.abc import Callable
 from datetime import datetime
 from datetime import timezone
-from functools import cached_property
+from sys import intern
+from typing import Any
 
 import plotext as plt
 from cubing_algs.algorithm import Algorithm
@@ -37,8 +39,89 @@ from term_timer.methods.base import get_step_config
 from term_timer.transform import prettify_moves
 from term_timer.transform import reorient_moves
 
+MISSING = object()
+
+
+class CachedProperty:
+    """
+    Property computed once and kept in the cache of the instance,
+    a dict allocated on the first cached value,
+    as `cached_property` needs an instance dict.
+    """
+
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+
+        cache = instance.cache
+        if cache is None:
+            cache = instance.cache = {}
+
+        value = cache.get(self.name, MISSING)
+        if value is MISSING:
+            value = cache[self.name] = self.func(instance)
+
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        if instance.cache is None:
+            instance.cache = {}
+
+        instance.cache[self.name] = value
+
+    def __delete__(self, instance: Any) -> None:
+        if instance.cache is not None:
+            instance.cache.pop(self.name, None)
+
 
 class Solve:
+    """
+    A recorded solve.
+
+    The saved fields live in slots and the repeated labels are interned.
+    The cached properties are kept in a single cache slot,
+    allocated only once a property is cached, so the solves
+    have no instance dict.
+    """
+    __slots__ = (
+        'cache',
+        'cube_size',
+        'date',
+        'device',
+        'flag',
+        'method_name',
+        'orientation',
+        'raw_moves',
+        'raw_scramble',
+        'session',
+        'solve_id',
+        'time',
+        'timer',
+    )
+
+    analysis_cache = (
+        'datetime',
+        'link_alg_cubing',
+        'link_cube_db',
+        'method_applied',
+        'method_line',
+        'method_text',
+        'move_times',
+        'reconstruction',
+        'reconstruction_steps_timing',
+        'report_line',
+        'scramble',
+        'solution',
+        'trainer_line',
+    )
+
     def __init__(self,
                  date: int, time: int,
                  scramble: Algorithm | str,
@@ -51,11 +134,11 @@ class Solve:
                  moves: str | None = None):
         self.date = int(date)
         self.time = int(time)
-        self.flag = flag
-        self.timer = timer
-        self.device = device
+        self.flag = intern(flag or '')
+        self.timer = intern(timer or '')
+        self.device = intern(device or '')
 
-        self.session = session or 'default'
+        self.session = intern(session or 'default')
         self.solve_id = solve_id
         self.cube_size = cube_size
 
@@ -65,23 +148,25 @@ class Solve:
         self.method_name = CUBE_METHOD
         self.orientation = CUBE_ORIENTATION
 
-    @cached_property
+        self.cache: dict[str, Any] | None = None
+
+    @CachedProperty
     def solution(self):
         return parse_moves(self.raw_moves)
 
-    @cached_property
+    @CachedProperty
     def scramble(self):
         if not isinstance(self.raw_scramble, Algorithm):
             return parse_moves(self.raw_scramble)
         return self.raw_scramble
 
-    @cached_property
+    @CachedProperty
     def datetime(self) -> datetime:
         return datetime.fromtimestamp(
             self.date, tz=timezone.utc,  # noqa: UP017
         )
 
-    @cached_property
+    @property
     def final_time(self) -> int:
         if self.flag == PLUS_TWO:
             return self.time + (2 * SECOND)
@@ -90,11 +175,11 @@ class Solve:
 
         return self.time
 
-    @cached_property
+    @CachedProperty
     def move_times(self) -> list[list[str | int]]:
         return [[m.untimed, m.timed] for m in self.solution]
 
-    @cached_property
+    @property
     def advanced(self):
         return bool(self.raw_moves)
 
@@ -105,17 +190,17 @@ class Solve:
 
         return moves / (time / SECOND)
 
-    @cached_property
+    @CachedProperty
     def reconstruction(self) -> list[str]:
         return prettify_moves(
             reorient_moves(self.orientation, self.solution),
         )
 
-    @cached_property
+    @CachedProperty
     def tps(self) -> float:
         return self.compute_tps(len(self.solution), self.time)
 
-    @cached_property
+    @CachedProperty
     def aufs(self) -> int:
         return sum(
             (s['aufs'][0] or 0) + (s['aufs'][1] or 0)
@@ -123,11 +208,11 @@ class Solve:
             if s['type'] != 'virtual'
         )
 
-    @cached_property
+    @CachedProperty
     def all_missed_moves(self) -> int:
         return self.missed_moves(self.solution)
 
-    @cached_property
+    @CachedProperty
     def step_missed_moves(self) -> int:
         return sum(
             self.missed_moves(s['moves'])
@@ -135,7 +220,7 @@ class Solve:
             if s['type'] != 'virtual'
         )
 
-    @cached_property
+    @CachedProperty
     def step_pauses(self) -> int:
         return sum(
             self.pauses(s['moves'])
@@ -143,32 +228,32 @@ class Solve:
             if s['type'] != 'virtual'
         )
 
-    @cached_property
+    @property
     def execution_pauses(self) -> int:
         return self.step_pauses
 
-    @cached_property
+    @property
     def execution_missed_moves(self) -> int:
         return self.step_missed_moves
 
-    @cached_property
+    @property
     def transition_missed_moves(self) -> int:
         return self.all_missed_moves - self.step_missed_moves
 
-    @cached_property
+    @property
     def method_analyser(self):
         return get_method_analyser(
             self.method_name,
         )
 
-    @cached_property
+    @CachedProperty
     def method_applied(self) -> dict[str, dict]:
         if not self.advanced:
             return None
 
         return self.method_analyser(self.scramble, self.solution)
 
-    @cached_property
+    @CachedProperty
     def recognition_time(self) -> float:
         return sum(
             s['recognition']
@@ -176,7 +261,7 @@ class Solve:
             if s['type'] != 'virtual'
         )
 
-    @cached_property
+    @CachedProperty
     def execution_time(self) -> float:
         return sum(
             s['execution']
@@ -184,15 +269,15 @@ class Solve:
             if s['type'] != 'virtual'
         )
 
-    @cached_property
+    @property
     def move_speed(self) -> float:
         return self.execution_time / len(self.solution)
 
-    @cached_property
+    @property
     def pause_threshold(self) -> float:
         return self.move_speed * PAUSE_FACTOR
 
-    @cached_property
+    @CachedProperty
     def report_line(self) -> str:
         if not self.advanced:
             return ''
@@ -235,7 +320,7 @@ class Solve:
             f'{ missed_line }{ pause_line }{ grade_line }'
         )
 
-    @cached_property
+    @CachedProperty
     def trainer_line(self) -> str:
         if not self.advanced:
             return ''
@@ -269,7 +354,7 @@ class Solve:
             f'{ missed_line }{ pause_line }'
         )
 
-    @cached_property
+    @CachedProperty
     def method_line(self) -> str:
         if not self.method_applied:
             return ''
@@ -442,7 +527,7 @@ class Solve:
 
         return str(source_paused)
 
-    @cached_property
+    @CachedProperty
     def method_text(self):
         return self.method_text_builder(multiple=True)
 
@@ -612,7 +697,7 @@ class Solve:
 
         return pauses
 
-    @cached_property
+    @CachedProperty
     def score(self) -> float:
         if not self.method_applied:
             return None
@@ -627,7 +712,7 @@ class Solve:
 
         return min(max(0, final_score), 20)
 
-    @cached_property
+    @CachedProperty
     def link_alg_cubing(self) -> str:
         date = self.datetime.astimezone().strftime('%Y-%m-%d %H:%M')
 
@@ -637,7 +722,7 @@ class Solve:
             self.method_text,
         )
 
-    @cached_property
+    @CachedProperty
     def link_cube_db(self) -> str:
         date = self.datetime.astimezone().strftime('%Y-%m-%d %H:%M')
 
@@ -647,7 +732,7 @@ class Solve:
             self.method_text,
         )
 
-    @cached_property
+    @property
     def link_term_timer(self) -> str:
         domain = SERVER_CONFIG.get('domain', 'localhost')
         port = SERVER_CONFIG.get('port', 8333)
@@ -657,7 +742,7 @@ class Solve:
             f'/{ self.cube_size }/{ self.session }/{ self.solve_id }/'
         )
 
-    @cached_property
+    @CachedProperty
     def reconstruction_steps_timing(self):
         if not self.advanced:
             return []
@@ -709,6 +794,39 @@ class Solve:
 
         return timing
 
+    def release_analysis(self) -> None:
+        """
+        Drop the parsed moves and the method analysis cached on the solve,
+        computed again when next used, keeping the scalar results
+        such as the score.
+        """
+        if self.cache is None:
+            return
+
+        for name in self.analysis_cache:
+            self.cache.pop(name, None)
+
+        if not self.cache:
+            self.cache = None
+
+    def for_method(self, method_name: str) -> 'Solve':
+        """
+        Solve to analyse with another method,
+        leaving the analysis cached on this one untouched.
+        """
+        if method_name == self.method_name:
+            return self
+
+        solve = Solve(
+            **self.as_save,
+            session=self.session,
+            solve_id=self.solve_id,
+            cube_size=self.cube_size,
+        )
+        solve.method_name = method_name
+
+        return solve
+
     @property
     def as_save(self) -> dict:
         return {
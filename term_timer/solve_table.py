@@ -0,0 +1,149 @@
+from collections.abc import Iterable
+from collections.abc import Sequence
+from datetime import datetime
+from datetime import timezone
+from functools import cached_property
+
+import numpy as np
+
+from term_timer.constants import DNF
+from term_timer.constants import PLUS_TWO
+from term_timer.constants import SECOND
+from term_timer.solve import Solve
+
+FLAG_CODES = {'': 0, PLUS_TWO: 1, DNF: 2}
+
+PLUS_TWO_CODE = FLAG_CODES[PLUS_TWO]
+
+DNF_CODE = FLAG_CODES[DNF]
+
+# Every UTC offset and every DST change falls on a quarter hour,
+# so all the solves of a quarter share the same local day
+QUARTER = 15 * 60
+
+ROLLING_CHUNK = 1_000_000
+
+Times = Sequence[int] | np.ndarray
+
+
+def labels_column(values: list[str]) -> tuple[list[str], np.ndarray]:
+    """Distinct labels in order of appearance, and the id of each value."""
+    ids: dict[str, int] = {}
+    column = np.fromiter(
+        (ids.setdefault(value, len(ids)) for value in values),
+        dtype=np.int32, count=len(values),
+    )
+
+    return list(ids), column
+
+
+def rolling_ao(limit: int, stack_elapsed: Times,
+               indices: Iterable[int] | None = None) -> list[int]:
+    """
+    Average of `limit` ending at each solve, or only at the solves
+    in `indices`, -1 while there are too few solves.
+
+    Same results as `StatisticsTools.ao` on each window, with the windows sorted
+    by chunks in NumPy instead of one by one.
+    """
+    if indices is None:
+        indices = range(len(stack_elapsed))
+
+    ends = np.fromiter(indices, dtype=np.int64)
+    aos = np.full(len(ends), -1, dtype=np.int64)
+
+    full = np.flatnonzero(ends + 1 >= limit)
+    if not len(full):
+        return aos.tolist()
+
+    times = np.asarray(stack_elapsed, dtype=np.int64)
+    cap = int(np.ceil(limit * 5 / 100))
+    offsets = np.arange(1 - limit, 1)
+    chunk = max(1, ROLLING_CHUNK // limit)
+
+    for start in range(0, len(full), chunk):
+        rows = full[start:start + chunk]
+
+        windows = times[ends[rows, None] + offsets]
+        windows.sort(axis=1)
+        trimmed = windows[:, cap:limit - cap]
+
+        # Sums of times in ns are exact, as in `StatisticsTools.ao`
+        aos[rows] = trimmed.sum(axis=1) / trimmed.shape[1]
+
+    return aos.tolist()
+
+
+class SolveTable:
+    """
+    Columns of a list of solves as NumPy arrays, built in one pass,
+    for the statistics to be computed vectorised.
+
+    Sessions and devices are stored as ids into their label lists.
+    The solves are kept as they are for their moves,
+    only parsed when a solve is displayed or analysed.
+    """
+
+    def __init__(self, solves: list[Solve]):
+        self.solves = solves
+
+        size = len(solves)
+
+        self.date = np.fromiter(
+            (solve.date for solve in solves), dtype=np.int64, count=size,
+        )
+        self.time = np.fromiter(
+            (solve.time for solve in solves), dtype=np.int64, count=size,
+        )
+        self.flag = np.fromiter(
+            (FLAG_CODES.get(solve.flag, 0) for solve in solves),
+            dtype=np.int8, count=size,
+        )
+
+        self.sessions, self.session = labels_column(
+            [solve.session for solve in solves],
+        )
+        self.devices, self.device = labels_column(
+            [solve.device for solve in solves],
+        )
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    @cached_property
+    def final_time(self) -> np.ndarray:
+        """Times with their penalty, DNFs being null, as `Solve.final_time`."""
+        final_time = self.time + (self.flag == PLUS_TWO_CODE) * (2 * SECOND)
+        final_time[self.flag == DNF_CODE] = 0
+
+        return final_time
+
+    def moves(self, index: int) -> str | None:
+        return self.solves[index].raw_moves
+
+    def session_counts(self) -> dict[str, int]:
+        counts = np.bincount(self.session, minlength=len(self.sessions))
+
+        return dict(zip(self.sessions, counts.tolist(), strict=True))
+
+    def day_counts(self) -> dict[str, int]:
+        """Number of solves of each local day, in `YYYY-MM-DD` format."""
+        if not len(self):
+            return {}
+
+        quarters, inverse = np.unique(
+            self.date // QUARTER, return_inverse=True,
+        )
+
+        days, day_ids = np.unique(
+            [
+                datetime.fromtimestamp(
+                    int(quarter) * QUARTER, tz=timezone.utc,  # noqa: UP017
+                ).astimezone().strftime('%Y-%m-%d')
+                for quarter in quarters
+            ],
+            return_inverse=True,
+        )
+        counts = np.bincount(day_ids[inverse], minlength=len(days))
+
+        return dict(zip(days.tolist(), counts.tolist(), strict=True))
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from functools import cached_property
 
 import numpy as np
@@ -21,17 +22,24 @@ from term_timer.formatter import format_time
 from term_timer.interface.console import console
 from term_timer.magic_cube import Cube
 from term_timer.solve import Solve
+from term_timer.solve_table import SolveTable
+from term_timer.solve_table import Times
+from term_timer.solve_table import rolling_ao
+from term_timer.summary import TimeSummary
+from term_timer.time_index import TimeIndex
 
 
 class StatisticsTools:
     def __init__(self, stack: list[Solve]):
         self.stack = stack
-        self.stack_time = [
-            s.final_time for s in stack
-        ]
-        self.stack_time_sorted = sorted(
-            [s for s in self.stack_time if s],
-        )
+        self.table = SolveTable(stack)
+        self.stack_time = self.table.final_time.tolist()
+
+    @cached_property
+    def stack_time_sorted(self) -> np.ndarray:
+        final_time = self.table.final_time
+
+        return np.sort(final_time[final_time > 0])
 
     @staticmethod
     def mo(limit: int, stack_elapsed: list[int]) -> int:
@@ -47,28 +55,30 @@ class StatisticsTools:
 
         cap = int(np.ceil(limit * 5 / 100))
 
-        last_of = stack_elapsed[-limit:]
-        for _ in range(cap):
-            last_of.remove(min(last_of))
-            last_of.remove(max(last_of))
+        # Trimming the sorted window drops the same solves as removing
+        # the best and the worst `cap` times one by one
+        last_of = sorted(stack_elapsed[-limit:])[cap:limit - cap]
 
         return int(np.mean(last_of))
 
+    @staticmethod
+    def rolling_ao(limit: int, stack_elapsed: Times,
+                   indices: Iterable[int] | None = None) -> list[int]:
+        return rolling_ao(limit, stack_elapsed, indices)
+
     def best_mo(self, limit: int) -> int:
         mos: list[int] = []
-        stack = list(self.stack_time[:-1])
 
         current_mo = getattr(self, f'mo{ limit }')
         if current_mo:
             mos.append(current_mo)
 
-        while 42:
-            mo = self.mo(limit, stack)
-            if mo == -1:
-                break
-            if mo:
-                mos.append(mo)
-            stack.pop()
+        # Means of every previous window, from the cumulated times
+        times = self.table.final_time[:-1]
+        if len(times) >= limit:
+            sums = np.cumsum(np.concatenate(([0], times)))
+            means = (sums[limit:] - sums[:-limit]) / limit
+            mos.extend(int(mo) for mo in means[means > 0].astype(np.int64))
 
         if mos:
             return min(mos)
@@ -76,19 +86,16 @@ class StatisticsTools:
 
     def best_ao(self, limit: int) -> int:
         aos: list[int] = []
-        stack = list(self.stack_time[:-1])
 
         current_ao = getattr(self, f'ao{ limit }')
         if current_ao:
             aos.append(current_ao)
 
-        while 42:
-            ao = self.ao(limit, stack)
-            if ao == -1:
-                break
-            if ao:
-                aos.append(ao)
-            stack.pop()
+        aos.extend(
+            ao
+            for ao in self.rolling_ao(limit, self.table.final_time[:-1])
+            if ao > 0
+        )
 
         if aos:
             return min(aos)
@@ -96,16 +103,27 @@ class StatisticsTools:
 
 
 class Statistics(StatisticsTools):
+    """
+    Statistics of the solves, with the median and the distribution
+    read from the `TimeSummary` of the same solves when given,
+    instead of sorting them.
+    """
+
+    def __init__(self, stack: list[Solve],
+                 summary: TimeSummary | None = None):
+        super().__init__(stack)
+
+        self.summary = summary
 
     @cached_property
     def bpa(self) -> int:
-        if self.stack_time_sorted:
+        if len(self.stack_time_sorted):
             return int(np.mean(self.stack_time_sorted[:3]))
         return 0
 
     @cached_property
     def wpa(self) -> int:
-        if self.stack_time_sorted:
+        if len(self.stack_time_sorted):
             return int(np.mean(self.stack_time_sorted[-3:]))
         return 0
 
@@ -151,27 +169,33 @@ class Statistics(StatisticsTools):
 
     @cached_property
     def best(self) -> int:
-        if self.stack_time_sorted:
-            return self.stack_time_sorted[0]
+        if self.summary:
+            return self.summary.best
+        if len(self.stack_time_sorted):
+            return int(self.stack_time_sorted[0])
         return 0
 
     @cached_property
     def worst(self) -> int:
-        if self.stack_time_sorted:
-            return self.stack_time_sorted[-1]
+        if self.summary:
+            return self.summary.worst
+        if len(self.stack_time_sorted):
+            return int(self.stack_time_sorted[-1])
         return 0
 
     @cached_property
     def mean(self) -> int:
-        return int(np.mean(self.stack_time))
+        return int(np.mean(self.table.final_time))
 
     @cached_property
     def median(self) -> int:
-        return int(np.median(self.stack_time))
+        if self.summary:
+            return self.summary.median
+        return int(np.median(self.table.final_time))
 
     @cached_property
     def stdev(self) -> int:
-        return int(np.std(self.stack_time))
+        return int(np.std(self.table.final_time))
 
     @cached_property
     def delta(self) -> int:
@@ -186,7 +210,7 @@ class Statistics(StatisticsTools):
 
     @cached_property
     def total_time(self) -> int:
-        return sum(self.stack_time)
+        return int(self.table.final_time.sum())
 
     @cached_property
     def advanced_solves(self) -> int:
@@ -207,7 +231,10 @@ class Statistics(StatisticsTools):
                     best_bin = second
                     break
 
-        values = [st / SECOND for st in self.stack_time_sorted]
+        if self.summary:
+            return self.summary.repartition(best_bin)
+
+        values = self.stack_time_sorted / SECOND
 
         min_val = int((np.min(values) // best_bin) * best_bin)
         max_val = int(((np.max(values) // best_bin) + 1) * best_bin)
@@ -229,11 +256,16 @@ class Statistics(StatisticsTools):
 
 class StatisticsReporter(Statistics):
 
-    def __init__(self, cube_size: int, stack: list[Solve]):
+    def __init__(self, cube_size: int, stack: list[Solve],
+                 summary: TimeSummary | None = None):
         self.cube_size = cube_size
         self.cube_name = f'{ cube_size }x{ cube_size }x{ cube_size }'
 
-        super().__init__(stack)
+        super().__init__(stack, summary)
+
+    @cached_property
+    def time_index(self) -> TimeIndex:
+        return TimeIndex(self.stack)
 
     def resume(self, prefix: str = '', *, show_title: bool = False) -> None:
         if show_title:
@@ -436,6 +468,13 @@ class StatisticsReporter(Statistics):
             f'[time]{ format_time(solve.time) }[/time]'
             f'[result]{ solve.flag }[/result]',
         )
+        console.print(
+            '[stats]Rank       :[/stats] '
+            f'[result]#{ self.time_index.rank(solve) }[/result]'
+            f'/{ self.total } '
+            f'[comment](faster than '
+            f'{ self.time_index.percentile(solve):.1f}%)[/comment]',
+        )
         console.print(
             '[stats]Date       :[/stats] '
             f'[date]{ date }[/date]',
@@ -691,20 +730,16 @@ class StatisticsReporter(Statistics):
         )
 
     def graph(self) -> None:
-        ao5s = []
-        ao12s = []
-        times = []
-
         plt.clear_figure()
 
-        for time in self.stack_time:
-            seconds = time / SECOND
-            times.append(seconds)
-
-            ao5 = self.ao(5, times)
-            ao12 = self.ao(12, times)
-            ao5s.append((ao5 > 0 and ao5) or None)
-            ao12s.append((ao12 > 0 and ao12) or None)
+        times = (self.table.final_time / SECOND).tolist()
+        ao5s, ao12s = (
+            [
+                (ao / SECOND if ao > 0 else None)
+                for ao in self.rolling_ao(limit, self.table.final_time)
+            ]
+            for limit in (5, 12)
+        )
 
         plt.plot(
             times,
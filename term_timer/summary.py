@@ -0,0 +1,274 @@
+from collections import Counter
+from collections.abc import Sequence
+
+import numpy as np
+
+from term_timer.constants import SECOND
+from term_timer.solve_table import rolling_ao
+
+SUMMARY_AVERAGES = (5, 12)
+
+SKETCH_ACCURACY = 0.005
+
+SKETCH_GAMMA = (1 + SKETCH_ACCURACY) / (1 - SKETCH_ACCURACY)
+
+SKETCH_BUCKETS = 2048
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch of times, in log-spaced buckets
+    as a DDSketch, the bucket `i` counting the times in
+    `]gamma^(i-1), gamma^i]`.
+
+    Any quantile is returned within `SKETCH_ACCURACY`, 0.5%,
+    of the actual time of that rank, whatever the number of times.
+    Times from 1ms to 24h fit in 1830 buckets, beyond `SKETCH_BUCKETS`
+    the lowest buckets are collapsed, so only the quantiles
+    falling in them lose accuracy.
+    """
+
+    def __init__(self, buckets: dict[int, int] | None = None):
+        self.buckets = buckets or {}
+        self.count = sum(self.buckets.values())
+
+    @classmethod
+    def from_times(cls, times: np.ndarray) -> 'QuantileSketch':
+        keys, counts = np.unique(
+            np.ceil(np.log(times) / np.log(SKETCH_GAMMA)).astype(np.int64),
+            return_counts=True,
+        )
+
+        return cls(
+            dict(zip(keys.tolist(), counts.tolist(), strict=True)),
+        ).collapse()
+
+    def collapse(self) -> 'QuantileSketch':
+        if len(self.buckets) > SKETCH_BUCKETS:
+            keys = sorted(self.buckets)
+            lowest = keys[-SKETCH_BUCKETS]
+
+            for key in keys[:-SKETCH_BUCKETS]:
+                self.buckets[lowest] += self.buckets.pop(key)
+
+        return self
+
+    def __add__(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        return QuantileSketch(
+            dict(Counter(self.buckets) + Counter(other.buckets)),
+        ).collapse()
+
+    @staticmethod
+    def value(key: int) -> int:
+        """Time of a bucket, within the accuracy of all its times."""
+        return int(2 * SKETCH_GAMMA ** key / (SKETCH_GAMMA + 1))
+
+    def quantile(self, q: float) -> int:
+        if not self.count:
+            return 0
+
+        rank = q * (self.count - 1)
+        seen = 0
+
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                return self.value(key)
+
+        return self.value(max(self.buckets))
+
+    def histogram(self, width: int) -> dict[int, int]:
+        """
+        Counts of the times in bins of `width`, by bin start.
+
+        Times within the accuracy of a bin edge may be counted
+        in the neighbour bin.
+        """
+        bins: Counter[int] = Counter()
+        for key, count in self.buckets.items():
+            bins[self.value(key) // width * width] += count
+
+        return dict(sorted(bins.items()))
+
+    def as_dict(self) -> dict:
+        return {str(key): value for key, value in self.buckets.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QuantileSketch':
+        return cls({int(key): value for key, value in data.items()})
+
+
+class TimeSummary:
+    """
+    Summary of the times of a session, small enough to be saved
+    in the manifest, and mergeable with the summaries of the other
+    sessions without reading their solves again.
+
+    Counts, sums and extremes merge exactly, and the quantiles
+    and the distribution are read from a `QuantileSketch`.
+    The best averages depend on the order of the solves,
+    so they are only kept while a single session is summarized.
+
+    The DNFs count as null times in the mean, the deviation
+    and the quantiles, as in `Statistics`, and are left out
+    of the extremes and the distribution.
+    """
+
+    def __init__(self, count: int = 0, dnf: int = 0,
+                 total: int = 0, squares: float = 0.0,
+                 best: int = 0, worst: int = 0,
+                 sketch: QuantileSketch | None = None,
+                 averages: dict[int, int] | None = None):
+        self.count = count
+        self.dnf = dnf
+        self.total = total
+        self.squares = squares
+        self.best = best
+        self.worst = worst
+        self.sketch = sketch or QuantileSketch()
+        self.averages = averages or {}
+
+    @classmethod
+    def from_times(cls, final_times: Sequence[int]) -> 'TimeSummary':
+        """Summary of the final times of a session, in solve order."""
+        times = np.asarray(final_times, dtype=np.int64)
+        timed = times[times > 0]
+
+        if not len(timed):
+            return cls(count=len(times), dnf=len(times))
+
+        averages = {}
+        for limit in SUMMARY_AVERAGES:
+            aos = [ao for ao in rolling_ao(limit, times) if ao > 0]
+            if aos:
+                averages[limit] = min(aos)
+
+        return cls(
+            count=len(times),
+            dnf=len(times) - len(timed),
+            total=int(timed.sum()),
+            squares=float(np.square(timed, dtype=np.float64).sum()),
+            best=int(timed.min()),
+            worst=int(timed.max()),
+            sketch=QuantileSketch.from_times(timed),
+            averages=averages,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TimeSummary':
+        return cls(
+            count=data['count'],
+            dnf=data['dnf'],
+            total=data['total'],
+            squares=data['squares'],
+            best=data['best'],
+            worst=data['worst'],
+            sketch=QuantileSketch.from_dict(data['sketch']),
+            averages={
+                int(limit): value
+                for limit, value in data['averages'].items()
+            },
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            'count': self.count,
+            'dnf': self.dnf,
+            'total': self.total,
+            'squares': self.squares,
+            'best': self.best,
+            'worst': self.worst,
+            'sketch': self.sketch.as_dict(),
+            'averages': {
+                str(limit): value
+                for limit, value in self.averages.items()
+            },
+        }
+
+    def __add__(self, other: 'TimeSummary') -> 'TimeSummary':
+        averages = {}
+        if not other.count:
+            averages = self.averages
+        elif not self.count:
+            averages = other.averages
+
+        return TimeSummary(
+            count=self.count + other.count,
+            dnf=self.dnf + other.dnf,
+            total=self.total + other.total,
+            squares=self.squares + other.squares,
+            best=min(
+                (best for best in (self.best, other.best) if best),
+                default=0,
+            ),
+            worst=max(self.worst, other.worst),
+            sketch=self.sketch + other.sketch,
+            averages=averages,
+        )
+
+    @property
+    def timed(self) -> int:
+        return self.count - self.dnf
+
+    @property
+    def mean(self) -> int:
+        if not self.count:
+            return 0
+        return self.total // self.count
+
+    @property
+    def stdev(self) -> int:
+        if not self.count:
+            return 0
+
+        variance = self.squares / self.count - (self.total / self.count) ** 2
+
+        return int(max(variance, 0) ** 0.5)
+
+    def ranked(self, rank: int) -> int:
+        """Time of the solve of `rank`, the DNFs ranking first."""
+        if rank < self.dnf:
+            return 0
+        if rank == self.dnf:
+            return self.best
+        if rank >= self.count - 1:
+            return self.worst
+
+        return min(
+            max(
+                self.sketch.quantile((rank - self.dnf) / (self.timed - 1)),
+                self.best,
+            ),
+            self.worst,
+        )
+
+    def percentile(self, q: float) -> int:
+        """
+        Time of the `q` quantile of the solves, interpolated
+        between ranks and the DNFs being null times, as with NumPy
+        over the final times in `Statistics`.
+        """
+        if not self.timed:
+            return 0
+
+        rank = q * (self.count - 1)
+        lower = int(rank)
+        value: float = self.ranked(lower)
+
+        if rank > lower:
+            value += (rank - lower) * (self.ranked(lower + 1) - value)
+
+        return int(value)
+
+    @property
+    def median(self) -> int:
+        return self.percentile(0.5)
+
+    def repartition(self, bin_width: int) -> list[tuple[int, int]]:
+        """Distribution of the timed solves in bins of `bin_width` seconds."""
+        return [
+            (count, edge // SECOND)
+            for edge, count in self.sketch.histogram(
+                bin_width * SECOND,
+            ).items()
+        ]
@@ -1,8 +1,11 @@
+import time
 import unittest
 from unittest.mock import MagicMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
+from term_timer.aggregator import AnalysisCancelledError
+from term_timer.aggregator import AnalysisPool
 from term_timer.aggregator import SolvesMethodAggregator
 from term_timer.aggregator import analyse_solve_worker
 
@@ -141,6 +144,7 @@ class TestSolvesMethodAggregator(unittest.TestCase):
         aggregator.stack = self.stack
         aggregator.method_name = 'CFOP'
         aggregator.full = True
+        aggregator.pool = None
 
         result = aggregator.collect_analyses()
 
@@ -285,3 +289,101 @@ class TestSolvesMethodAggregator(unittest.TestCase):
         self.assertEqual(case_data['tps'], 2.1)  # (2.0+2.2)/2
         self.assertEqual(case_data['etps'], 2.6)  # (2.5+2.7)/2
         self.assertEqual(case_data['probability'], 0)  # default value
+
+    @patch('term_timer.aggregator.get_method_analyser')
+    def test_case_solves(self, mock_get_analyser):
+        mock_analyser = Mock()
+        mock_analyser.infos = {}
+        mock_get_analyser.return_value = mock_analyser
+
+        def analyse(case):
+            return {
+                'solve': Mock(),
+                'score': 80,
+                'steps': {
+                    'pll': {
+                        'case': case,
+                        'time': 10.0,
+                        'execution': 8.0,
+                        'recognition': 2.0,
+                        'qtm': 20,
+                        'tps': 2.0,
+                        'etps': 2.5,
+                    },
+                },
+            }
+
+        analyses = [
+            analyse('Ua'),
+            {'solve': Mock()},
+            analyse('Jb'),
+            analyse('Ua'),
+        ]
+
+        aggregator = SolvesMethodAggregator.__new__(SolvesMethodAggregator)
+        aggregator.stack = []
+        aggregator.analyser = mock_analyser
+
+        with patch.object(aggregator, 'collect_analyses',
+                          return_value=analyses):
+            aggregator.results = aggregator.aggregate()
+
+        self.assertEqual(
+            aggregator.results['cases'],
+            {'pll': {'ua': [0, 3], 'jb': [2]}},
+        )
+        self.assertEqual(
+            aggregator.case_solves('PLL', 'UA'),
+            [analyses[0]['solve'], analyses[3]['solve']],
+        )
+        self.assertEqual(aggregator.case_solves('pll', 'h'), [])
+        self.assertEqual(aggregator.case_solves('oll', 'ua'), [])
+
+
+class TestAnalysisPool(unittest.TestCase):
+
+    def test_in_process(self):
+        pool = AnalysisPool(2)
+
+        self.assertEqual(pool.map(str, [1, 2, 3]), ['1', '2', '3'])
+        self.assertIsNone(pool.pool)
+
+    def test_in_process_cancelled(self):
+        pool = AnalysisPool(2)
+
+        with self.assertRaises(AnalysisCancelledError):
+            pool.map(str, [1, 2, 3], lambda: True)
+
+    def test_pool(self):
+        pool = AnalysisPool(2)
+        pool.in_process_threshold = 0
+        pool.chunk_size = 3
+        pool.start()
+        self.addCleanup(pool.close)
+
+        self.assertEqual(
+            pool.map(str, list(range(20))),
+            [str(i) for i in range(20)],
+        )
+
+    def test_pool_cancelled(self):
+        pool = AnalysisPool(2)
+        pool.in_process_threshold = 0
+        pool.start()
+        self.addCleanup(pool.close)
+
+        with self.assertRaises(AnalysisCancelledError):
+            pool.map(time.sleep, [0.5] * 40, lambda: True)
+
+    def test_aggregator_with_pool(self):
+        solve = Mock()
+        solve.advanced = False
+        solve.for_method.return_value = solve
+
+        pool = AnalysisPool(2)
+        aggregator = SolvesMethodAggregator(
+            'cfop', [solve], full=True, pool=pool,
+        )
+
+        self.assertEqual(aggregator.results['stack'], [solve])
+        solve.for_method.assert_called_once_with('cfop')
@@ -8,6 +8,7 @@ from term_timer.arguments import cfop_arguments
 from term_timer.arguments import delete_arguments
 from term_timer.arguments import detail_arguments
 from term_timer.arguments import edit_arguments
+from term_timer.arguments import export_arguments
 from term_timer.arguments import get_arguments
 from term_timer.arguments import graph_arguments
 from term_timer.arguments import import_arguments
@@ -24,7 +25,8 @@ class TestCommandAliases(unittest.TestCase):
     def test_command_aliases_structure(self):
         expected_commands = {
             'solve', 'list', 'stats', 'graph', 'cfop', 'detail',
-            'import', 'serve', 'train', 'edit', 'delete',
+            'import', 'export', 'rebuild', 'serve', 'train', 'edit',
+            'delete',
         }
         self.assertEqual(set(COMMAND_ALIASES.keys()), expected_commands)
 
@@ -190,6 +192,45 @@ class TestImportArguments(unittest.TestCase):
         args = main_parser.parse_args(['import', 'file.csv'])
         self.assertEqual(args.command, 'import')
         self.assertEqual(args.source, 'file.csv')
+        self.assertEqual(args.cube, 3)
+        self.assertEqual(args.session, '')
+
+    def test_import_into_session(self):
+        main_parser = argparse.ArgumentParser()
+        subparsers = main_parser.add_subparsers(dest='command')
+        import_arguments(subparsers)
+
+        args = main_parser.parse_args(
+            ['import', 'file.csv', '-c', '4', '-u', 'old'],
+        )
+        self.assertEqual(args.cube, 4)
+        self.assertEqual(args.session, 'old')
+
+
+class TestExportArguments(unittest.TestCase):
+
+    def test_export_with_destination(self):
+        main_parser = argparse.ArgumentParser()
+        subparsers = main_parser.add_subparsers(dest='command')
+        export_arguments(subparsers)
+
+        args = main_parser.parse_args(['export', 'backup.txt'])
+        self.assertEqual(args.command, 'export')
+        self.assertEqual(args.destination, 'backup.txt')
+        self.assertEqual(args.format, 'cstimer-json')
+        self.assertEqual(args.include_sessions, [])
+
+    def test_export_format(self):
+        main_parser = argparse.ArgumentParser()
+        subparsers = main_parser.add_subparsers(dest='command')
+        export_arguments(subparsers)
+
+        args = main_parser.parse_args(
+            ['export', '-', '-f', 'cubeast-csv', '-x', 'old', '-d', 'GAN'],
+        )
+        self.assertEqual(args.format, 'cubeast-csv')
+        self.assertEqual(args.exclude_sessions, ['old'])
+        self.assertEqual(args.devices, ['GAN'])
 
 
 class TestServeArguments(unittest.TestCase):
@@ -216,6 +257,14 @@ class TestServeArguments(unittest.TestCase):
         self.assertEqual(args.host, '0.0.0.0')  # noqa: S104
         self.assertEqual(args.port, 9000)
 
+    def test_serve_with_threads(self):
+        main_parser = argparse.ArgumentParser()
+        subparsers = main_parser.add_subparsers(dest='command')
+        serve_arguments(subparsers)
+
+        args = main_parser.parse_args(['serve', '--threads', '4'])
+        self.assertEqual(args.threads, 4)
+
 
 class TestDetailArguments(unittest.TestCase):
 
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import Mock
+
+from term_timer.bluetooth.constants import EVENTS_HISTORY
+from term_timer.bluetooth.drivers.base import Driver
+from term_timer.bluetooth.events import BatteryEvent
+from term_timer.bluetooth.events import HardwareEvent
+from term_timer.bluetooth.events import MoveEvent
+
+
+class TestBluetoothEvents(unittest.TestCase):
+
+    def test_move_event(self):
+        event = MoveEvent(
+            10, 20,
+            serial=3,
+            local_timestamp=20,
+            cube_timestamp=150,
+            face=1,
+            direction=0,
+            move='R',
+        )
+
+        self.assertEqual(event.name, 'move')
+        self.assertEqual(event.move, 'R')
+        self.assertFalse(hasattr(event, '__dict__'))
+
+        with self.assertRaises(AttributeError):
+            event.extra = True
+
+    def test_as_dict(self):
+        event = BatteryEvent(10, 20, level=85)
+
+        self.assertEqual(
+            event.as_dict(),
+            {
+                'event': 'battery',
+                'clock': 10,
+                'timestamp': 20,
+                'level': 85,
+            },
+        )
+
+    def test_repr(self):
+        event = BatteryEvent(10, 20, level=85)
+
+        self.assertEqual(
+            repr(event),
+            'BatteryEvent(clock=10, timestamp=20, level=85)',
+        )
+
+    def test_hardware_infos(self):
+        event = HardwareEvent(
+            10, 20,
+            hardware_name='GAN12',
+            hardware_version='1.2',
+        )
+
+        self.assertEqual(
+            event.infos,
+            {
+                'hardware_name': 'GAN12',
+                'hardware_version': '1.2',
+            },
+        )
+
+
+class TestDriverEvents(unittest.TestCase):
+
+    def test_events_history_bounded(self):
+        driver = Driver(Mock())
+        store = []
+
+        for i in range(EVENTS_HISTORY + 10):
+            driver.add_event(store, BatteryEvent(i, i, level=50))
+
+        self.assertEqual(len(store), EVENTS_HISTORY + 10)
+        self.assertEqual(len(driver.events), EVENTS_HISTORY)
+        self.assertEqual(driver.events[0].clock, 10)
@@ -0,0 +1,67 @@
+import unittest
+
+from cubing_algs.vcube import VCube
+
+from term_timer.cube_state import CubeState
+from term_timer.methods.base import FaceletAnalyser
+
+
+class TestCubeState(unittest.TestCase):
+
+    def test_initial_state(self):
+        cube = CubeState()
+
+        self.assertTrue(cube.is_solved)
+        self.assertEqual(cube.state, VCube().state)
+
+    def test_rotate_matches_vcube(self):
+        moves = "R U R' U' F2 D L' B U2 R2 D' B' L2 F'"
+
+        cube = CubeState()
+        vcube = VCube()
+
+        for move in moves.split(' '):
+            cube.rotate(move)
+            vcube.rotate(move)
+
+            self.assertEqual(cube.state, vcube.state)
+
+        self.assertFalse(cube.is_solved)
+
+    def test_rotate_back_to_solved(self):
+        cube = CubeState()
+
+        for move in ['R', 'U', "U'", "R'"]:
+            cube.rotate(move)
+
+        self.assertTrue(cube.is_solved)
+
+    def test_initial_facelets(self):
+        vcube = VCube()
+        vcube.rotate("F R U'")
+
+        cube = CubeState(vcube.state)
+
+        self.assertEqual(cube.state, vcube.state)
+
+    def test_is_step_solved(self):
+        cube = CubeState()
+        analyser = FaceletAnalyser()
+
+        for move in ['R', 'U', "R'", "U'"]:
+            cube.rotate(move)
+
+            for step in ('Cross', 'F2L', 'OLL', 'PLL'):
+                self.assertEqual(
+                    cube.is_step_solved(step),
+                    analyser.check_step(step, cube.state),
+                )
+
+    def test_is_step_solved_cache_invalidated(self):
+        cube = CubeState()
+
+        self.assertTrue(cube.is_step_solved('Cross'))
+
+        cube.rotate('F')
+
+        self.assertFalse(cube.is_step_solved('Cross'))
@@ -0,0 +1,235 @@
+import csv
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from term_timer.constants import DNF
+from term_timer.constants import PLUS_TWO
+from term_timer.exporters import Exporter
+from term_timer.exporters import cstimer_time
+from term_timer.exporters import cubeast_moves
+from term_timer.exporters import local_date
+from term_timer.importers import Importer
+from term_timer.importers import solve_record
+from term_timer.in_out import load_all_solves
+from term_timer.in_out import load_records
+from term_timer.in_out import save_records
+
+DEFAULT = [
+    solve_record(
+        1_704_103_200, 12_340_000_000, "R U R' U'", '', 'Timer', 'GAN',
+        'R@0 U@120',
+    ),
+    solve_record(
+        1_704_103_260, 10_500_000_000, 'F R U', PLUS_TWO, 'Timer', '',
+    ),
+]
+
+OLD = [
+    solve_record(
+        1_704_000_000, 61_200_000_000, 'U R F', DNF, 'Timer', 'GAN',
+    ),
+    solve_record(
+        1_704_103_200, 12_340_000_000, "R U R' U'", '', 'Timer', 'GAN',
+        'R@0 U@120',
+    ),
+]
+
+
+class TestFormats(unittest.TestCase):
+
+    def test_cstimer_time(self):
+        self.assertEqual(cstimer_time(12_345_000_000), '12.34')
+        self.assertEqual(cstimer_time(700_000_000), '0.70')
+        self.assertEqual(cstimer_time(61_200_000_000), '1:01.20')
+
+    def test_cubeast_moves(self):
+        self.assertEqual(
+            cubeast_moves("R@0 U@120 R'@300"),
+            "R[0] U[120] R'[300]",
+        )
+
+
+class TestExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+        patcher = patch('term_timer.in_out.SAVE_DIRECTORY', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        save_records(3, '', DEFAULT)
+        save_records(3, 'old', OLD)
+
+        self.destination = str(self.path / 'export')
+
+    def test_cstimer_json(self):
+        exporter = Exporter(3)
+
+        self.assertEqual(
+            exporter.export_file(self.destination, 'cstimer-json'), 0,
+        )
+        self.assertEqual(exporter.rows, 3)
+
+        data = json.loads(Path(self.destination).read_text(encoding='utf-8'))
+
+        self.assertEqual(
+            data['session1'],
+            [[[2000, 10500], 'F R U', '', 1_704_103_260, ['', 333]]],
+        )
+        self.assertEqual(data['session2'][0][0], [-1, 61200])
+        self.assertEqual(
+            data['session2'][1],
+            [[0, 12340], "R U R' U'", '', 1_704_103_200, ['R@0 U@120', 333]],
+        )
+        self.assertEqual(
+            json.loads(data['properties']['sessionData']),
+            {
+                '1': {'name': 'default', 'opt': {'scrType': '333'}},
+                '2': {'name': 'old', 'opt': {'scrType': '333'}},
+            },
+        )
+
+        Path(self.destination).rename(self.path / 'backup.txt')
+        Importer(3, 'back').import_file(str(self.path / 'backup.txt'))
+
+        for session, expected in (
+                ('back-default', DEFAULT[1:]),
+                ('back-old', OLD),
+        ):
+            self.assertEqual(
+                [
+                    {**record, 'timer': 'Timer', 'device': ''}
+                    for record in load_records(3, session)
+                ],
+                [{**record, 'device': ''} for record in expected],
+            )
+
+    def test_cstimer_csv(self):
+        Exporter(3, ['old']).export_file(self.destination, 'cstimer-csv')
+
+        with Path(self.destination).open(newline='', encoding='utf-8') as fd:
+            rows = list(csv.reader(fd, delimiter=';'))
+
+        self.assertEqual(
+            rows[0], ['No.', 'Time', 'Comment', 'Scramble', 'Date', 'P.1'],
+        )
+        self.assertEqual(rows[1][:2], ['1', 'DNF(1:01.20)'])
+        self.assertEqual(rows[2][:2], ['2', '12.34'])
+
+        source = Path(self.destination).rename(self.path / 'export.csv')
+        Importer(3, 'back').import_file(str(source))
+
+        self.assertEqual(
+            [
+                (record['date'], record['time'], record['flag'])
+                for record in load_records(3, 'back')
+            ],
+            [
+                (record['date'], record['time'], record['flag'])
+                for record in OLD
+            ],
+        )
+
+    def test_merged_sessions(self):
+        Exporter(3).export_file(self.destination, 'cstimer-csv')
+
+        with Path(self.destination).open(newline='', encoding='utf-8') as fd:
+            rows = list(csv.reader(fd, delimiter=';'))[1:]
+
+        solves = load_all_solves(3, [], [], [])
+
+        self.assertEqual(
+            [row[4] for row in rows],
+            [local_date(solve.date) for solve in solves],
+        )
+        self.assertEqual(
+            [row[1] for row in rows],
+            ['DNF(1:01.20)', '12.34', '12.50+'],
+        )
+        self.assertEqual(solves[1].session, 'old')
+
+    def test_unsorted_session(self):
+        save_records(3, 'new', [OLD[1], DEFAULT[1], OLD[0], OLD[1]])
+
+        Exporter(3, ['new']).export_file(self.destination, 'cstimer-csv')
+
+        with Path(self.destination).open(newline='', encoding='utf-8') as fd:
+            rows = list(csv.reader(fd, delimiter=';'))[1:]
+
+        self.assertEqual(
+            [row[4] for row in rows],
+            [local_date(record['date']) for record in (*OLD, DEFAULT[1])],
+        )
+
+        exporter = Exporter(3)
+        exporter.export_file(self.destination, 'cstimer-json')
+
+        data = json.loads(Path(self.destination).read_text(encoding='utf-8'))
+
+        names = json.loads(data.pop('properties')['sessionData'])
+
+        self.assertEqual(exporter.rows, 3)
+        self.assertEqual(
+            sorted(
+                (names[key.removeprefix('session')]['name'], solve[3])
+                for key, solves in data.items()
+                for solve in solves
+            ),
+            sorted(
+                (solve.session or 'default', solve.date)
+                for solve in load_all_solves(3, [], [], [])
+            ),
+        )
+
+    def test_cubeast_csv(self):
+        Exporter(3, devices=['GAN']).export_file(
+            self.destination, 'cubeast-csv',
+        )
+
+        with Path(self.destination).open(newline='', encoding='utf-8') as fd:
+            rows = list(csv.reader(fd))
+
+        self.assertEqual(rows[2][1], '2024-01-01 10:00:00 UTC')
+
+        source = Path(self.destination).rename(self.path / 'cubeast.csv')
+        Importer(3, 'back').import_file(str(source))
+
+        records = load_records(3, 'back')
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]['flag'], DNF)
+        self.assertEqual(records[1]['moves'], 'R@0 U@120')
+        self.assertEqual(records[1]['device'], 'GAN')
+        self.assertEqual(records[1]['time'], 12_340_000_000)
+        self.assertEqual(
+            [record['date'] for record in records],
+            [record['date'] for record in OLD],
+        )
+
+    def test_plus_two_cubeast_csv(self):
+        Exporter(3, ['default']).export_file(
+            self.destination, 'cubeast-csv',
+        )
+
+        with Path(self.destination).open(newline='', encoding='utf-8') as fd:
+            rows = list(csv.reader(fd))
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1][2:4], ['false', '12340'])
+        self.assertEqual(rows[2][2:4], ['false', '12500'])
+
+    def test_empty(self):
+        exporter = Exporter(4)
+        exporter.export_file(self.destination, 'cstimer-json')
+
+        self.assertEqual(
+            json.loads(Path(self.destination).read_text(encoding='utf-8')),
+            {'properties': {'sessionData': '{}'}},
+        )
+        self.assertEqual(exporter.rows, 0)
@@ -0,0 +1,53 @@
+import unittest
+from unittest.mock import patch
+
+from cubing_algs.parsing import parse_moves
+
+from term_timer.config import DEFAULT_CONFIG
+from term_timer.config import tomllib
+from term_timer.constants import MS_TO_NS_FACTOR
+from term_timer.constants import SAVE_GESTURES
+from term_timer.interface.gesture import Gesture
+
+
+class TestGesture(unittest.TestCase):
+
+    def setUp(self):
+        self.gesture = Gesture()
+        self.gesture.cube_orientation = parse_moves('')
+
+    def test_default_bindings(self):
+        self.gesture.handle_save_gestures('D@100')
+        self.assertFalse(self.gesture.save_gesture_event.is_set())
+
+        self.gesture.handle_save_gestures("D'@500")
+        self.assertTrue(self.gesture.save_gesture_event.is_set())
+        self.assertEqual(self.gesture.save_gesture, 'q')
+
+    def test_config_template(self):
+        config = tomllib.loads(DEFAULT_CONFIG)
+
+        self.assertEqual(config['bluetooth']['gestures'], SAVE_GESTURES)
+
+    def test_custom_bindings(self):
+        self.gesture.gestures_bindings = {'U': 'd'}
+
+        self.gesture.handle_save_gestures('R@100')
+        self.gesture.handle_save_gestures("R'@500")
+        self.assertFalse(self.gesture.save_gesture_event.is_set())
+
+        self.gesture.handle_save_gestures('U@1000')
+        self.gesture.handle_save_gestures("U'@1500")
+        self.assertTrue(self.gesture.save_gesture_event.is_set())
+        self.assertEqual(self.gesture.save_gesture, 'd')
+
+    def test_latency(self):
+        self.gesture.handle_save_gestures('D@100')
+
+        with patch(
+                'term_timer.interface.gesture.time.perf_counter_ns',
+                return_value=620 * MS_TO_NS_FACTOR,
+        ):
+            self.gesture.handle_save_gestures("D'@500")
+
+        self.assertEqual(self.gesture.save_gesture_latency, 120)
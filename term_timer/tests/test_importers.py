@@ -0,0 +1,340 @@
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from term_timer.constants import DNF
+from term_timer.constants import PLUS_TWO
+from term_timer.importers import Importer
+from term_timer.importers import timed_moves
+from term_timer.in_out import load_records
+from term_timer.in_out import load_solves
+from term_timer.in_out import read_manifest
+from term_timer.in_out import update_manifest
+
+CSTIMER_CSV = (
+    'No.;Time;Comment;Scramble;Date;P.1\n'
+    "1;12.34;;R U R' U';2024-01-01 10:00:00;12.34\n"
+    "2;14.50+;;F  R U;2024-01-01 10:01:00;12.50\n"
+    "3;DNF(1:01.20);;U R F;2024-01-01 10:02:00;1:01.20\n"
+)
+
+CUBEAST_HEADER = ','.join(f'column{ i }' for i in range(20))
+
+CSTIMER_JSON = {
+    'session1': [
+        [[0, 12340], "R U R' U'", '', 1_704_103_200, ['R@0 U@120', 333]],
+        [[2000, 10000], 'F R U', '', 1_704_103_260, ['', 333]],
+        [[0, 9000], 'F R U', '', 1_704_103_320],
+    ],
+    'session2': [
+        [[-1, 5000], 'U R F', '', 1_704_103_380, ['', 222]],
+    ],
+    'properties': {
+        'sessionData': json.dumps(
+            {
+                '1': {'name': 1},
+                '2': {'name': 2, 'opt': {'scrType': '222so'}},
+            },
+        ),
+    },
+}
+
+
+def cubeast_row(identifier, date, dnf, time, moves, scramble):
+    row = [''] * 20
+    row[0] = identifier
+    row[1] = f'{ date } UTC'
+    row[2] = dnf
+    row[3] = time
+    row[6] = 'GAN'
+    row[14] = moves
+    row[19] = scramble
+
+    return ','.join(row)
+
+
+class TestParsers(unittest.TestCase):
+
+    def setUp(self):
+        self.importer = Importer()
+
+    def test_date_to_ts(self):
+        for date in (
+                '2024-01-01 10:00:00',
+                '2024-03-31 02:30:00',
+                '2024-07-14 23:59:59',
+        ):
+            with self.subTest(date=date):
+                self.assertEqual(
+                    self.importer.date_to_ts(date),
+                    int(
+                        datetime.strptime(  # noqa: DTZ007
+                            date, '%Y-%m-%d %H:%M:%S',
+                        ).timestamp(),
+                    ),
+                )
+
+    def test_utc_date_to_ts(self):
+        self.assertEqual(
+            self.importer.utc_date_to_ts('2024-01-01 10:00:00'),
+            1_704_103_200,
+        )
+
+    def test_time_to_ns(self):
+        for time, expected in (
+                ('12.34', 12_340_000_000),
+                ('0.07', 70_000_000),
+                ('1:01.20', 61_200_000_000),
+                ('1:00:00.01', 3_600_010_000_000),
+                ('9.876', 9_876_000_000),
+                ('42', 42_000_000_000),
+        ):
+            with self.subTest(time=time):
+                self.assertEqual(self.importer.time_to_ns(time), expected)
+
+    def test_timed_moves(self):
+        self.assertEqual(
+            timed_moves("R[0] U[120]  R'[300] "),
+            "R@0 U@120 R'@300",
+        )
+        self.assertEqual(timed_moves(''), '')
+
+
+class TestImporter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+        patcher = patch('term_timer.in_out.SAVE_DIRECTORY', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        self.importer = Importer(3, 'imported')
+
+    def write(self, name, content):
+        path = self.path / name
+        path.write_text(content)
+
+        return str(path)
+
+    def test_cstimer_csv(self):
+        source = self.write('export.csv', CSTIMER_CSV)
+
+        self.assertEqual(self.importer.import_file(source), 0)
+
+        records = load_records(3, 'imported')
+
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0]['time'], 12_340_000_000)
+        self.assertEqual(records[1]['flag'], PLUS_TWO)
+        self.assertEqual(records[1]['scramble'], 'F R U')
+        self.assertEqual(records[2]['flag'], DNF)
+        self.assertEqual(records[2]['time'], 61_200_000_000)
+        self.assertEqual(self.importer.rows, 3)
+
+    def test_cubeast_csv(self):
+        source = self.write(
+            'cubeast.csv',
+            '\n'.join(
+                [
+                    'id,' + CUBEAST_HEADER,
+                    cubeast_row(
+                        '1', '2024-01-01 10:00:00', 'false', '1500',
+                        "R[0] U[120] R'[300]", "R U R'",
+                    ),
+                    cubeast_row(
+                        '2', '2024-01-01 10:01:00', 'true', '2500',
+                        '', 'F R',
+                    ),
+                ],
+            ),
+        )
+
+        self.assertEqual(self.importer.import_file(source), 0)
+
+        solves = load_solves(3, 'imported')
+
+        self.assertEqual(len(solves), 2)
+        self.assertEqual(solves[0].raw_moves, "R@0 U@120 R'@300")
+        self.assertEqual(solves[0].time, 1_500_000_000)
+        self.assertEqual(solves[0].device, 'GAN')
+        self.assertEqual(solves[1].flag, DNF)
+
+    def test_cstimer_json(self):
+        source = self.write('backup.txt', json.dumps(CSTIMER_JSON))
+
+        self.assertEqual(self.importer.import_file(source), 0)
+
+        solves = load_solves(3, 'imported-1')
+
+        self.assertEqual(len(solves), 2)
+        self.assertEqual(solves[0].raw_moves, 'R@0 U@120')
+        self.assertEqual(solves[1].flag, PLUS_TWO)
+
+        solves = load_solves(2, 'imported-2')
+
+        self.assertEqual(len(solves), 1)
+        self.assertEqual(solves[0].flag, DNF)
+        self.assertEqual(self.importer.rows, 4)
+
+    def test_cstimer_sessions(self):
+        data = {
+            **CSTIMER_JSON,
+            'session3': [],
+            'session4': CSTIMER_JSON['session2'],
+            'session5': CSTIMER_JSON['session2'],
+            'properties': {
+                'sessionData': json.dumps(
+                    {
+                        '1': {'name': 'One Handed'},
+                        '2': {'name': 2, 'opt': {'scrType': '444wca'}},
+                        '3': {'name': 3},
+                        '4': {'name': 'Clock', 'opt': {'scrType': 'clkwca'}},
+                        '5': {'name': '!!'},
+                    },
+                ),
+            },
+        }
+
+        self.assertEqual(
+            [
+                (cube, session, len(solves))
+                for cube, session, solves in Importer().cstimer_sessions(data)
+            ],
+            [
+                (3, 'cstimer-one-handed', 3),
+                (4, 'cstimer-2', 1),
+                (3, 'cstimer-5', 1),
+            ],
+        )
+
+    def test_cstimer_sessions_colliding(self):
+        solves = [
+            [[0, 10_000 + i], 'R U', '', 1_704_103_200 + i, ['', 333]]
+            for i in range(120)
+        ]
+        data = {
+            'session1': solves[:50],
+            'session2': solves[50:100],
+            'session3': solves[100:110],
+            'session4': solves[110:],
+            'properties': {
+                'sessionData': json.dumps(
+                    {
+                        '1': {'name': '3x3'},
+                        '2': {'name': '3x3!'},
+                        '3': {'name': 4},
+                        '4': {'name': '3x3-1'},
+                    },
+                ),
+            },
+        }
+
+        jobs = self.importer.cstimer_sessions(data)
+
+        self.assertEqual(
+            [(cube, session, len(solves)) for cube, session, solves in jobs],
+            [
+                (3, 'imported-3x3-1', 60),
+                (3, 'imported-3x3-2', 50),
+                (3, 'imported-4', 10),
+            ],
+        )
+
+        with patch('term_timer.importers.cpu_count', return_value=5):
+            self.importer.import_sessions(jobs)
+
+        self.assertEqual(len(load_records(3, 'imported-3x3-1')), 60)
+        self.assertEqual(len(load_records(3, 'imported-3x3-2')), 50)
+
+    def test_cstimer_json_reimport(self):
+        source = self.write('backup.txt', json.dumps(CSTIMER_JSON))
+
+        self.importer.import_file(source)
+
+        with patch('term_timer.importers.cpu_count', return_value=4):
+            results = self.importer.import_sessions(
+                self.importer.cstimer_sessions(CSTIMER_JSON),
+            )
+
+        self.assertEqual(
+            results,
+            [
+                (2, 'imported-2', 1, 0, 1),
+                (3, 'imported-1', 3, 0, 2),
+            ],
+        )
+
+    def test_cstimer_json_manifest(self):
+        data = {
+            **{
+                f'session{ i }': CSTIMER_JSON['session1']
+                for i in range(1, 9)
+            },
+            'properties': {'sessionData': '{}'},
+        }
+
+        with patch('term_timer.importers.cpu_count', return_value=5), \
+                patch(
+                    'term_timer.importers.update_manifest',
+                    wraps=update_manifest,
+                ) as mock_update:
+            self.importer.import_sessions(self.importer.cstimer_sessions(data))
+
+        mock_update.assert_called_once()
+        self.assertEqual(
+            sorted(
+                entry['count']
+                for entry in read_manifest()['sessions'].values()
+            ),
+            [2] * 8,
+        )
+
+    def test_merge_deduplicates(self):
+        source = self.write('export.csv', CSTIMER_CSV)
+        self.importer.import_file(source)
+
+        existing = load_records(3, 'imported')
+        self.write(
+            '3x3x3-imported.json',
+            json.dumps(
+                [
+                    {**existing[1], 'comment': 'kept'},
+                    {**existing[0], 'date': existing[0]['date'] - 60},
+                ],
+            ),
+        )
+
+        imported, duplicates = self.importer.merge(
+            [*existing, {**existing[0], 'date': existing[2]['date'] + 60}],
+        )
+
+        self.assertEqual((imported, duplicates), (3, 1))
+
+        records = load_records(3, 'imported')
+
+        self.assertEqual(
+            [record['date'] for record in records],
+            sorted(record['date'] for record in records),
+        )
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[2]['comment'], 'kept')
+        self.assertEqual(
+            sorted(path.name for path in self.path.iterdir()),
+            [
+                '.manifest.json', '.manifest.lock',
+                '3x3x3-imported.json', 'export.csv',
+            ],
+        )
+
+    def test_invalid_format(self):
+        source = self.write('export.csv', 'Something;else\n')
+
+        self.assertEqual(self.importer.import_file(source), 1)
+        self.assertEqual(self.importer.import_file('export.xls'), 1)
+        self.assertEqual(load_records(3, 'imported'), [])
@@ -1,8 +1,30 @@
+import json
+import tempfile
 import unittest
+from multiprocessing import get_context
 from pathlib import Path
 from unittest.mock import patch
 
+from term_timer.constants import DNF
+from term_timer.constants import PLUS_TWO
+from term_timer.constants import SECOND
+from term_timer.in_out import MANIFEST_FORMAT
+from term_timer.in_out import MANIFEST_NAME
+from term_timer.in_out import iter_records
+from term_timer.in_out import list_sessions
+from term_timer.in_out import load_all_solves
+from term_timer.in_out import load_manifest
+from term_timer.in_out import load_records
 from term_timer.in_out import load_solves
+from term_timer.in_out import load_summary
+from term_timer.in_out import read_manifest
+from term_timer.in_out import rebuild_manifest
+from term_timer.in_out import save_records
+from term_timer.in_out import update_manifest
+from term_timer.in_out import write_records
+from term_timer.stats import Statistics
+from term_timer.summary import SKETCH_ACCURACY
+from term_timer.summary import TimeSummary
 
 
 class TestInOut(unittest.TestCase):
@@ -16,3 +38,340 @@ class TestInOut(unittest.TestCase):
         solves = load_solves(3, 'default')
 
         self.assertEqual(solves, [])
+
+    def test_iter_records(self):
+        records = [
+            {'date': i, 'time': i * 1000, 'scramble': 'R U', 'moves': []}
+            for i in range(50)
+        ]
+
+        with tempfile.TemporaryDirectory() as directory, \
+                patch('term_timer.in_out.SAVE_DIRECTORY', Path(directory)), \
+                patch('term_timer.in_out.RECORDS_CHUNK', 7):
+            save_records(3, 'default', records)
+
+            self.assertEqual(list(iter_records(3, 'default')), records)
+            self.assertEqual(load_records(3, 'default'), records)
+
+            (Path(directory) / '3x3x3-compact.json').write_text(
+                json.dumps(records[:3], separators=(',', ':')),
+            )
+            self.assertEqual(list(iter_records(3, 'compact')), records[:3])
+
+            (Path(directory) / '3x3x3-empty.json').write_text('[]')
+            self.assertEqual(list(iter_records(3, 'empty')), [])
+            self.assertEqual(list(iter_records(3, 'missing')), [])
+
+            (Path(directory) / '3x3x3-broken.json').write_text('[{"date"')
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_records(3, 'broken'))
+
+
+def record(date, device='', flag=''):
+    return {
+        'date': date, 'time': date * 1000, 'scramble': 'R U',
+        'flag': flag, 'device': device, 'moves': [],
+    }
+
+
+class TestLoadAllSolves(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+        patcher = patch('term_timer.in_out.SAVE_DIRECTORY', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        save_records(3, 'default', [record(1), record(4, 'GAN'), record(6)])
+        save_records(
+            3, 'one', [record(2, 'GAN', DNF), record(4), record(7, 'GAN')],
+        )
+        save_records(3, 'two', [record(5, flag=PLUS_TWO), record(3)])
+
+    def summary(self, solves):
+        return [(solve.date, solve.session, solve.solve_id) for solve in solves]
+
+    def test_merge(self):
+        solves = load_all_solves(3, [], [], [])
+
+        self.assertEqual(
+            self.summary(solves),
+            [
+                (1, 'default', 1), (2, 'one', 1), (3, 'two', 2),
+                (4, 'one', 2), (5, 'two', 1), (6, 'default', 3),
+                (7, 'one', 3),
+            ],
+        )
+
+    def test_devices(self):
+        solves = load_all_solves(3, [], ['two'], ['GAN'])
+
+        self.assertEqual(
+            self.summary(solves),
+            [(2, 'one', 1), (4, 'default', 2), (7, 'one', 3)],
+        )
+
+        solves = load_all_solves(3, ['default'], [], ['GAN'])
+
+        self.assertEqual(self.summary(solves), [(4, 'default', 2)])
+
+    def test_loader(self):
+        loaded = []
+
+        def loader(cube, session):
+            loaded.append(session)
+            return load_solves(cube, session)
+
+        solves = load_all_solves(
+            3, ['one', 'two'], [], ['GAN'], loader=loader,
+        )
+
+        self.assertEqual(sorted(loaded), ['one', 'two'])
+        self.assertEqual([solve.date for solve in solves], [2, 7])
+
+
+class TestManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+        patcher = patch('term_timer.in_out.SAVE_DIRECTORY', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        save_records(
+            3, 'one',
+            [record(2, 'GAN', DNF), record(4, flag=PLUS_TWO), record(7, 'GAN')],
+        )
+
+    def test_save(self):
+        stat = (self.path / '3x3x3-one.json').stat()
+        sessions = load_manifest()['sessions']
+        summary = sessions['3x3x3-one.json'].pop('summary')
+
+        self.assertEqual(
+            sessions,
+            {
+                '3x3x3-one.json': {
+                    'cube': 3,
+                    'session': 'one',
+                    'count': 3,
+                    'first': 2,
+                    'last': 7,
+                    'best': 7000,
+                    'devices': ['GAN'],
+                    'sorted': True,
+                    'version': [stat.st_mtime_ns, stat.st_size],
+                },
+            },
+        )
+        self.assertEqual(
+            (summary['count'], summary['dnf'], summary['total']),
+            (3, 1, 2_000_011_000),
+        )
+        self.assertEqual(sum(summary['sketch'].values()), 2)
+
+        save_records(3, 'one', [record(4, flag=PLUS_TWO)])
+
+        self.assertEqual(
+            load_manifest()['sessions']['3x3x3-one.json']['best'],
+            2_000_004_000,
+        )
+
+        save_records(4, 'default', [record(1)])
+
+        self.assertEqual(list_sessions(4), ['default'])
+        self.assertEqual(list_sessions(3), ['default', 'one'])
+        self.assertEqual(load_manifest()['sessions']['4x4x4.json']['count'], 1)
+
+    def test_save_without_rebuild(self):
+        save_records(3, 'two', [record(1)])
+        save_records(3, 'three', [record(5)])
+
+        with patch('term_timer.in_out.rebuild_manifest') as rebuild, \
+                patch('term_timer.in_out.load_records') as load:
+            save_records(3, 'one', [record(8)])
+
+            rebuild.assert_not_called()
+            load.assert_not_called()
+
+            self.assertEqual(
+                read_manifest()['sessions']['3x3x3-one.json']['first'], 8,
+            )
+            self.assertEqual(len(load_manifest()['sessions']), 3)
+
+    def test_refresh_reads_changed_files(self):
+        entry = write_records(3, 'two', [record(1)])
+        (self.path / '3x3x3-three.json').write_text(
+            json.dumps([record(5)]),
+        )
+
+        with patch(
+                'term_timer.in_out.load_records', wraps=load_records,
+        ) as load:
+            update_manifest({'3x3x3-two.json': entry})
+
+        load.assert_called_once_with(3, 'three')
+        self.assertEqual(
+            sorted(
+                entry['session']
+                for entry in read_manifest()['sessions'].values()
+            ),
+            ['one', 'three', 'two'],
+        )
+
+    def test_files_added_by_hand(self):
+        (self.path / '3x3x3-two.json').write_text(
+            json.dumps([record(1), record(3)]),
+        )
+
+        self.assertEqual(list_sessions(3), ['default', 'one', 'two'])
+        self.assertEqual(
+            load_manifest()['sessions']['3x3x3-two.json']['count'], 2,
+        )
+
+    def test_rebuild(self):
+        manifest = self.path / MANIFEST_NAME
+        manifest.write_text('{')
+
+        self.assertEqual(list_sessions(3), ['default', 'one'])
+
+        rebuild_manifest()
+        self.assertEqual(
+            load_manifest()['sessions']['3x3x3-one.json']['count'], 3,
+        )
+
+    def test_edited_in_place(self):
+        path = self.path / '3x3x3-one.json'
+        with path.open('r+', encoding='utf-8') as fd:
+            fd.truncate()
+            json.dump([record(1)], fd)
+
+        self.assertEqual(
+            load_manifest()['sessions']['3x3x3-one.json']['count'], 1,
+        )
+        self.assertEqual(
+            read_manifest()['sessions']['3x3x3-one.json']['count'], 1,
+        )
+
+    def test_concurrent_saves(self):
+        sessions = [f'session-{ i }' for i in range(16)]
+
+        with get_context('fork').Pool(8) as pool:
+            pool.starmap(
+                save_records,
+                [(3, session, [record(1)]) for session in sessions],
+            )
+
+        self.assertEqual(
+            sorted(
+                entry['session']
+                for entry in read_manifest()['sessions'].values()
+            ),
+            sorted(['one', *sessions]),
+        )
+
+    def test_older_format(self):
+        manifest = self.path / MANIFEST_NAME
+        data = json.loads(manifest.read_text(encoding='utf-8'))
+        del data['format']
+        manifest.write_text(json.dumps(data), encoding='utf-8')
+
+        self.assertIn(
+            'summary', load_manifest()['sessions']['3x3x3-one.json'],
+        )
+        self.assertEqual(
+            json.loads(manifest.read_text(encoding='utf-8'))['format'],
+            MANIFEST_FORMAT,
+        )
+
+
+def timed_record(date, offset=0, flag=''):
+    return {
+        **record(date, flag=flag),
+        'time': (9 + (date * 7 + offset) % 13) * SECOND + SECOND // 2 + date,
+    }
+
+
+class TestLoadSummary(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+        patcher = patch('term_timer.in_out.SAVE_DIRECTORY', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        save_records(
+            3, 'default',
+            [
+                timed_record(date, flag=DNF if date % 9 == 0 else '')
+                for date in range(1, 41)
+            ],
+        )
+        save_records(
+            3, 'one',
+            [
+                timed_record(date, 5, PLUS_TWO if date % 4 == 0 else '')
+                for date in range(30, 61)
+            ],
+        )
+        save_records(
+            3, 'two',
+            [
+                timed_record(date, flag=DNF if date % 5 == 0 else '')
+                for date in range(100, 121)
+            ],
+        )
+
+    def test_merged_as_loaded(self):
+        summary = load_summary(3, [], [])
+        stats = Statistics(load_all_solves(3, [], [], []))
+
+        self.assertEqual(summary.count, stats.total)
+        self.assertEqual(summary.count, 40 + 31 - 11 + 21)
+        self.assertEqual(summary.best, stats.best)
+        self.assertEqual(summary.worst, stats.worst)
+        self.assertEqual(summary.mean, stats.mean)
+        self.assertAlmostEqual(summary.stdev, stats.stdev, delta=1)
+
+    def test_sketched_as_stack(self):
+        for includes in ([], ['one']):
+            with self.subTest(includes=includes):
+                stack = load_all_solves(3, includes, [], [])
+                exact = Statistics(stack)
+                sketched = Statistics(stack, load_summary(3, includes, []))
+
+                self.assertAlmostEqual(
+                    sketched.median, exact.median,
+                    delta=exact.median * SKETCH_ACCURACY,
+                )
+                self.assertEqual(
+                    sketched.repartition,
+                    [
+                        (int(count), int(edge))
+                        for count, edge in exact.repartition
+                    ],
+                )
+
+        mostly_dnf = Statistics(
+            load_all_solves(3, ['two'], [], []),
+            TimeSummary.from_times([0, 0, 0, 12 * SECOND]),
+        )
+        self.assertEqual(mostly_dnf.median, 0)
+
+    def test_single_session(self):
+        summary = load_summary(3, ['default'], [])
+        stats = Statistics(load_all_solves(3, ['default'], [], []))
+
+        self.assertEqual(summary.count, 40)
+        self.assertEqual(summary.dnf, 4)
+        self.assertEqual(summary.mean, stats.mean)
+        self.assertAlmostEqual(summary.stdev, stats.stdev, delta=1)
@@ -0,0 +1,133 @@
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+from urllib.request import urlopen
+from wsgiref.simple_server import WSGIServer
+from wsgiref.simple_server import make_server
+
+from bottle import response
+
+from term_timer.server.app import FILTERS
+from term_timer.server.app import PRECOMPILED_TEMPLATES
+from term_timer.server.app import PooledWSGIServer
+from term_timer.server.app import RichHandler
+from term_timer.server.app import View
+from term_timer.server.app import client_disconnected
+from term_timer.server.app import create_environment
+from term_timer.server.app import pooled_server_class
+
+
+def slow_app(_environ, start_response):
+    time.sleep(0.2)
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [b'ok']
+
+
+class TestPooledServer(unittest.TestCase):
+
+    def test_server_class(self):
+        self.assertIs(pooled_server_class(1), WSGIServer)
+
+        server_class = pooled_server_class(4)
+
+        self.assertTrue(issubclass(server_class, PooledWSGIServer))
+        self.assertEqual(server_class.pool_size, 4)
+
+    def test_concurrent_requests(self):
+        server = make_server(
+            '127.0.0.1', 0, slow_app,
+            pooled_server_class(4),
+            RichHandler,
+        )
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        url = f'http://127.0.0.1:{ server.server_port }/'
+
+        def fetch(_):
+            with urlopen(url) as response:  # noqa: S310
+                return response.read()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(fetch, range(4)))
+        duration = time.perf_counter() - start
+
+        self.assertEqual(results, [b'ok'] * 4)
+        self.assertLess(duration, 0.6)
+
+
+class TestClientDisconnected(unittest.TestCase):
+
+    def test_client_disconnected(self):
+        server, client = socket.socketpair()
+        self.addCleanup(server.close)
+
+        stream = server.makefile('rb')
+        self.addCleanup(stream.close)
+        environ = {'wsgi.input': stream}
+
+        self.assertFalse(client_disconnected(environ))
+
+        client.close()
+
+        self.assertTrue(client_disconnected(environ))
+
+    def test_no_socket(self):
+        self.assertFalse(client_disconnected({}))
+
+
+class TestEnvironment(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache_directory = Path(directory.name) / 'templates'
+
+        patcher = patch(
+            'term_timer.server.app.TEMPLATES_CACHE_DIRECTORY',
+            self.cache_directory,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_create_environment(self):
+        environment = create_environment()
+
+        for name in FILTERS:
+            self.assertIn(name, environment.filters)
+        self.assertIn('static', environment.globals)
+        self.assertFalse(environment.auto_reload)
+        self.assertEqual(list(self.cache_directory.iterdir()), [])
+
+    def test_precompile(self):
+        environment = create_environment(debug=True, precompile=True)
+
+        self.assertTrue(environment.auto_reload)
+        self.assertGreaterEqual(
+            len(list(self.cache_directory.iterdir())),
+            len(PRECOMPILED_TEMPLATES),
+        )
+
+    def test_as_view_timing(self):
+        class TestView(View):
+            template_name = '404.html'
+
+            def get_context(self):
+                return {'message': 'Not found'}
+
+        View.environment = create_environment()
+        self.addCleanup(setattr, View, 'environment', None)
+        response.bind()
+
+        content = TestView().as_view(debug=False)
+
+        self.assertIn('Not found', content)
+        self.assertIn('render;dur=', response.get_header('Server-Timing'))
@@ -0,0 +1,193 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from wsgiref.util import setup_testing_defaults
+
+from term_timer.server.app import Server
+from term_timer.tests.test_server_cache import write_session
+
+SECOND = 1_000_000_000
+
+
+class TestApi(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+        patcher = patch('term_timer.in_out.SAVE_DIRECTORY', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        write_session(
+            self.path / '3x3x3.json',
+            [time * SECOND for time in range(10, 30)],
+        )
+
+        self.app = Server().create_app(debug=False)
+
+    def get(self, path, query='', headers=None):
+        environ = {
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+            **(headers or {}),
+        }
+        setup_testing_defaults(environ)
+
+        result = {}
+
+        def start_response(status, response_headers, exc_info=None):
+            if exc_info:
+                raise exc_info[1]
+            result['status'] = int(status.split(' ')[0])
+            result['headers'] = dict(response_headers)
+
+        body = b''.join(self.app(environ, start_response))
+        result['data'] = json.loads(body) if body else None
+
+        return result
+
+    def test_solves(self):
+        result = self.get('/api/v1/3/default/solves', 'offset=5&limit=2')
+
+        self.assertEqual(result['status'], 200)
+        self.assertEqual(
+            result['headers']['Content-Type'], 'application/json',
+        )
+        self.assertEqual(result['data']['version'], 1)
+        self.assertEqual(result['data']['total'], 20)
+        self.assertEqual(
+            result['data']['fields'], ['id', 'date', 'time', 'flag'],
+        )
+        self.assertEqual(
+            result['data']['solves'],
+            [
+                [6, 1_700_000_005, 15_000, ''],
+                [7, 1_700_000_006, 16_000, ''],
+            ],
+        )
+
+    def test_solves_fields(self):
+        result = self.get(
+            '/api/v1/3/default/solves', 'fields=id,scramble&limit=1',
+        )
+
+        self.assertEqual(result['data']['solves'], [[1, "R U R'"]])
+
+    def test_solves_desc(self):
+        data = self.get(
+            '/api/v1/3/default/solves', 'order=desc&offset=18&limit=5',
+        )['data']
+
+        self.assertEqual(data['order'], 'desc')
+        self.assertEqual(
+            data['solves'],
+            [
+                [2, 1_700_000_001, 11_000, ''],
+                [1, 1_700_000_000, 10_000, ''],
+            ],
+        )
+
+    def test_solves_aggregated(self):
+        data = self.get(
+            '/api/v1/3/default/solves',
+            'fields=id,solve_id,session,grade,score&limit=2',
+        )['data']
+
+        self.assertEqual(
+            data['solves'],
+            [[1, 1, 'default', None, None], [2, 2, 'default', None, None]],
+        )
+
+        data = self.get(
+            '/api/v1/3/default/solves', 'step=oll&case_uid=oll-21',
+        )['data']
+
+        self.assertEqual(data['total'], 0)
+        self.assertEqual(data['solves'], [])
+
+    def test_solves_invalid(self):
+        for query in ('fields=id,secret', 'limit=0', 'limit=5000',
+                      'offset=-1', 'offset=a', 'order=up'):
+            with self.subTest(query=query):
+                result = self.get('/api/v1/3/default/solves', query)
+
+                self.assertEqual(result['status'], 400)
+                self.assertIn('error', result['data'])
+
+    def test_missing_session(self):
+        result = self.get('/api/v1/3/unknown/solves')
+
+        self.assertEqual(result['status'], 404)
+        self.assertEqual(result['data']['error'], 'No solve to display')
+
+    def test_stats(self):
+        data = self.get('/api/v1/3/default/stats')['data']
+
+        self.assertEqual(data['total'], 20)
+        self.assertEqual(data['best'], 10_000)
+        self.assertEqual(data['worst'], 29_000)
+        self.assertEqual(data['ao5'], 27_000)
+        self.assertEqual(data['best_ao5'], 12_000)
+        self.assertIsNone(data['ao100'])
+
+    def test_trend(self):
+        data = self.get('/api/v1/3/default/trend', 'window=5')['data']
+
+        self.assertEqual(len(data['times']), 20)
+        self.assertEqual(list(data['averages']), ['ao5'])
+        self.assertEqual(data['averages']['ao5'][:5], [None] * 4 + [12_000])
+        self.assertEqual(data['averages']['ao5'][-1], 27_000)
+
+        result = self.get('/api/v1/3/default/trend', 'window=0')
+
+        self.assertEqual(result['status'], 400)
+
+    def test_trend_window(self):
+        data = self.get(
+            '/api/v1/3/default/trend', 'start=5&end=15&width=4',
+        )['data']
+
+        self.assertEqual((data['start'], data['end']), (5, 15))
+        self.assertEqual(len(data['indices']), 4)
+        self.assertEqual(data['indices'][0], 6)
+        self.assertEqual(data['indices'][-1], 15)
+        self.assertEqual(
+            data['times'],
+            [index * 1_000 + 9_000 for index in data['indices']],
+        )
+
+        with patch('term_timer.server.api.TREND_POINTS', 6):
+            data = self.get('/api/v1/3/default/trend')['data']
+
+        self.assertEqual(len(data['indices']), 6)
+
+        for query in ('start=20', 'start=5&end=5', 'width=2'):
+            with self.subTest(query=query):
+                result = self.get('/api/v1/3/default/trend', query)
+
+                self.assertEqual(result['status'], 400)
+
+    def test_cases(self):
+        data = self.get('/api/v1/3/default/cases')['data']
+
+        self.assertEqual(data['total'], 0)
+        self.assertEqual(data['steps'], {})
+
+        result = self.get('/api/v1/3/default/cases', 'step=oll')
+
+        self.assertEqual(result['status'], 404)
+
+    def test_not_modified(self):
+        result = self.get('/api/v1/3/default/stats')
+        etag = result['headers']['Etag']
+
+        result = self.get(
+            '/api/v1/3/default/stats',
+            headers={'HTTP_IF_NONE_MATCH': etag},
+        )
+
+        self.assertEqual(result['status'], 304)
@@ -0,0 +1,298 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from term_timer.aggregator import AnalysisCancelledError
+from term_timer.constants import SECOND
+from term_timer.in_out import load_solves
+from term_timer.server.cache import AnalysisLRU
+from term_timer.server.cache import SessionCache
+from term_timer.server.cache import SingleFlight
+from term_timer.solve import Solve
+
+
+def write_session(path, times, start=1_700_000_000):
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    'date': start + i,
+                    'time': time,
+                    'scramble': "R U R'",
+                }
+                for i, time in enumerate(times)
+            ],
+        ),
+    )
+
+
+class TestSessionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+        patcher = patch('term_timer.in_out.SAVE_DIRECTORY', self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+        write_session(self.path / '3x3x3.json', [10, 20])
+        write_session(self.path / '3x3x3-ohn.json', [30], 1_800_000_000)
+
+        self.cache = SessionCache()
+
+    def test_load_solves_cached(self):
+        with patch(
+                'term_timer.server.cache.load_solves',
+                wraps=load_solves,
+        ) as mock_load:
+            first = self.cache.load_solves(3, 'default')
+            second = self.cache.load_solves(3, 'default')
+
+        self.assertEqual(mock_load.call_count, 1)
+        self.assertEqual(len(first), 2)
+        self.assertIs(first[0], second[0])
+        self.assertIsNot(first, second)
+
+    def test_load_solves_missing(self):
+        self.assertEqual(self.cache.load_solves(3, 'missing'), [])
+        self.assertEqual(self.cache.load_solves(4, 'default'), [])
+
+    def test_load_solves_file_changed(self):
+        self.cache.load_solves(3, 'ohn')
+
+        path = self.path / '3x3x3-ohn.json'
+        write_session(path, [30, 40])
+        os.utime(path, ns=(1, 1))
+
+        self.assertEqual(len(self.cache.load_solves(3, 'ohn')), 2)
+
+    def test_load_all_solves(self):
+        solves = self.cache.load_all_solves(3, 'all')
+
+        self.assertEqual(len(solves), 3)
+        self.assertEqual(len(self.cache.files), 2)
+
+    def test_version(self):
+        version = self.cache.version(3, 'all')
+
+        self.assertEqual(
+            [name for name, _ in version],
+            ['default', 'ohn'],
+        )
+
+        write_session(self.path / '3x3x3-ohn.json', [30, 40])
+
+        self.assertNotEqual(self.cache.version(3, 'all'), version)
+        self.assertEqual(
+            self.cache.version(3, 'default'),
+            version[:1],
+        )
+
+    @patch('term_timer.server.cache.SolvesMethodAggregator')
+    def test_aggregate_cached(self, mock_aggregator):
+        solves = self.cache.load_all_solves(3, 'default')
+
+        first = self.cache.aggregate(3, 'default', 'cf4op', solves)
+        second = self.cache.aggregate(3, 'default', 'cf4op', solves)
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_aggregator.call_count, 1)
+
+        self.cache.aggregate(3, 'default', 'lbl', solves)
+
+        self.assertEqual(mock_aggregator.call_count, 2)
+
+    @patch('term_timer.server.cache.SolvesMethodAggregator')
+    def test_invalidate(self, mock_aggregator):
+        solves = self.cache.load_all_solves(3, 'default')
+        self.cache.aggregate(3, 'default', 'cf4op', solves)
+        self.cache.aggregate(3, 'all', 'cf4op', solves)
+        self.cache.aggregate(3, 'ohn', 'cf4op', solves)
+
+        self.cache.invalidate(3, 'default')
+
+        self.assertEqual(mock_aggregator.call_count, 3)
+        self.assertEqual(self.cache.files, {})
+        self.assertEqual(
+            list(self.cache.aggregations),
+            [(3, 'ohn', 'cf4op')],
+        )
+
+    def test_indexed_solves(self):
+        solves, index = self.cache.indexed_solves(3, 'all')
+        same_solves, same_index = self.cache.indexed_solves(3, 'all')
+
+        self.assertEqual(len(solves), 3)
+        self.assertIs(solves, same_solves)
+        self.assertIs(index, same_index)
+        self.assertEqual(index.rank(solves[2]), 3)
+
+    def test_save_edited(self):
+        solves, index = self.cache.indexed_solves(3, 'default')
+        solves = list(solves)
+
+        previous_time = solves[0].final_time
+        solves[0].flag = 'DNF'
+
+        with patch('term_timer.server.cache.load_solves') as mock_load:
+            self.cache.save(
+                3, 'default', solves,
+                edited=(solves[0], previous_time),
+            )
+            saved_solves, saved_index = self.cache.indexed_solves(
+                3, 'default',
+            )
+
+        mock_load.assert_not_called()
+        self.assertIs(saved_index, index)
+        self.assertEqual(index.rank(solves[0]), 2)
+        self.assertEqual(saved_solves, solves)
+        self.assertEqual(
+            load_solves(3, 'default')[0].flag, 'DNF',
+        )
+
+    def test_save_deleted(self):
+        solves, index = self.cache.indexed_solves(3, 'default')
+        solves = list(solves)
+
+        deleted = solves.pop(0)
+        self.cache.save(3, 'default', solves, deleted=deleted)
+
+        _, saved_index = self.cache.indexed_solves(3, 'default')
+
+        self.assertIs(saved_index, index)
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.rank(solves[0]), 1)
+        self.assertEqual(len(load_solves(3, 'default')), 1)
+
+    def test_save_deleted_links(self):
+        write_session(self.path / '3x3x3.json', [10, 20, 30, 40, 50])
+
+        solves = self.cache.load_all_solves(3, 'default')
+        deleted = solves.pop(1)
+        self.cache.save(3, 'default', solves, deleted=deleted)
+
+        solves = self.cache.load_all_solves(3, 'default')
+
+        self.assertEqual(
+            [solve.solve_id for solve in solves],
+            [1, 2, 3, 4],
+        )
+
+        for solve in solves:
+            solve_id = int(solve.link_term_timer.rstrip('/').split('/')[-1])
+
+            self.assertIs(solves[solve_id - 1], solve)
+            self.assertEqual(
+                load_solves(3, 'default')[solve_id - 1].date,
+                solve.date,
+            )
+
+
+class TestAnalysisLRU(unittest.TestCase):
+
+    def test_release_oldest(self):
+        lru = AnalysisLRU(2)
+        solves = [
+            Solve(1_700_000_000 + i, SECOND, 'R U', moves='R@0 U@100')
+            for i in range(3)
+        ]
+        solutions = [solve.solution for solve in solves]
+
+        lru.touch(solves[0])
+        lru.touch(solves[1])
+        lru.touch(solves[0])
+        lru.touch(solves[2])
+
+        self.assertEqual(
+            [
+                solve.solution is solution
+                for solve, solution in zip(solves, solutions, strict=True)
+            ],
+            [True, False, True],
+        )
+        self.assertEqual(len(lru.solves), 2)
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.calls = 0
+
+    def run_concurrently(self, func, count=4):
+        results = []
+        errors = []
+
+        def target():
+            try:
+                results.append(self.single_flight.do('test', 'key', func))
+            except Exception as error:  # noqa: BLE001
+                errors.append(error)
+
+        threads = [threading.Thread(target=target) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results, errors
+
+    def test_coalesced(self):
+        def compute():
+            self.calls += 1
+            time.sleep(0.1)
+            return self.calls
+
+        results, errors = self.run_concurrently(compute)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(results, [1] * 4)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(
+            self.single_flight.counters['test'],
+            {'executed': 1, 'coalesced': 3},
+        )
+        self.assertEqual(self.single_flight.flights, {})
+
+    def test_sequential_not_coalesced(self):
+        self.single_flight.do('test', 'key', lambda: 1)
+        self.single_flight.do('test', 'key', lambda: 2)
+
+        self.assertEqual(
+            self.single_flight.counters['test'],
+            {'executed': 2, 'coalesced': 0},
+        )
+
+    def test_error_shared(self):
+        def compute():
+            self.calls += 1
+            time.sleep(0.1)
+            raise ValueError
+
+        results, errors = self.run_concurrently(compute)
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(self.calls, 1)
+
+    def test_cancelled_retried(self):
+        def compute():
+            self.calls += 1
+            time.sleep(0.1)
+            if self.calls == 1:
+                raise AnalysisCancelledError
+            return self.calls
+
+        results, errors = self.run_concurrently(compute, 3)
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(results, [2, 2])
+        self.assertEqual(self.calls, 2)
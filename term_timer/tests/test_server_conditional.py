@@ -0,0 +1,89 @@
+import unittest
+
+from bottle import request
+from bottle import response
+
+from term_timer.server.conditional import last_modified
+from term_timer.server.conditional import not_modified
+from term_timer.server.conditional import serve_static
+from term_timer.server.conditional import static_hash
+from term_timer.server.conditional import static_url
+from term_timer.server.conditional import view_etag
+
+VERSION = (
+    ('default', (1_700_000_000_000_000_000, 120)),
+    ('ohn', None),
+)
+
+
+def bind(query='', headers=None):
+    environ = {
+        'PATH_INFO': '/',
+        'QUERY_STRING': query,
+        'REQUEST_METHOD': 'GET',
+    }
+    environ.update(headers or {})
+
+    request.bind(environ)
+    response.bind()
+
+
+class TestConditional(unittest.TestCase):
+
+    def test_view_etag(self):
+        bind()
+        etag = view_etag(VERSION, 'session', 3, 'default')
+
+        self.assertEqual(etag, view_etag(VERSION, 'session', 3, 'default'))
+        self.assertNotEqual(etag, view_etag(VERSION, 'session', 3, 'ohn'))
+        self.assertNotEqual(
+            etag, view_etag(VERSION[:1], 'session', 3, 'default'),
+        )
+
+        bind('m=lbl')
+
+        self.assertNotEqual(etag, view_etag(VERSION, 'session', 3, 'default'))
+
+    def test_last_modified(self):
+        self.assertEqual(last_modified(VERSION), 1_700_000_000)
+        self.assertIsNone(last_modified((('ohn', None),)))
+
+    def test_not_modified(self):
+        bind()
+
+        self.assertIsNone(not_modified(VERSION, 'index'))
+
+        etag = response.get_header('ETag')
+        self.assertTrue(etag)
+        self.assertEqual(
+            response.get_header('Last-Modified'),
+            'Tue, 14 Nov 2023 22:13:20 GMT',
+        )
+
+        bind(headers={'HTTP_IF_NONE_MATCH': f'"other", { etag }'})
+        cached = not_modified(VERSION, 'index')
+
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.get_header('ETag'), etag)
+
+    def test_static_url(self):
+        content_hash = static_hash('css/style.css')
+
+        self.assertEqual(len(content_hash), 12)
+        self.assertEqual(
+            static_url('css/style.css'),
+            f'/static/css/style.css?v={ content_hash }',
+        )
+        self.assertEqual(static_url('missing.css'), '/static/missing.css')
+
+    def test_serve_static(self):
+        bind(f'v={ static_hash("css/style.css") }')
+        served = serve_static('css/style.css')
+
+        self.assertEqual(served.status_code, 200)
+        self.assertIn('immutable', served.get_header('Cache-Control'))
+
+        bind()
+        served = serve_static('css/style.css')
+
+        self.assertEqual(served.get_header('Cache-Control'), 'no-cache')
@@ -0,0 +1,74 @@
+import math
+import unittest
+
+from term_timer.server.downsample import lttb
+from term_timer.server.downsample import trend_series
+from term_timer.stats import StatisticsTools
+
+
+class TestLttb(unittest.TestCase):
+
+    def test_under_threshold(self):
+        self.assertEqual(lttb([3, 1, 2], 10), [0, 1, 2])
+        self.assertEqual(lttb([3, 1, 2, 4], 2), [0, 1, 2, 3])
+
+    def test_threshold(self):
+        values = [
+            int(1_000 + 500 * math.sin(i / 10))
+            for i in range(1_000)
+        ]
+        indices = lttb(values, 100)
+
+        self.assertEqual(len(indices), 100)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 999)
+        self.assertEqual(indices, sorted(set(indices)))
+
+    def test_keeps_peaks(self):
+        values = [1_000] * 1_000
+        values[500] = 100
+        values[700] = 5_000
+
+        indices = lttb(values, 20)
+
+        self.assertIn(500, indices)
+        self.assertIn(700, indices)
+
+    def test_skips_dnf(self):
+        values = [1_000 + (i % 7) * 100 for i in range(1_000)]
+        for index in range(0, 1_000, 3):
+            values[index] = 0
+
+        indices = lttb(values, 100)
+
+        self.assertEqual(
+            [index for index in indices[1:-1] if not values[index]], [],
+        )
+
+    def test_trend_series(self):
+        stack_time = [1_000 + (i * 37) % 101 for i in range(500)]
+
+        indices, times, averages = trend_series(
+            stack_time, (5, 12), 100, 300, 50,
+        )
+
+        self.assertEqual(len(indices), 50)
+        self.assertEqual(indices[0], 100)
+        self.assertEqual(indices[-1], 299)
+        self.assertEqual(times, [stack_time[i] for i in indices])
+        self.assertEqual(
+            averages[12],
+            [
+                StatisticsTools.ao(12, stack_time[:i + 1])
+                for i in indices
+            ],
+        )
+
+    def test_trend_series_full(self):
+        stack_time = [1_000, 2_000, 3_000]
+
+        indices, times, averages = trend_series(stack_time, (5,))
+
+        self.assertEqual(indices, [0, 1, 2])
+        self.assertEqual(times, stack_time)
+        self.assertEqual(averages, {5: [-1, -1, -1]})
@@ -1,4 +1,6 @@
+import copy
 import unittest
+from unittest.mock import patch
 
 from term_timer.constants import DNF
 from term_timer.constants import PLUS_TWO
@@ -80,3 +82,65 @@ class TestSolveModule(unittest.TestCase):
         # Test with DNF
         solve.flag = DNF
         self.assertIn('DNF', str(solve))
+
+    def test_solve_for_method(self):
+        """Test a copy is used to analyse with another method."""
+        solve = Solve(1000000000, 1012345678, 'F R U', session='ohn')
+
+        self.assertIs(solve.for_method(solve.method_name), solve)
+
+        other = solve.for_method('lbl')
+
+        self.assertIsNot(other, solve)
+        self.assertEqual(other.method_name, 'lbl')
+        self.assertEqual(other.session, 'ohn')
+        self.assertEqual(other.as_save, solve.as_save)
+        self.assertNotEqual(solve.method_name, 'lbl')
+
+    def test_solve_slots(self):
+        """Test the saved fields are slotted and the labels interned."""
+        solve = Solve(
+            1000000000, 1012345678, 'F R U',
+            device='gan'.upper(),
+        )
+        other = Solve(1000000001, 1012345678, 'F R U', device='GAN')
+
+        self.assertFalse(hasattr(solve, '__dict__'))
+        self.assertIsNone(solve.cache)
+        self.assertIs(solve.device, other.device)
+        self.assertIs(solve.session, other.session)
+
+        clone = copy.deepcopy(solve)
+
+        self.assertEqual(clone.as_save, solve.as_save)
+        self.assertEqual(clone.session, 'default')
+
+    def test_solve_release_analysis(self):
+        """Test the cached analysis is dropped and computed again."""
+        solve = Solve(
+            1000000000, 1012345678, "R U R' U'",
+            moves="R@0 U@120 R'@300 U'@450",
+        )
+        solution = solve.solution
+        datetime = solve.datetime
+        tps = solve.tps
+
+        self.assertIs(solve.solution, solution)
+
+        solve.release_analysis()
+
+        with patch.object(Solve, 'compute_tps') as mock_tps:
+            self.assertEqual(solve.tps, tps)
+
+        mock_tps.assert_not_called()
+        self.assertIsNot(solve.datetime, datetime)
+        self.assertIsNot(solve.solution, solution)
+        self.assertEqual(str(solve.solution), str(solution))
+        self.assertFalse(hasattr(solve, '__dict__'))
+
+        solve = Solve(1000000000, 1012345678, 'F R U')
+        self.assertIsNotNone(solve.datetime)
+
+        solve.release_analysis()
+
+        self.assertIsNone(solve.cache)
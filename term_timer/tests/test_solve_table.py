@@ -0,0 +1,72 @@
+import unittest
+
+from term_timer.constants import DNF
+from term_timer.constants import PLUS_TWO
+from term_timer.constants import SECOND
+from term_timer.solve import Solve
+from term_timer.solve_table import SolveTable
+
+
+class TestSolveTable(unittest.TestCase):
+
+    def setUp(self):
+        self.solves = [
+            Solve(
+                1_704_103_200, 12 * SECOND, "R U R'", '',
+                'Timer', 'GAN', 'default', moves='R@0 U@120',
+            ),
+            Solve(
+                1_704_103_260, 10 * SECOND, "R U R'", PLUS_TWO,
+                'Timer', '', 'old',
+            ),
+            Solve(
+                1_704_189_600, 15 * SECOND, "R U R'", DNF,
+                'Timer', 'GAN', 'default',
+            ),
+            Solve(
+                1_735_725_600, 11 * SECOND, "R U R'", '',
+                'Timer', 'GAN', 'default',
+            ),
+        ]
+        self.table = SolveTable(self.solves)
+
+    def test_columns(self):
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(
+            self.table.date.tolist(),
+            [solve.date for solve in self.solves],
+        )
+        self.assertEqual(self.table.flag.tolist(), [0, 1, 2, 0])
+        self.assertEqual(self.table.sessions, ['default', 'old'])
+        self.assertEqual(self.table.session.tolist(), [0, 1, 0, 0])
+        self.assertEqual(self.table.devices, ['GAN', ''])
+        self.assertEqual(self.table.device.tolist(), [0, 1, 0, 0])
+        self.assertEqual(self.table.moves(0), 'R@0 U@120')
+
+    def test_final_time(self):
+        self.assertEqual(
+            self.table.final_time.tolist(),
+            [solve.final_time for solve in self.solves],
+        )
+
+    def test_session_counts(self):
+        self.assertEqual(
+            self.table.session_counts(),
+            {'default': 3, 'old': 1},
+        )
+
+    def test_day_counts(self):
+        expected = {}
+        for solve in self.solves:
+            date = solve.datetime.astimezone().strftime('%Y-%m-%d')
+            expected[date] = expected.get(date, 0) + 1
+
+        self.assertEqual(self.table.day_counts(), expected)
+
+    def test_empty(self):
+        table = SolveTable([])
+
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.final_time.tolist(), [])
+        self.assertEqual(table.session_counts(), {})
+        self.assertEqual(table.day_counts(), {})
@@ -47,6 +47,20 @@ class TestStatisticsTools(unittest.TestCase):
         ao6 = self.stats_tools.ao(6, self.stats_tools.stack_time)
         self.assertEqual(ao6, -1)
 
+    def test_rolling_ao(self):
+        """Test average of N ending at each solve."""
+        stack_time = self.stats_tools.stack_time
+        aos = self.stats_tools.rolling_ao(3, stack_time)
+
+        self.assertEqual(
+            aos,
+            [
+                self.stats_tools.ao(3, stack_time[:i + 1])
+                for i in range(len(stack_time))
+            ],
+        )
+        self.assertEqual(aos[:2], [-1, -1])
+
     def test_best_mo(self):
         """Test finding the best mean of N in the history."""
         # For mo3, we can have 3 different mo3s:
@@ -229,3 +243,38 @@ class TestStatisticsReporterListing(unittest.TestCase):
 
         # Last call should have #1 (oldest)
         self.assertIn('#1', call_args_list[4][0][0])
+
+
+class TestStatisticsBest(unittest.TestCase):
+
+    def test_best_matches_windows(self):
+        """Test best averages against every window of a long history."""
+        solves = [
+            Solve(
+                index, (10 + (index * 37) % 23) * SECOND, 'F R U',
+                'DNF' if index % 17 == 0 else '',
+            )
+            for index in range(1, 200)
+        ]
+        stats = Statistics(solves)
+        times = stats.stack_time
+
+        for limit in (5, 12, 100):
+            with self.subTest(limit=limit):
+                self.assertEqual(
+                    stats.best_ao(limit),
+                    min(
+                        ao
+                        for end in range(limit, len(times) + 1)
+                        if (ao := stats.ao(limit, times[:end]))
+                    ),
+                )
+
+        self.assertEqual(
+            stats.best_mo(3),
+            min(
+                mo
+                for end in range(3, len(times) + 1)
+                if (mo := stats.mo(3, times[:end]))
+            ),
+        )
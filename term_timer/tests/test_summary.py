@@ -0,0 +1,164 @@
+import json
+import unittest
+
+import numpy as np
+
+from term_timer.constants import SECOND
+from term_timer.solve import Solve
+from term_timer.stats import Statistics
+from term_timer.stats import StatisticsTools
+from term_timer.summary import SKETCH_ACCURACY
+from term_timer.summary import SKETCH_BUCKETS
+from term_timer.summary import QuantileSketch
+from term_timer.summary import TimeSummary
+
+ONE = [12 * SECOND, 0, 10 * SECOND, 15_500_000_000, 11 * SECOND, 9 * SECOND]
+
+TWO = [8_250_000_000, 14 * SECOND, 0, 0, 13 * SECOND]
+
+
+class TestQuantileSketch(unittest.TestCase):
+
+    def setUp(self):
+        generator = np.random.default_rng(42)
+        self.times = generator.lognormal(23.3, 0.3, 10_000).astype(np.int64)
+        self.sketch = QuantileSketch.from_times(self.times)
+
+    def test_quantile(self):
+        ordered = np.sort(self.times)
+
+        for q in (0, 0.01, 0.25, 0.5, 0.75, 0.99, 1):
+            with self.subTest(q=q):
+                actual = ordered[int(q * (len(ordered) - 1))]
+
+                self.assertLessEqual(
+                    abs(self.sketch.quantile(q) - actual),
+                    actual * SKETCH_ACCURACY + 1,
+                )
+
+    def test_merge(self):
+        merged = (
+            QuantileSketch.from_times(self.times[:3_000])
+            + QuantileSketch.from_times(self.times[3_000:])
+        )
+
+        self.assertEqual(merged.buckets, self.sketch.buckets)
+        self.assertEqual(merged.count, len(self.times))
+
+    def test_collapse(self):
+        times = np.geomspace(1, 10 ** 15, 5_000).astype(np.int64)
+        sketch = QuantileSketch.from_times(times)
+
+        self.assertEqual(len(sketch.buckets), SKETCH_BUCKETS)
+        self.assertEqual(sketch.count, len(times))
+        self.assertLessEqual(
+            abs(sketch.quantile(0.9) - times[int(0.9 * 4_999)]),
+            times[int(0.9 * 4_999)] * SKETCH_ACCURACY,
+        )
+
+    def test_histogram(self):
+        histogram = self.sketch.histogram(SECOND)
+        counts, edges = np.histogram(
+            self.times, bins=np.arange(0, 100 * SECOND, SECOND),
+        )
+        expected = {
+            int(edge): int(count)
+            for count, edge in zip(counts, edges, strict=False)
+            if count
+        }
+
+        self.assertEqual(sum(histogram.values()), len(self.times))
+
+        for edge in histogram.keys() | expected.keys():
+            near_edges = np.sum(
+                (np.abs(self.times - edge) <= edge * SKETCH_ACCURACY)
+                | (
+                    np.abs(self.times - edge - SECOND)
+                    <= (edge + SECOND) * SKETCH_ACCURACY
+                ),
+            )
+            self.assertLessEqual(
+                abs(histogram.get(edge, 0) - expected.get(edge, 0)),
+                near_edges,
+            )
+
+
+class TestTimeSummary(unittest.TestCase):
+
+    def test_from_times(self):
+        summary = TimeSummary.from_times(ONE)
+
+        self.assertEqual(summary.count, 6)
+        self.assertEqual(summary.dnf, 1)
+        self.assertEqual(summary.best, 9 * SECOND)
+        self.assertEqual(summary.worst, 15_500_000_000)
+        self.assertEqual(summary.mean, int(np.mean(ONE)))
+        self.assertEqual(summary.stdev, int(np.std(ONE)))
+        self.assertAlmostEqual(
+            summary.median, np.median(ONE),
+            delta=11 * SECOND * SKETCH_ACCURACY,
+        )
+        self.assertEqual(summary.percentile(0), 0)
+        self.assertEqual(summary.percentile(1 / 5), summary.best)
+        self.assertEqual(summary.percentile(1), summary.worst)
+        self.assertEqual(
+            summary.averages,
+            {5: StatisticsTools.ao(5, ONE[1:])},
+        )
+
+    def test_merge(self):
+        merged = TimeSummary.from_times(ONE) + TimeSummary.from_times(TWO)
+        expected = TimeSummary.from_times(ONE + TWO)
+
+        for field in ('count', 'dnf', 'total', 'best', 'worst', 'median'):
+            with self.subTest(field=field):
+                self.assertEqual(
+                    getattr(merged, field), getattr(expected, field),
+                )
+
+        self.assertAlmostEqual(merged.squares, expected.squares)
+        self.assertEqual(merged.sketch.buckets, expected.sketch.buckets)
+        self.assertEqual(merged.averages, {})
+
+    def test_merge_empty(self):
+        summary = TimeSummary.from_times(ONE)
+
+        self.assertEqual(
+            sum([summary], TimeSummary()).as_dict(),
+            summary.as_dict(),
+        )
+        self.assertEqual(TimeSummary().median, 0)
+        self.assertEqual(TimeSummary.from_times([0, 0]).mean, 0)
+
+    def test_dict(self):
+        summary = TimeSummary.from_times(ONE)
+        data = json.loads(json.dumps(summary.as_dict()))
+
+        self.assertEqual(TimeSummary.from_dict(data).as_dict(), data)
+
+    def test_statistics(self):
+        solves = [
+            Solve(index, time, 'F R U')
+            for index, time in enumerate(
+                [12_300_000_000, 10_400_000_000, 15_600_000_000,
+                 11_700_000_000, 9_200_000_000, 21_500_000_000],
+                start=1,
+            )
+        ]
+        summary = TimeSummary.from_times(
+            [solve.final_time for solve in solves],
+        )
+
+        exact = Statistics(solves)
+        sketched = Statistics(solves, summary)
+
+        self.assertEqual(sketched.best, exact.best)
+        self.assertEqual(sketched.worst, exact.worst)
+        self.assertEqual(
+            sketched.repartition,
+            [(int(count), int(edge)) for count, edge in exact.repartition],
+        )
+        self.assertAlmostEqual(
+            sketched.median, exact.median,
+            delta=exact.median * SKETCH_ACCURACY,
+        )
@@ -0,0 +1,80 @@
+import asyncio
+import time
+import unittest
+
+from term_timer.ticker import Ticker
+
+
+class TestTicker(unittest.TestCase):
+
+    def test_every(self):
+        ticks = []
+
+        async def run():
+            ticker = Ticker()
+            ticker.every('display', 0.01, lambda: ticks.append(1))
+            await asyncio.sleep(0.105)
+            return ticker.stop()
+
+        jitters = asyncio.run(run())
+
+        self.assertGreaterEqual(len(ticks), 9)
+        self.assertLessEqual(len(ticks), 11)
+        self.assertEqual(jitters['display']['ticks'], len(ticks))
+        self.assertGreaterEqual(jitters['display']['max'], 0)
+
+    def test_offset_and_count(self):
+        ticks = []
+
+        async def run():
+            ticker = Ticker()
+            ticker.every(
+                'countdown', 0.01,
+                lambda: ticks.append(time.perf_counter_ns()),
+                offset=0.02,
+                count=3,
+            )
+            await asyncio.sleep(0.1)
+            ticker.stop()
+            return ticker.start_time
+
+        start_time = asyncio.run(run())
+
+        self.assertEqual(len(ticks), 3)
+        self.assertGreaterEqual(ticks[0] - start_time, 19_000_000)
+
+    def test_no_drift(self):
+        deadlines = []
+
+        async def run():
+            ticker = Ticker()
+            cadence = ticker.every('metronome', 0.01, lambda: None)
+
+            def slow():
+                deadlines.append(cadence.deadline)
+                time.sleep(0.004)
+
+            cadence.callback = slow
+            await asyncio.sleep(0.1)
+            ticker.stop()
+            return cadence.origin
+
+        origin = asyncio.run(run())
+
+        for index, deadline in enumerate(deadlines):
+            self.assertAlmostEqual(deadline, origin + index * 0.01)
+
+    def test_skip_missed_ticks(self):
+        ticks = []
+
+        async def run():
+            ticker = Ticker()
+            ticker.every('display', 0.01, lambda: ticks.append(1))
+            await asyncio.sleep(0)
+            time.sleep(0.05)
+            await asyncio.sleep(0.005)
+            ticker.stop()
+
+        asyncio.run(run())
+
+        self.assertEqual(len(ticks), 1)
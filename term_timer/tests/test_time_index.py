@@ -0,0 +1,82 @@
+import unittest
+
+from term_timer.constants import DNF
+from term_timer.constants import PLUS_TWO
+from term_timer.constants import SECOND
+from term_timer.solve import Solve
+from term_timer.time_index import TimeIndex
+
+
+class TestTimeIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.solves = [
+            Solve(100, 12 * SECOND, "R U R'"),
+            Solve(101, 10 * SECOND, "R U R'"),
+            Solve(102, 15 * SECOND, "R U R'", DNF),
+            Solve(103, 11 * SECOND, "R U R'"),
+            Solve(104, 12 * SECOND, "R U R'"),
+        ]
+        self.index = TimeIndex(self.solves)
+
+    def test_rank(self):
+        self.assertEqual(
+            [self.index.rank(solve) for solve in self.solves],
+            [3, 1, 5, 2, 3],
+        )
+
+    def test_rank_matches_sort(self):
+        ranks = sorted(
+            solve.final_time or float('inf')
+            for solve in self.solves
+        )
+
+        for solve in self.solves:
+            self.assertEqual(
+                self.index.rank(solve),
+                ranks.index(solve.final_time or float('inf')) + 1,
+            )
+
+    def test_percentile(self):
+        self.assertEqual(self.index.percentile(self.solves[1]), 80)
+        self.assertEqual(self.index.percentile(self.solves[0]), 20)
+        self.assertEqual(self.index.percentile(self.solves[2]), 0)
+
+    def test_neighbours(self):
+        self.assertIsNone(self.index.faster(self.solves[1]))
+        self.assertEqual(self.index.slower(self.solves[1]), 4)
+        self.assertEqual(self.index.faster(self.solves[0]), 4)
+        self.assertEqual(self.index.slower(self.solves[0]), 5)
+        self.assertEqual(self.index.faster(self.solves[2]), 5)
+        self.assertIsNone(self.index.slower(self.solves[2]))
+
+    def test_update(self):
+        solve = self.solves[1]
+        previous_time = solve.final_time
+        solve.flag = PLUS_TWO
+
+        self.index.update(solve, previous_time)
+
+        self.assertEqual(self.index.rank(solve), 2)
+        self.assertEqual(self.index.rank(self.solves[3]), 1)
+        self.assertEqual(self.index.rank(self.solves[0]), 2)
+        self.assertEqual(
+            self.index.entries,
+            sorted(self.index.entries),
+        )
+
+    def test_remove(self):
+        self.solves.pop(1)
+        self.index.remove(Solve(101, 10 * SECOND, "R U R'"))
+
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.rank(self.solves[2]), 1)
+        self.assertEqual(self.index.slower(self.solves[2]), 1)
+        self.assertEqual(self.index.position(104), 3)
+
+    def test_not_chronological(self):
+        self.solves.reverse()
+        index = TimeIndex(self.solves)
+
+        self.assertFalse(index.chronological)
+        self.assertEqual(index.slower(self.solves[3]), 2)
@@ -33,7 +33,7 @@ class TestTimerModule(unittest.TestCase):
                 'hardware_received_event',
                 'console',
                 'cube_orientation',
-                'save_moves',
+                'gesture_tracker',
                 'save_gesture',
                 'save_gesture_event',
                 'countdown',
@@ -41,6 +41,7 @@ class TestTimerModule(unittest.TestCase):
                 'scramble',
                 'scrambled',
                 'scramble_oriented',
+                'scramble_tracker',
                 'counter',
                 'facelets_scrambled',
                 'scramble_completed_event',
@@ -0,0 +1,227 @@
+import random
+import unittest
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.parsing import parse_moves
+from cubing_algs.transform.degrip import degrip_full_moves
+from cubing_algs.transform.rotation import remove_final_rotations
+from cubing_algs.transform.size import compress_moves
+from cubing_algs.transform.slice import reslice_timed_moves
+from cubing_algs.transform.timing import untime_moves
+
+from term_timer.constants import RESLICE_THRESHOLD
+from term_timer.tracker import GestureTracker
+from term_timer.tracker import MovesTracker
+from term_timer.tracker import ScrambleTracker
+from term_timer.tracker import canonical_grip
+from term_timer.transform import reorient_moves
+
+
+def full_transform(orientation, timed_moves):
+    algo = parse_moves(' '.join(timed_moves)).transform(
+        reslice_timed_moves(RESLICE_THRESHOLD),
+        degrip_full_moves,
+        compress_moves,
+        untime_moves,
+    )
+    return reorient_moves(orientation, algo).transform(
+        remove_final_rotations,
+    )
+
+
+def full_gesture(orientation, timed_moves):
+    algo = reorient_moves(
+        orientation, parse_moves(' '.join(timed_moves)),
+    ).transform(
+        reslice_timed_moves(RESLICE_THRESHOLD),
+        degrip_full_moves,
+        remove_final_rotations,
+    )
+    if len(algo) < 2:
+        return ''
+
+    l_move = algo[-1].untimed
+    a_move = algo[-2].untimed
+
+    if l_move.base_move != a_move.base_move or l_move == a_move:
+        return ''
+
+    return l_move.base_move
+
+
+class TestMovesTracker(unittest.TestCase):
+
+    def test_canonical_grip(self):
+        self.assertEqual(canonical_grip(()), ())
+        self.assertEqual(canonical_grip(('x', "x'")), ())
+        self.assertEqual(canonical_grip(('y', 'y')), ('y2',))
+        self.assertLessEqual(len(canonical_grip(('x', 'y', 'z', 'x'))), 2)
+
+    def test_compress(self):
+        tracker = MovesTracker()
+
+        self.assertEqual(tracker.add('R@0'), 0)
+        self.assertEqual(tracker.add('R@500'), 0)
+        self.assertEqual(tracker.moves, ['R2'])
+
+        self.assertEqual(tracker.add('U@1000'), 1)
+        self.assertEqual(tracker.add("U'@1500"), 1)
+        self.assertEqual(tracker.moves, ['R2'])
+
+    def test_reslice(self):
+        tracker = MovesTracker()
+
+        tracker.add('U@0')
+        tracker.add('R@500')
+        self.assertEqual(tracker.add("L'@520"), 1)
+        self.assertEqual(tracker.moves, ['U', 'M'])
+
+        tracker.add('U@1000')
+        self.assertEqual(tracker.moves, ['U', 'M', 'F'])
+
+    def test_reslice_threshold(self):
+        tracker = MovesTracker()
+
+        tracker.add('R@100')
+        tracker.add("L'@500")
+
+        self.assertEqual(tracker.moves, ['R', "L'"])
+
+    def test_orientation(self):
+        tracker = MovesTracker(parse_moves('z2'))
+
+        tracker.add('R@0')
+        tracker.add('U@500')
+
+        self.assertEqual(tracker.moves, ['L', 'D'])
+
+    def test_matches_full_transform(self):
+        generator = random.Random(42)
+
+        for orientation in ('', 'z2', "y' x2"):
+            orientation_algo = parse_moves(orientation)
+
+            for _ in range(50):
+                tracker = MovesTracker(orientation_algo)
+                timed_moves = []
+                timestamp = 0
+
+                for _ in range(25):
+                    timestamp += generator.choice([10, 30, 60, 200])
+                    timed_moves.append(
+                        generator.choice('RLUDFB')
+                        + generator.choice(['', "'", '2'])
+                        + f'@{ timestamp }',
+                    )
+                    previous = list(tracker.moves)
+                    changed = tracker.add(timed_moves[-1])
+
+                    self.assertEqual(
+                        tracker.moves,
+                        list(full_transform(orientation_algo, timed_moves)),
+                    )
+                    self.assertEqual(
+                        tracker.moves[:changed],
+                        previous[:changed],
+                    )
+
+
+class TestScrambleTracker(unittest.TestCase):
+
+    def test_matched(self):
+        tracker = ScrambleTracker(Algorithm.parse_moves("R U2 F'"))
+
+        tracker.add('R@0')
+        tracker.add('U@500')
+
+        self.assertEqual(tracker.matched, 1)
+        self.assertEqual(tracker.style(0), 'move')
+        self.assertEqual(tracker.style(1), 'caution')
+
+        tracker.add('U@1000')
+        tracker.add('F@1500')
+
+        self.assertEqual(tracker.matched, 2)
+        self.assertEqual(tracker.style(2), 'caution')
+
+        tracker.add('F2@2000')
+
+        self.assertEqual(tracker.matched, 3)
+
+    def test_wrong_moves(self):
+        tracker = ScrambleTracker(Algorithm.parse_moves('R'))
+
+        tracker.add('U@0')
+        tracker.add('D@500')
+
+        self.assertEqual(tracker.matched, 0)
+        self.assertEqual(tracker.style(0), 'warning')
+        self.assertEqual(tracker.style(1), 'warning')
+
+        tracker.add("D'@1000")
+        tracker.add("U'@1500")
+        tracker.add('R@2000')
+
+        self.assertEqual(tracker.moves, ['R'])
+        self.assertEqual(tracker.matched, 1)
+
+
+class TestGestureTracker(unittest.TestCase):
+
+    def test_gesture(self):
+        tracker = GestureTracker()
+
+        tracker.add('R@100')
+        self.assertEqual(tracker.gesture(), '')
+
+        tracker.add("R'@500")
+        self.assertEqual(tracker.gesture(), 'R')
+
+    def test_same_moves(self):
+        tracker = GestureTracker()
+
+        tracker.add('U@100')
+        tracker.add('U@500')
+
+        self.assertEqual(tracker.gesture(), '')
+
+    def test_slice_gesture(self):
+        tracker = GestureTracker()
+
+        for timed_move in ('R@100', "L'@110", "R'@500", 'L@510'):
+            tracker.add(timed_move)
+
+        self.assertEqual(tracker.gesture(), 'M')
+
+    def test_bounded_window(self):
+        tracker = GestureTracker()
+
+        for i in range(100):
+            tracker.add(f'U@{ (i + 1) * 100 }')
+
+        self.assertEqual(len(tracker.moves), tracker.window)
+
+    def test_matches_full_transform(self):
+        generator = random.Random(42)
+
+        for orientation in ('', 'z2'):
+            orientation_algo = parse_moves(orientation)
+
+            for _ in range(50):
+                tracker = GestureTracker(orientation_algo)
+                timed_moves = []
+                timestamp = 0
+
+                for _ in range(15):
+                    timestamp += generator.choice([10, 30, 60, 200])
+                    timed_moves.append(
+                        generator.choice('RLUD')
+                        + generator.choice(['', "'"])
+                        + f'@{ timestamp }',
+                    )
+                    tracker.add(timed_moves[-1])
+
+                    self.assertEqual(
+                        tracker.gesture(),
+                        full_gesture(orientation_algo, timed_moves),
+                    )
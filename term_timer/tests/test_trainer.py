@@ -23,7 +23,7 @@ class TestTrainerModule(unittest.TestCase):
                 'hardware_received_event',
                 'console',
                 'cube_orientation',
-                'save_moves',
+                'gesture_tracker',
                 'save_gesture',
                 'save_gesture_event',
                 'countdown',
@@ -31,6 +31,7 @@ class TestTrainerModule(unittest.TestCase):
                 'scramble',
                 'scrambled',
                 'scramble_oriented',
+                'scramble_tracker',
                 'counter',
                 'facelets_scrambled',
                 'scramble_completed_event',
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Callable
+
+from term_timer.constants import SECOND
+
+logger = logging.getLogger(__name__)
+
+
+class Cadence:
+    """
+    Callback fired on absolute deadlines `origin + offset + n * interval`.
+
+    Deadlines never depend on when the previous tick actually ran,
+    so lateness does not accumulate, and ticks missed under load
+    are skipped instead of being fired in a burst.
+    """
+
+    def __init__(self, name: str, loop: asyncio.AbstractEventLoop,
+                 origin: float, interval: float,
+                 callback: Callable[[], None],
+                 *, offset: float = 0.0, count: int | None = None):
+        self.name = name
+        self.loop = loop
+        self.origin = origin + offset
+        self.interval = interval
+        self.callback = callback
+        self.count = count
+
+        self.index = 0
+        self.handle: asyncio.TimerHandle | None = None
+
+        self.ticks = 0
+        self.jitter_total = 0.0
+        self.jitter_max = 0.0
+
+    @property
+    def deadline(self) -> float:
+        return self.origin + self.index * self.interval
+
+    def schedule(self) -> None:
+        if self.count is not None and self.index >= self.count:
+            self.handle = None
+            return
+
+        self.handle = self.loop.call_at(self.deadline, self.tick)
+
+    def tick(self) -> None:
+        now = self.loop.time()
+        jitter = now - self.deadline
+
+        self.ticks += 1
+        self.jitter_total += jitter
+        self.jitter_max = max(self.jitter_max, jitter)
+
+        self.callback()
+
+        self.index = max(
+            self.index + 1,
+            math.floor((now - self.origin) / self.interval) + 1,
+        )
+        self.schedule()
+
+    def cancel(self) -> None:
+        if self.handle:
+            self.handle.cancel()
+            self.handle = None
+
+    @property
+    def jitter(self) -> dict[str, float]:
+        """Lateness of the ticks against their deadlines, in ms."""
+        return {
+            'ticks': self.ticks,
+            'mean': self.ticks and self.jitter_total / self.ticks * 1_000,
+            'max': self.jitter_max * 1_000,
+        }
+
+
+class Ticker:
+    """
+    Group of cadences sharing the same time origin,
+    expressed as a `perf_counter_ns` value.
+    """
+
+    def __init__(self, start_time: int | None = None):
+        self.loop = asyncio.get_running_loop()
+
+        now = time.perf_counter_ns()
+        self.start_time = start_time or now
+        self.origin = self.loop.time() - (now - self.start_time) / SECOND
+
+        self.cadences: list[Cadence] = []
+
+    def every(self, name: str, interval: float,
+              callback: Callable[[], None],
+              *, offset: float = 0.0,
+              count: int | None = None) -> Cadence:
+        cadence = Cadence(
+            name, self.loop, self.origin,
+            interval, callback,
+            offset=offset, count=count,
+        )
+        cadence.schedule()
+
+        self.cadences.append(cadence)
+
+        return cadence
+
+    def stop(self) -> dict[str, dict[str, float]]:
+        jitters = {}
+
+        for cadence in self.cadences:
+            cadence.cancel()
+            jitters[cadence.name] = cadence.jitter
+
+            if cadence.ticks:
+                logger.info(
+                    'Ticks %s: %d, jitter mean %.2fms, max %.2fms',
+                    cadence.name, cadence.ticks,
+                    jitters[cadence.name]['mean'],
+                    jitters[cadence.name]['max'],
+                )
+
+        return jitters
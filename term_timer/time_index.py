@@ -0,0 +1,92 @@
+import sys
+from bisect import bisect_left
+from bisect import insort
+
+from term_timer.solve import Solve
+
+DNF_KEY = sys.maxsize
+
+
+def time_key(final_time: int) -> int:
+    """Sort key of a final time, DNFs after every time."""
+    return final_time or DNF_KEY
+
+
+class TimeIndex:
+    """
+    Solves of a session ordered by final time,
+    for O(log n) rank, percentile and faster/slower lookups.
+
+    Solves are identified by their date, unique in a session,
+    so flag edits and deletions update the index in place
+    instead of sorting the session again.
+    """
+
+    def __init__(self, solves: list[Solve]):
+        self.dates = [solve.date for solve in solves]
+        self.entries = sorted(
+            (time_key(solve.final_time), solve.date)
+            for solve in solves
+        )
+        self.chronological = all(
+            previous < date
+            for previous, date in zip(self.dates, self.dates[1:], strict=False)
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def position(self, date: int) -> int:
+        """Index of the solve in the session, its ID minus one."""
+        if self.chronological:
+            return bisect_left(self.dates, date)
+
+        return self.dates.index(date)
+
+    def locate(self, solve: Solve) -> int:
+        return bisect_left(
+            self.entries,
+            (time_key(solve.final_time), solve.date),
+        )
+
+    def rank(self, solve: Solve) -> int:
+        """Rank of the solve, ties sharing the best rank."""
+        return bisect_left(self.entries, (time_key(solve.final_time),)) + 1
+
+    def percentile(self, solve: Solve) -> float:
+        """Percentage of the solves slower than this one."""
+        slower = len(self.entries) - bisect_left(
+            self.entries, (time_key(solve.final_time) + 1,),
+        )
+
+        return slower / len(self.entries) * 100
+
+    def neighbour(self, solve: Solve, step: int) -> int | None:
+        index = self.locate(solve) + step
+
+        if not 0 <= index < len(self.entries):
+            return None
+
+        return self.position(self.entries[index][1]) + 1
+
+    def faster(self, solve: Solve) -> int | None:
+        """ID of the solve just faster than this one."""
+        return self.neighbour(solve, -1)
+
+    def slower(self, solve: Solve) -> int | None:
+        """ID of the solve just slower than this one."""
+        return self.neighbour(solve, 1)
+
+    def update(self, solve: Solve, previous_time: int) -> None:
+        """Move a solve whose final time was `previous_time`."""
+        index = bisect_left(
+            self.entries,
+            (time_key(previous_time), solve.date),
+        )
+        del self.entries[index]
+
+        insort(self.entries, (time_key(solve.final_time), solve.date))
+
+    def remove(self, solve: Solve) -> None:
+        del self.entries[self.locate(solve)]
+        del self.dates[self.position(solve.date)]
@@ -0,0 +1,244 @@
+from collections import deque
+from functools import cache
+from itertools import product
+from operator import itemgetter
+
+from cubing_algs.algorithm import Algorithm
+from cubing_algs.constants import RESLICE_MOVES
+from cubing_algs.move import Move
+from cubing_algs.parsing import parse_moves
+from cubing_algs.transform.degrip import degrip_full_moves
+from cubing_algs.transform.size import compress_moves
+
+from term_timer.constants import RESLICE_THRESHOLD
+from term_timer.cube_state import CubeState
+
+ROTATIONS = [
+    f'{ axis }{ modifier }'
+    for axis in 'xyz'
+    for modifier in ('', "'", '2')
+]
+
+CENTERS = itemgetter(4, 13, 22, 31, 40, 49)
+
+
+def orientation_key(rotations: tuple[str, ...]) -> tuple[str, ...]:
+    cube = CubeState()
+    for rotation in rotations:
+        cube.rotate(rotation)
+
+    return CENTERS(cube.state)
+
+
+@cache
+def orientation_grips() -> dict[tuple[str, ...], tuple[Move, ...]]:
+    """
+    Shortest rotation sequence for each of the 24 orientations,
+    keyed by the positions of the centers.
+    """
+    grips: dict[tuple[str, ...], tuple[Move, ...]] = {}
+
+    sequences = [
+        (),
+        *[(rotation,) for rotation in ROTATIONS],
+        *product(ROTATIONS, repeat=2),
+    ]
+    for sequence in sequences:
+        grips.setdefault(
+            orientation_key(sequence),
+            tuple(Move(rotation) for rotation in sequence),
+        )
+
+    return grips
+
+
+@cache
+def canonical_grip(rotations: tuple[str, ...]) -> tuple[Move, ...]:
+    return orientation_grips()[orientation_key(rotations)]
+
+
+@cache
+def degrip_move(grip: tuple[Move, ...], move: Move) -> Move:
+    if not grip:
+        return move
+
+    return degrip_full_moves([*grip, move])[0]
+
+
+class MovesTracker:
+    """
+    Incremental equivalent of reslicing, degripping, compressing
+    and reorienting a growing list of timed moves.
+
+    Each new move only touches the tail of the tracked moves,
+    so the cost per move is constant instead of linear
+    in the number of moves already done.
+    """
+
+    compress = True
+
+    def __init__(self, orientation: Algorithm | None = None,
+                 threshold: int = RESLICE_THRESHOLD):
+        self.threshold = threshold
+
+        self.moves: list[Move] | deque[Move] = []
+        self.grip = canonical_grip(
+            tuple(str(move) for move in orientation or []),
+        )
+
+        self.pending: Move | None = None
+        self.pending_undo: tuple[str, Move | None] | None = None
+
+    def add(self, timed_move: Move | str) -> int:
+        """
+        Track a new move and return the index of
+        the first tracked move that has changed.
+        """
+        move = parse_moves(str(timed_move))[0]
+        changed = len(self.moves)
+
+        if self.pending is not None:
+            sliced = RESLICE_MOVES.get(
+                f'{ self.pending.untimed } { move.untimed }',
+            )
+            if sliced and self.in_threshold(self.pending, move):
+                changed = self.undo(self.pending_undo)
+                self.pending = None
+                self.pending_undo = None
+
+                for slice_move in sliced:
+                    _, index = self.push(Move(slice_move))
+                    changed = min(changed, index)
+
+                return changed
+
+        self.pending = move
+        self.pending_undo, index = self.push(move)
+
+        return min(changed, index)
+
+    def in_threshold(self, previous: Move, move: Move) -> bool:
+        return not (
+            self.threshold
+            and previous.timed
+            and move.timed
+            and move.timed - previous.timed > self.threshold
+        )
+
+    def push(self, move: Move) -> tuple[tuple[str, Move | None] | None, int]:
+        move = move.untimed
+
+        if move.is_rotation_move:
+            self.grip = canonical_grip(
+                tuple(str(rotation) for rotation in (*self.grip, move)),
+            )
+            return None, len(self.moves)
+
+        move = degrip_move(self.grip, move)
+
+        if self.compress and self.moves:
+            top = self.moves[-1]
+            compressed = compress_moves([top, move])
+
+            if len(compressed) < 2:
+                index = len(self.moves) - 1
+                if compressed:
+                    self.moves[-1] = compressed[0]
+                    return ('replace', top), index
+
+                self.moves.pop()
+                return ('pop', top), index
+
+        self.moves.append(move)
+
+        return ('append', None), len(self.moves) - 1
+
+    def undo(self, record: tuple[str, Move | None] | None) -> int:
+        if record is None:
+            return len(self.moves)
+
+        action, top = record
+
+        if action == 'append':
+            self.moves.pop()
+            return len(self.moves)
+
+        if action == 'replace':
+            self.moves[-1] = top
+        else:
+            self.moves.append(top)
+
+        return len(self.moves) - 1
+
+
+class ScrambleTracker(MovesTracker):
+    """
+    Track the moves done while scrambling
+    and how far they match the expected scramble.
+    """
+
+    def __init__(self, scramble: Algorithm,
+                 orientation: Algorithm | None = None,
+                 threshold: int = RESLICE_THRESHOLD):
+        super().__init__(orientation, threshold)
+
+        self.scramble = scramble
+        self.matched = 0
+
+    def add(self, timed_move: Move | str) -> int:
+        changed = super().add(timed_move)
+
+        self.matched = min(self.matched, changed)
+        limit = min(len(self.moves), len(self.scramble))
+
+        while (
+                self.matched < limit
+                and self.moves[self.matched] == self.scramble[self.matched]
+        ):
+            self.matched += 1
+
+        return changed
+
+    def style(self, index: int) -> str:
+        if index < self.matched:
+            return 'move'
+
+        if (
+                index < len(self.scramble)
+                and self.scramble[index][0] == self.moves[index][0]
+        ):
+            return 'caution'
+
+        return 'warning'
+
+
+class GestureTracker(MovesTracker):
+    """
+    Track only the tail of the moves needed to recognize a gesture,
+    two consecutive turns of the same layer.
+
+    The reslice threshold only pairs a move with the previous one,
+    so a window of three moves is enough to undo the pending move
+    and still keep the two last moves.
+    """
+    compress = False
+
+    window = 3
+
+    def __init__(self, orientation: Algorithm | None = None,
+                 threshold: int = RESLICE_THRESHOLD):
+        super().__init__(orientation, threshold)
+
+        self.moves = deque(maxlen=self.window)
+
+    def gesture(self) -> str:
+        if len(self.moves) < 2:
+            return ''
+
+        l_move = self.moves[-1]
+        a_move = self.moves[-2]
+
+        if l_move.base_move != a_move.base_move or l_move == a_move:
+            return ''
+
+        return l_move.base_move
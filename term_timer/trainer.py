@@ -2,7 +2,6 @@ from term_timer.constants import DNF
 from term_timer.constants import MS_TO_NS_FACTOR
 from term_timer.formatter import format_time
 from term_timer.interface import SolveInterface
-from term_timer.methods.base import FaceletAnalyser
 from term_timer.scrambler import scramble_moves
 from term_timer.scrambler import trainer
 from term_timer.solve import Solve
@@ -65,10 +64,7 @@ class Trainer(SolveInterface):
             )
 
     def cube_is_solved(self):
-        return FaceletAnalyser().check_step(
-            self.step_code,
-            self.bluetooth_cube.state,
-        )
+        return self.bluetooth_cube.is_step_solved(self.step_code)
 
     def solve_line(self, solve: Solve) -> None:
         self.clear_line(full=True)